@@ -3,7 +3,7 @@ import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import threading
 import time
 import json  # API 상태 확인에 필요
@@ -21,6 +21,10 @@ from ui_components import setup_logging, LogTextHandler
 class NewspickCollectorApp(tk.Tk):
     """뉴스픽 데이터 수집 프로그램 메인 클래스"""
 
+    # 데이터베이스 자동 백업 - 시작 후 첫 백업까지 대기(분)와 이후 백업 간격(시간)
+    BACKUP_START_DELAY_MINUTES = 5
+    BACKUP_INTERVAL_HOURS = 24
+
     def __init__(self):
         super().__init__()
         
@@ -61,6 +65,13 @@ class NewspickCollectorApp(tk.Tk):
         self.unified_scheduler_thread = threading.Thread(target=self._unified_scheduler_loop, daemon=True)
         self.unified_scheduler_thread.start()
         
+        # 데이터베이스 자동 백업 예약 (백업 스레드에서 단계별로 실행, 동시에 하나만)
+        self.add_scheduled_task(
+            "database_backup",
+            datetime.now() + timedelta(minutes=self.BACKUP_START_DELAY_MINUTES),
+            self.run_scheduled_backup
+        )
+        
         # 기본 UI 구성요소 생성 (탭 포함)
         self.create_main_frame()
         
@@ -173,6 +184,20 @@ class NewspickCollectorApp(tk.Tk):
         self.scheduled_tasks.append((module_name, next_run_time, task_func))
         self.logger.info(f"{module_name} 작업이 {next_run_time.strftime('%H:%M:%S')}에 실행되도록 예약됨")
 
+    def run_scheduled_backup(self):
+        """예약된 데이터베이스 백업 시작 후 다음 백업 예약 (이미 백업 중이면 이번 회차는 건너뜀)"""
+        try:
+            self.db_manager.start_background_backup()
+        except Exception as e:
+            self.logger.error(f"예약 백업 실행 중 오류: {e}")
+        finally:
+            if self.scheduler_running:
+                self.add_scheduled_task(
+                    "database_backup",
+                    datetime.now() + timedelta(hours=self.BACKUP_INTERVAL_HOURS),
+                    self.run_scheduled_backup
+                )
+
     def remove_scheduled_tasks(self, module_name):
         """모듈 관련 예약 작업 제거"""
         self.scheduled_tasks = [task for task in self.scheduled_tasks if task[0] != module_name]
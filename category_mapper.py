@@ -3,6 +3,7 @@ import os
 import re
 import logging
 import json
+import threading
 from urllib.parse import urlparse, parse_qs
 
 class CategoryMapper:
@@ -17,6 +18,7 @@ class CategoryMapper:
         """
         self.base_path = base_path
         self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()  # 병렬 수집 시 매핑 파일 동시 쓰기 방지
         
         # 카테고리 매핑 파일 경로
         self.mapping_file = os.path.join(self.base_path, "data", "DB", "category_mapping.json")
@@ -138,9 +140,11 @@ class CategoryMapper:
             # 디렉토리 생성
             os.makedirs(os.path.dirname(self.mapping_file), exist_ok=True)
             
-            # 매핑 정보 저장
-            with open(self.mapping_file, 'w', encoding='utf-8') as f:
-                json.dump(mapping, f, ensure_ascii=False, indent=2)
+            # 매핑 정보 저장 (다른 스레드가 수정 중일 수 있으므로 복사본 기록)
+            with self.lock:
+                mapping = dict(mapping)
+                with open(self.mapping_file, 'w', encoding='utf-8') as f:
+                    json.dump(mapping, f, ensure_ascii=False, indent=2)
             
             self.logger.info(f"카테고리 매핑 정보 {len(mapping)} 개 저장 완료")
             return True
@@ -0,0 +1,305 @@
+# cdp_network.py
+import json
+import time
+import base64
+import logging
+import threading
+from collections import OrderedDict
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class CdpNetworkCapture:
+    """
+    Chrome DevTools 프로토콜로 페이지의 네트워크 이벤트 수신
+
+    --remote-debugging-port로 띄운 Chromium의 페이지에 WebSocket으로 직접 연결해
+    Network 이벤트를 받습니다. 페이지 스크립트를 덮어쓰지 않고 단축 링크 응답을 받는 즉시
+    대기 중인 호출을 깨우며, 이미지 본문은 WebDriver를 거치지 않고 DevTools 버퍼에서 바로 읽습니다.
+    WebSocket 연결에는 websocket-client 패키지가 필요합니다 (없으면 start()가 False 반환).
+    """
+
+    # 단축 링크 요청으로 판단할 URL 키워드 (기존 헤드리스 스크립트와 동일)
+    SHORT_URL_KEYWORDS = ("short", "copy")
+    # 본문을 읽을 수 있도록 최근 이미지 요청만 기억
+    MAX_TRACKED_IMAGES = 300
+    # DevTools 응답 버퍼 크기
+    MAX_TOTAL_BUFFER = 64 * 1024 * 1024
+    MAX_RESOURCE_BUFFER = 16 * 1024 * 1024
+    COMMAND_TIMEOUT = 10
+
+    def __init__(self, port, target_url=None):
+        """
+        Args:
+            port (int): Chromium 원격 디버깅 포트
+            target_url (str, optional): 연결할 탭의 현재 URL (여러 탭이 있을 때 구분용)
+        """
+        self.port = port
+        self.target_url = target_url
+        self.ws = None
+        self.reader_thread = None
+        self.closed = threading.Event()
+
+        self.send_lock = threading.Lock()
+        self.next_id = 0
+        self.pending = {}  # 명령 id -> [Event, 응답]
+
+        self.short_requests = set()  # 단축 링크 응답을 기다리는 requestId
+        self.short_links = []  # 받은 단축 링크 (수신 순서)
+        self.short_link_ready = threading.Condition()
+
+        self.images = OrderedDict()  # 이미지 URL -> requestId (로딩 완료된 것만)
+        self.image_requests = {}  # requestId -> 이미지 URL (로딩 중)
+
+        self.blocked_patterns = []  # 현재 적용된 차단 URL 패턴
+        self.traffic = {"requests": 0, "bytes": 0, "blocked": 0}  # reset_traffic 이후 네트워크 사용량
+
+    def start(self):
+        """
+        DevTools 연결 및 Network 이벤트 구독
+
+        Returns:
+            bool: 연결 성공 여부
+        """
+        try:
+            import websocket
+        except ImportError:
+            logger.warning("websocket-client 패키지가 없어 DevTools 네트워크 수신을 사용하지 않습니다.")
+            return False
+
+        try:
+            targets = requests.get(f"http://127.0.0.1:{self.port}/json", timeout=3).json()
+            pages = [t for t in targets if t.get("type") == "page" and t.get("webSocketDebuggerUrl")]
+            if not pages:
+                logger.warning(f"DevTools 연결할 페이지가 없습니다 (포트: {self.port})")
+                return False
+
+            target = next((t for t in pages if self.target_url and t.get("url") == self.target_url), pages[0])
+
+            # Chromium은 Origin 헤더가 있는 연결을 거부하므로 생략
+            self.ws = websocket.create_connection(target["webSocketDebuggerUrl"], suppress_origin=True)
+
+            self.reader_thread = threading.Thread(target=self._read_loop, name=f"CdpReader-{self.port}", daemon=True)
+            self.reader_thread.start()
+
+            result = self.send("Network.enable", {
+                "maxTotalBufferSize": self.MAX_TOTAL_BUFFER,
+                "maxResourceBufferSize": self.MAX_RESOURCE_BUFFER,
+            })
+            if result is None:
+                self.close()
+                return False
+
+            logger.info(f"DevTools 네트워크 수신 시작 (포트: {self.port})")
+            return True
+
+        except Exception as e:
+            logger.warning(f"DevTools 연결 실패 (포트: {self.port}): {e}")
+            self.close()
+            return False
+
+    def is_alive(self):
+        """연결 유지 여부"""
+        return self.ws is not None and not self.closed.is_set()
+
+    def close(self):
+        """DevTools 연결 종료"""
+        self.closed.set()
+        if self.ws is not None:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+
+        # 응답을 기다리는 명령과 단축 링크 대기 해제
+        for waiter in list(self.pending.values()):
+            waiter[0].set()
+        with self.short_link_ready:
+            self.short_link_ready.notify_all()
+
+    def send(self, method, params=None, timeout=None):
+        """
+        DevTools 명령 전송 후 응답 대기
+
+        Returns:
+            dict: 명령 결과 (실패 또는 시간 초과 시 None)
+        """
+        if not self.is_alive():
+            return None
+
+        waiter = [threading.Event(), None]
+        with self.send_lock:
+            self.next_id += 1
+            command_id = self.next_id
+            self.pending[command_id] = waiter
+            try:
+                self.ws.send(json.dumps({"id": command_id, "method": method, "params": params or {}}))
+            except Exception as e:
+                self.pending.pop(command_id, None)
+                logger.warning(f"DevTools 명령 전송 실패 ({method}): {e}")
+                self.close()
+                return None
+
+        waiter[0].wait(timeout or self.COMMAND_TIMEOUT)
+        self.pending.pop(command_id, None)
+
+        response = waiter[1]
+        if not response or "error" in response:
+            if response:
+                logger.debug(f"DevTools 명령 오류 ({method}): {response['error']}")
+            return None
+        return response.get("result", {})
+
+    def _read_loop(self):
+        """DevTools 메시지 수신 (명령 응답 전달 및 Network 이벤트 처리)"""
+        while not self.closed.is_set():
+            try:
+                message = json.loads(self.ws.recv())
+            except Exception as e:
+                if not self.closed.is_set():
+                    logger.warning(f"DevTools 연결이 끊어졌습니다 (포트: {self.port}): {e}")
+                break
+
+            if "id" in message:
+                waiter = self.pending.get(message["id"])
+                if waiter:
+                    waiter[1] = message
+                    waiter[0].set()
+                continue
+
+            try:
+                self._handle_event(message.get("method"), message.get("params") or {})
+            except Exception as e:
+                logger.debug(f"DevTools 이벤트 처리 중 오류: {e}")
+
+        self.close()
+
+    def _handle_event(self, method, params):
+        """Network 이벤트 처리 - 단축 링크 응답과 이미지 요청 추적"""
+        if method == "Network.responseReceived":
+            request_id = params["requestId"]
+            response = params.get("response", {})
+            url = response.get("url", "")
+
+            if any(keyword in url for keyword in self.SHORT_URL_KEYWORDS) and params.get("type") in ("XHR", "Fetch"):
+                self.short_requests.add(request_id)
+            elif params.get("type") == "Image" or response.get("mimeType", "").startswith("image/"):
+                self.image_requests[request_id] = url
+
+        elif method == "Network.loadingFinished":
+            request_id = params["requestId"]
+            self.traffic["requests"] += 1
+            self.traffic["bytes"] += int(params.get("encodedDataLength") or 0)
+
+            if request_id in self.short_requests:
+                self.short_requests.discard(request_id)
+                # 응답 본문 요청은 수신 스레드를 막지 않도록 별도 스레드에서 처리
+                threading.Thread(target=self._read_short_link, args=(request_id,), daemon=True).start()
+
+            elif request_id in self.image_requests:
+                url = self.image_requests.pop(request_id)
+                self.images[url] = request_id
+                self.images.move_to_end(url)
+                while len(self.images) > self.MAX_TRACKED_IMAGES:
+                    self.images.popitem(last=False)
+
+        elif method == "Network.loadingFailed":
+            if params.get("blockedReason"):
+                self.traffic["blocked"] += 1
+            self.short_requests.discard(params.get("requestId"))
+            self.image_requests.pop(params.get("requestId"), None)
+
+    def _read_short_link(self, request_id):
+        """단축 링크 응답 본문에서 링크를 꺼내 대기 중인 호출에 전달"""
+        result = self.send("Network.getResponseBody", {"requestId": request_id})
+        if not result:
+            return
+
+        try:
+            body = result.get("body", "")
+            if result.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8", errors="replace")
+            short_url = ((json.loads(body) or {}).get("result") or {}).get("shortUrl")
+        except (ValueError, AttributeError):
+            return
+
+        if short_url:
+            with self.short_link_ready:
+                self.short_links.append(short_url)
+                self.short_link_ready.notify_all()
+
+    def clear_short_links(self):
+        """이전에 받은 단축 링크 비우기 (버튼 클릭 직전에 호출)"""
+        with self.short_link_ready:
+            self.short_links.clear()
+
+    def wait_for_short_link(self, timeout=5):
+        """
+        단축 링크 응답이 도착할 때까지 대기
+
+        Returns:
+            str: 단축 링크 (시간 초과 시 None)
+        """
+        deadline = time.time() + timeout
+        with self.short_link_ready:
+            while not self.short_links:
+                remaining = deadline - time.time()
+                if remaining <= 0 or self.closed.is_set():
+                    return None
+                self.short_link_ready.wait(remaining)
+            return self.short_links.pop(0)
+
+    def set_blocked_urls(self, patterns):
+        """
+        요청을 보내지 않을 URL 패턴 적용 (Network.setBlockedURLs, 이전과 같으면 전송하지 않음)
+
+        Returns:
+            bool: 적용 여부
+        """
+        patterns = list(patterns)
+        if patterns == self.blocked_patterns:
+            return True
+        if self.send("Network.setBlockedURLs", {"urls": patterns}) is None:
+            return False
+        self.blocked_patterns = patterns
+        return True
+
+    def set_cache_disabled(self, disabled):
+        """브라우저 캐시 사용 여부 변경 (측정 시 두 번째 로드가 캐시 덕을 보지 않도록)"""
+        return self.send("Network.setCacheDisabled", {"cacheDisabled": bool(disabled)}) is not None
+
+    def reset_traffic(self):
+        """네트워크 사용량 집계 초기화 (측정할 페이지를 열기 직전에 호출)"""
+        self.traffic = {"requests": 0, "bytes": 0, "blocked": 0}
+
+    def get_traffic(self):
+        """
+        reset_traffic 이후 네트워크 사용량
+
+        Returns:
+            dict: requests(완료된 요청 수), bytes(전송량), blocked(차단된 요청 수)
+        """
+        return dict(self.traffic)
+
+    def get_image(self, url):
+        """
+        페이지가 이미 받은 이미지 본문 반환 (DevTools 버퍼에서 읽음)
+
+        Returns:
+            bytes: 이미지 데이터 (받은 적이 없거나 버퍼에서 밀려났거나 텍스트 본문이면 None)
+        """
+        request_id = self.images.get(url)
+        if not request_id:
+            return None
+
+        result = self.send("Network.getResponseBody", {"requestId": request_id})
+        if not result:
+            return None
+
+        # 텍스트 본문(SVG 등)은 브라우저가 이미 문자로 디코딩해 원본 바이트를 복원할 수 없으므로
+        # None을 반환해 HTTP 다운로드로 받게 함
+        if not result.get("base64Encoded"):
+            return None
+        return base64.b64decode(result.get("body", ""))
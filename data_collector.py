@@ -7,15 +7,26 @@ from datetime import datetime, timedelta
 import time
 import schedule
 import json
+from itertools import chain
 
 from newspick_collector import NewspickCollector
+from resource_blocker import ResourceBlocker
 from ui_components import LogTextHandler, validate_numeric_input
 from summary_integration import SummaryProcessor
+from data_exporter import DataExporter
 
 class DataCollectorUI:
 
     THREADS_LOCK_FILE = "threads_running.lock"
     DATA_COLLECTOR_LOCK_FILE = "collector_running.lock"
+    
+    # 데이터 탭 검색 - 최대 결과 수와 필터별 (플랫폼 ID, 게시 여부)
+    SEARCH_RESULT_LIMIT = 500
+    SEARCH_FILTERS = {
+        "전체": None,
+        "Threads 미게시": ("threads", False),
+        "Threads 게시 완료": ("threads", True),
+    }
 
     def check_threads_running(self):
         """Threads 작업이 실행 중인지 확인 - 브라우저 관리 개선으로 충돌 걱정 없음"""
@@ -65,6 +76,9 @@ class DataCollectorUI:
         self.logger = parent.logger
         self.main_frame = parent.data_tab
         
+        # 트리뷰 항목 ID -> 뉴스 ID (행 번호로 전체 목록을 다시 조회하지 않도록 보관)
+        self.tree_news_ids = {}
+        
         # 로그 텍스트 위젯은 로그 섹션을 제거해도, 로깅 기능을 위해 임시 텍스트 위젯 생성
         self.collect_log_text = tk.Text(self.main_frame)
         self.collect_log_text.pack_forget()  # UI에는 표시하지 않음
@@ -193,16 +207,16 @@ class DataCollectorUI:
                 messagebox.showerror("오류", "Perplexity API 키가 설정되지 않았습니다. API 관리 탭에서 API 키를 설정해주세요.")
                 return
                 
-            # 처리할 데이터 가져오기
-            news_items = self.db_manager.get_news_items()
-            
-            if not news_items:
-                messagebox.showinfo("알림", "처리할 데이터가 없습니다.")
-                return
-                
-            # 요약이 없는 항목 수 확인
-            items_without_summary = [item for item in news_items 
-                                    if not item.get("500자 요약") or len(item.get("500자 요약", "").strip()) == 0]
+            # 요약이 없는 항목만 페이지 단위로 조회 (요약 작업에 필요한 필드만 보관)
+            items_without_summary = []
+            for page in self.db_manager.iter_news_pages(missing_summary=True):
+                for item in page:
+                    items_without_summary.append({
+                        "id": item.get("id"),
+                        "게시물 제목": item.get("게시물 제목", ""),
+                        "카테고리": item.get("카테고리", ""),
+                        "500자 요약": item.get("500자 요약") or ""
+                    })
             
             if not items_without_summary:
                 messagebox.showinfo("알림", "모든 항목이 이미 요약되어 있습니다.")
@@ -270,6 +284,9 @@ class DataCollectorUI:
             "wait_time": 3,
             "headless_mode": False,
             "max_items_per_url": 3,
+            "parallel_browsers": 1,
+            "resource_blocking_profile": "standard",
+            "measure_resource_blocking": False,
             # 메시지 옵션 관련 설정 제거
             # "custom_message_options": ["(아래 링크👇)", "(댓글 링크👇)", "(하단 링크👇)", "사용자 정의 입력"],
             # "last_used_message_option": 0,
@@ -302,6 +319,11 @@ class DataCollectorUI:
             self.settings["wait_time"] = int(self.wait_time_var.get())
             self.settings["headless_mode"] = self.headless_var.get()
             self.settings["max_items_per_url"] = int(self.max_items_var.get())
+            if hasattr(self, 'parallel_browsers_var'):
+                self.settings["parallel_browsers"] = int(self.parallel_browsers_var.get())
+            if hasattr(self, 'resource_blocking_var'):
+                self.settings["resource_blocking_profile"] = self.resource_blocking_var.get()
+                self.settings["measure_resource_blocking"] = self.measure_blocking_var.get()
             
             # 데이터 경로 설정
             self.settings["data_path"] = self.data_path_var.get()
@@ -326,6 +348,23 @@ class DataCollectorUI:
             self.logger.error(f"설정 저장 중 오류: {e}")
             return False
     
+    def get_parallel_browsers(self):
+        """동시 브라우저 수 설정값 (1 ~ NewspickCollector.MAX_PARALLEL_WORKERS)"""
+        try:
+            value = int(self.parallel_browsers_var.get())
+        except (AttributeError, ValueError):
+            value = 1
+        return max(1, min(value, NewspickCollector.MAX_PARALLEL_WORKERS))
+    
+    def apply_resource_blocking(self, collector):
+        """리소스 차단 프로필과 측정 모드 설정을 수집기에 적용"""
+        if not hasattr(self, 'resource_blocking_var'):
+            return
+        collector.resource_blocker.set_profile(
+            self.resource_blocking_var.get(),
+            measure=self.measure_blocking_var.get()
+        )
+    
     def create_widgets(self):
         """UI 위젯 생성"""
         # 1. 데이터 수집 URL 섹션 (수정된 함수 사용)
@@ -528,7 +567,7 @@ class DataCollectorUI:
         # 스크롤 횟수
         scroll_frame = ttk.Frame(left_options)
         scroll_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(scroll_frame, text="스크롤 횟수:").pack(side=tk.LEFT, padx=5)
+        ttk.Label(scroll_frame, text="최대 스크롤 횟수:").pack(side=tk.LEFT, padx=5)
         self.scroll_count_var = tk.StringVar(value=str(self.settings["scroll_count"]))
         # 숫자 검증 등록
         vcmd = (self.parent.register(validate_numeric_input), '%P')
@@ -574,6 +613,35 @@ class DataCollectorUI:
                                         validate="key", validatecommand=vcmd)
         self.max_items_spinbox.pack(side=tk.LEFT, padx=5)
 
+        # 동시 브라우저 수 (병렬 수집)
+        parallel_frame = ttk.Frame(right_options)
+        parallel_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(parallel_frame, text="동시 브라우저 수:").pack(side=tk.LEFT, padx=5)
+        self.parallel_browsers_var = tk.StringVar(value=str(self.settings["parallel_browsers"]))
+        self.parallel_browsers_spinbox = ttk.Spinbox(parallel_frame, from_=1, to=NewspickCollector.MAX_PARALLEL_WORKERS, width=5,
+                                        textvariable=self.parallel_browsers_var,
+                                        validate="key", validatecommand=vcmd)
+        self.parallel_browsers_spinbox.pack(side=tk.LEFT, padx=5)
+
+        # 리소스 차단 프로필 (광고/글꼴 등 수집에 필요 없는 리소스를 받지 않음)
+        blocking_frame = ttk.Frame(right_options)
+        blocking_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(blocking_frame, text="리소스 차단:").pack(side=tk.LEFT, padx=5)
+        self.resource_blocking_var = tk.StringVar(value=self.settings["resource_blocking_profile"])
+        ttk.Combobox(
+            blocking_frame,
+            textvariable=self.resource_blocking_var,
+            values=ResourceBlocker(self.base_path).profile_names(),
+            state="readonly",
+            width=10
+        ).pack(side=tk.LEFT, padx=5)
+        self.measure_blocking_var = tk.BooleanVar(value=self.settings["measure_resource_blocking"])
+        ttk.Checkbutton(
+            blocking_frame,
+            text="차단 효과 측정",
+            variable=self.measure_blocking_var
+        ).pack(side=tk.LEFT, padx=5)
+
         # 자동 요약 생성 체크박스
         auto_summary_frame = ttk.Frame(left_options)
         auto_summary_frame.pack(fill=tk.X, pady=2)
@@ -625,7 +693,7 @@ class DataCollectorUI:
         # 스크롤 횟수
         scroll_frame = ttk.Frame(left_options)
         scroll_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(scroll_frame, text="스크롤 횟수:").pack(side=tk.LEFT, padx=5)
+        ttk.Label(scroll_frame, text="최대 스크롤 횟수:").pack(side=tk.LEFT, padx=5)
         self.scroll_count_var = tk.StringVar(value=str(self.settings["scroll_count"]))
         # 숫자 검증 등록
         vcmd = (self.parent.register(validate_numeric_input), '%P')
@@ -843,6 +911,28 @@ class DataCollectorUI:
         preview_frame = ttk.LabelFrame(self.main_frame, text="데이터 미리보기")
         preview_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
+        # 검색 영역 (제목/500자 요약 전문 검색)
+        search_frame = ttk.Frame(preview_frame)
+        search_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+        
+        ttk.Label(search_frame, text="검색:").pack(side=tk.LEFT, padx=5)
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
+        search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind("<Return>", lambda event: self.load_data())
+        
+        self.search_filter_var = tk.StringVar(value="전체")
+        ttk.Combobox(
+            search_frame,
+            textvariable=self.search_filter_var,
+            values=("전체", "Threads 미게시", "Threads 게시 완료"),
+            state="readonly",
+            width=15
+        ).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(search_frame, text="검색", command=self.load_data).pack(side=tk.LEFT, padx=5)
+        ttk.Button(search_frame, text="검색 초기화", command=self.clear_search).pack(side=tk.LEFT, padx=5)
+        
         # 트리뷰 생성 및 설정
         tree_frame = ttk.Frame(preview_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -955,16 +1045,16 @@ class DataCollectorUI:
                 # 현재 500자 요약 값 가져오기
                 current_message = values[6]  # 인덱스 6은 500자 요약 열
                 
-                # 행 인덱스 (1부터 시작하므로 -1)
-                row_index = int(self.data_tree.item(item, "text")) - 1
+                # 트리뷰 항목에 연결된 뉴스 ID로 해당 행의 데이터 가져오기
+                news_id = self.tree_news_ids.get(item)
+                if news_id is None:
+                    return
                 
-                # 해당 행의 데이터 가져오기
-                news_items = self.db_manager.get_news_items()
-                if row_index >= len(news_items):
+                news_items = self.db_manager.get_news_items_by_ids([news_id])
+                if not news_items:
                     return
                     
-                news_item = news_items[row_index]
-                news_id = news_item.get("id")
+                news_item = news_items[0]
                 
                 # 편집 대화상자 생성
                 edit_dialog = tk.Toplevel(self.parent)
@@ -1603,7 +1693,8 @@ class DataCollectorUI:
                 headless=headless,
                 max_items=max_items,
                 custom_message="",  # 빈 문자열로 설정
-                selected_option=0   # 기본 옵션 인덱스
+                selected_option=0,  # 기본 옵션 인덱스
+                db_manager=self.db_manager  # 앱의 DB 매니저 공유 (실행마다 쓰기 스레드를 새로 만들지 않음)
             )
 
             # 자동 요약 설정
@@ -1619,6 +1710,8 @@ class DataCollectorUI:
 
             # 자동화 모드 플래그 설정
             collector.auto_mode = True
+            collector.parallel_workers = self.get_parallel_browsers()
+            self.apply_resource_blocking(collector)
             
             # 진행 상황 업데이트 함수
             def progress_callback(current, total, status_text, processed_items=0):
@@ -1730,12 +1823,15 @@ class DataCollectorUI:
             headless=headless,
             max_items=max_items,
             custom_message="",  # 빈 문자열로 변경
-            selected_option=0   # 의미 없는 값으로 변경
+            selected_option=0,  # 의미 없는 값으로 변경
+            db_manager=self.db_manager  # 앱의 DB 매니저 공유
         )
         
         # 명시적으로 collector의 should_stop 플래그를 False로 설정 (추가)
         collector.should_stop = False
         collector.auto_mode = False  # 수동 모드임을 명시
+        collector.parallel_workers = self.get_parallel_browsers()
+        self.apply_resource_blocking(collector)
         
         # 데이터 수집 중 표시
         self.set_collector_running(True)
@@ -1951,15 +2047,22 @@ class DataCollectorUI:
                         self.logger.debug(f"항목 {item} 삭제 중 무시된 오류: {item_e}")
                         continue
                                 
-            # DB에서 뉴스 항목 가져오기
-            news_items = self.db_manager.get_news_items()
+            self.tree_news_ids = {}
+            
+            # 검색어가 있으면 전문 검색 결과, 없으면 전체 항목을 페이지 단위로 가져와 트리뷰에 추가
+            search_query = self.search_var.get().strip() if hasattr(self, "search_var") else ""
+            if search_query:
+                news_items = self.db_manager.search_news(
+                    search_query,
+                    limit=self.SEARCH_RESULT_LIMIT,
+                    platform_filter=self.SEARCH_FILTERS.get(self.search_filter_var.get())
+                )
+            else:
+                news_items = chain.from_iterable(self.db_manager.iter_news_pages())
             
-            if not news_items:
-                self.logger.info("표시할 데이터가 없습니다.")
-                return
-                                
-            # 각 행을 트리뷰에 추가
+            loaded_count = 0
             for idx, item in enumerate(news_items):
+                loaded_count += 1
                 # 이미지 경로 존재 여부 확인
                 image_path = item.get("이미지 경로", "")
                 image_status = "O" if image_path and os.path.exists(image_path) else "X"
@@ -1967,33 +2070,27 @@ class DataCollectorUI:
                 # 포스팅 상태 및 시간 확인 - threads 플랫폼 상태 확인
                 posting_status = "미게시"
                 posting_time = ""
-                item_id = item.get("id")
                 
-                # DB에서 포스팅 상태 확인
+                # 목록 조회 시 함께 가져온 플랫폼별 상태 사용 (행마다 추가 쿼리 없음)
                 try:
-                    conn = self.db_manager.get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        """
-                        SELECT status, post_date FROM posting_status 
-                        WHERE news_id = ? AND platform_id = 'threads'
-                        """,
-                        (item_id,)
-                    )
-                    result = cursor.fetchone()
-                    if result:
-                        if '포스팅 완료' in result[0]:
+                    threads_status = item.get("플랫폼_상태", {}).get("threads")
+                    if threads_status:
+                        if threads_status["state"] == self.db_manager.POST_STATE_POSTED:
                             posting_status = "완료"
+                        elif threads_status["state"] == self.db_manager.POST_STATE_IN_PROGRESS:
+                            posting_status = "게시 중"
+                        elif threads_status["state"] == self.db_manager.POST_STATE_FAILED:
+                            posting_status = "실패"
                         # 포스팅 시간 처리 - 전체 날짜 시간 표시로 변경
-                        if result[1]:  # post_date가 있는 경우
-                            posting_time = result[1]  # 원본 날짜시간 그대로 사용
+                        if threads_status["post_date"]:  # post_date가 있는 경우
+                            posting_time = threads_status["post_date"]  # 원본 날짜시간 그대로 사용
                             
                 except Exception as e:
                     self.logger.error(f"포스팅 상태 확인 중 오류: {e}")
                 
                 # 트리뷰에 데이터 추가 (선택 열을 추가)
                 try:
-                    self.data_tree.insert("", tk.END, text=str(idx+1), 
+                    tree_item = self.data_tree.insert("", tk.END, text=str(idx+1), 
                                     values=("", # 선택 열 추가 
                                             item.get("카테고리", ""), 
                                             item.get("게시물 제목", ""), 
@@ -2009,15 +2106,20 @@ class DataCollectorUI:
                                             item.get("thread4", ""),
                                             item.get("thread5", ""),
                                             item.get("created_status", "")))
+                    self.tree_news_ids[tree_item] = item.get("id")
                 except Exception as insert_e:
                     self.logger.warning(f"항목 추가 중 오류 (행 {idx+1}): {insert_e}")
                     # 계속 진행
+            
+            if not loaded_count:
+                self.logger.info("표시할 데이터가 없습니다.")
+                return
                                 
-            self.logger.info(f"데이터베이스에서 {len(news_items)}개 항목을 로드했습니다.")
+            self.logger.info(f"데이터베이스에서 {loaded_count}개 항목을 로드했습니다.")
             
             # 로그에 데이터 새로고침 기록
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.collect_log_text.insert(tk.END, f"[{timestamp}] 데이터 새로고침 완료: {len(news_items)}개 항목\n")
+            self.collect_log_text.insert(tk.END, f"[{timestamp}] 데이터 새로고침 완료: {loaded_count}개 항목\n")
             self.collect_log_text.see(tk.END)
             
         except Exception as e:
@@ -2030,6 +2132,12 @@ class DataCollectorUI:
             self.collect_log_text.insert(tk.END, f"[{timestamp}] 데이터 로드 중 오류: {str(e)}\n")
             self.collect_log_text.see(tk.END)
 
+    def clear_search(self):
+        """검색어를 지우고 전체 데이터 다시 표시"""
+        self.search_var.set("")
+        self.search_filter_var.set("전체")
+        self.load_data()
+
     def save_column_widths(self):
         """트리뷰 열 너비 설정 저장"""
         column_widths = {}
@@ -2316,8 +2424,9 @@ class DataCollectorUI:
         for item in self.data_tree.get_children():
             values = self.data_tree.item(item, "values")
             if values and values[0] == '✓':  # 체크된 항목
-                index = int(self.data_tree.item(item, "text")) - 1  # 인덱스는 1부터 시작하므로 -1
-                selected_items.append((item, index))
+                news_id = self.tree_news_ids.get(item)
+                if news_id is not None:
+                    selected_items.append((item, news_id))
         
         if not selected_items:
             messagebox.showinfo("알림", "삭제할 항목을 선택해주세요.")
@@ -2328,21 +2437,22 @@ class DataCollectorUI:
             return
         
         try:
-            # 선택된 항목들의 ID 가져오기
-            news_items = self.db_manager.get_news_items()
+            # 선택된 항목들의 데이터만 ID로 가져오기
+            news_items = self.db_manager.get_news_items_by_ids(
+                [news_id for _, news_id in selected_items]
+            )
             
             deleted_count = 0
             titles_to_remove = []  # 삭제할 제목 목록
             
-            for tree_item, index in selected_items:
-                if 0 <= index < len(news_items):
-                    news_id = news_items[index].get("id")
-                    title = news_items[index].get("게시물 제목", "")
-                    titles_to_remove.append(self.normalize_title(title))
-                    
-                    # DB에서 항목 삭제
-                    if self.db_manager.delete_news_item(news_id):
-                        deleted_count += 1
+            for news_item in news_items:
+                news_id = news_item.get("id")
+                title = news_item.get("게시물 제목", "")
+                titles_to_remove.append(self.normalize_title(title))
+                
+                # DB에서 항목 삭제
+                if self.db_manager.delete_news_item(news_id):
+                    deleted_count += 1
             
             # 삭제된 제목을 중복 캐시에서도 제거
             for title in titles_to_remove:
@@ -2370,35 +2480,63 @@ class DataCollectorUI:
             self.collect_log_text.see(tk.END)
     
     def export_data(self):
-        """수집된 데이터를 엑셀 파일로 내보내기"""
+        """수집된 데이터를 파일로 내보내기 (CSV/JSONL/Parquet/엑셀, 별도 스레드에서 실행)"""
         try:
-            # 데이터프레임으로 변환
-            df = self.db_manager.export_to_dataframe()
-            
-            if df.empty:
+            if self.db_manager.count_news_items() == 0:
                 messagebox.showwarning("경고", "내보낼 데이터가 없습니다.")
                 return
                 
             # 저장 대화상자 표시
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".xlsx",
-                filetypes=[("Excel 파일", "*.xlsx"), ("모든 파일", "*.*")],
+                filetypes=[
+                    ("Excel 파일", "*.xlsx"),
+                    ("CSV 파일", "*.csv"),
+                    ("JSON Lines 파일", "*.jsonl"),
+                    ("Parquet 파일", "*.parquet"),
+                    ("모든 파일", "*.*")
+                ],
                 initialdir=self.settings["data_path"],
                 title="데이터 내보내기"
             )
             
             if not file_path:
                 return  # 사용자가 취소한 경우
-                
-            # 엑셀 파일로 저장
-            df.to_excel(file_path, index=False)
             
-            # 로그 기록
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.collect_log_text.insert(tk.END, f"[{timestamp}] 데이터가 '{file_path}'로 내보내졌습니다.\n")
-            self.collect_log_text.see(tk.END)
+            if not DataExporter.detect_format(file_path):
+                messagebox.showerror("오류", "지원하지 않는 파일 형식입니다. (xlsx, csv, jsonl, parquet)")
+                return
             
-            messagebox.showinfo("완료", f"데이터가 '{file_path}'로 내보내졌습니다.")
+            exporter = DataExporter(self.db_manager)
+            
+            # 진행 상황 창
+            progress_window = tk.Toplevel(self.parent)
+            progress_window.title("데이터 내보내기")
+            progress_window.geometry("400x140")
+            progress_window.resizable(False, False)
+            
+            progress_label = ttk.Label(progress_window, text="데이터를 내보내는 중...")
+            progress_label.pack(pady=10)
+            
+            progress_bar = ttk.Progressbar(progress_window, orient="horizontal", length=350, mode="determinate")
+            progress_bar.pack(pady=5)
+            
+            cancel_button = ttk.Button(progress_window, text="취소", command=exporter.cancel)
+            cancel_button.pack(pady=5)
+            progress_window.protocol("WM_DELETE_WINDOW", exporter.cancel)
+            
+            # UI 갱신은 after로 Tk 스레드에서 처리
+            def update_progress(written, total):
+                def apply():
+                    if progress_window.winfo_exists():
+                        progress_bar["value"] = written * 100 / total if total else 0
+                        progress_label.config(text=f"데이터를 내보내는 중... ({written}/{total})")
+                self.parent.after(0, apply)
+            
+            def on_done(result):
+                self.parent.after(0, lambda: self.finish_export(result, progress_window))
+            
+            exporter.start_export(file_path, progress_callback=update_progress, done_callback=on_done)
             
         except Exception as e:
             self.logger.error(f"데이터 내보내기 중 오류: {e}")
@@ -2408,7 +2546,26 @@ class DataCollectorUI:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             self.collect_log_text.insert(tk.END, f"[{timestamp}] 데이터 내보내기 중 오류: {str(e)}\n")
             self.collect_log_text.see(tk.END)
-    
+
+    def finish_export(self, result, progress_window):
+        """내보내기 완료 처리 (Tk 스레드에서 호출)"""
+        if progress_window.winfo_exists():
+            progress_window.destroy()
+        
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        file_path = result["path"]
+        
+        if result["status"] == "done":
+            self.collect_log_text.insert(tk.END, f"[{timestamp}] 데이터 {result['rows']}개 항목이 '{file_path}'로 내보내졌습니다.\n")
+            messagebox.showinfo("완료", f"데이터가 '{file_path}'로 내보내졌습니다.")
+        elif result["status"] == "cancelled":
+            self.collect_log_text.insert(tk.END, f"[{timestamp}] 데이터 내보내기 취소됨\n")
+        else:
+            self.collect_log_text.insert(tk.END, f"[{timestamp}] 데이터 내보내기 중 오류: {result['error']}\n")
+            messagebox.showerror("오류", f"데이터 내보내기 중 오류가 발생했습니다: {result['error']}")
+        
+        self.collect_log_text.see(tk.END)
+
     def cleanup(self):
         """리소스 정리"""
    
@@ -2419,6 +2576,9 @@ class DataCollectorUI:
         for task, collector in self.running_tasks:
             if hasattr(collector, 'should_stop'):
                 collector.should_stop = True
+        
+        # 수집 실행 사이에 유지하던 브라우저 종료
+        NewspickCollector.close_shared_session()
 
         # 열 너비 설정 저장
         self.save_column_widths()
@@ -0,0 +1,239 @@
+# data_exporter.py
+import os
+import csv
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 내보내기 기본 열 (뉴스 항목 사전의 키 순서)
+BASE_COLUMNS = [
+    "id", "카테고리", "게시물 제목", "복사링크", "원본링크",
+    "수집 날짜", "이미지 경로", "500자 요약", "포스팅 시간"
+]
+
+# 파일 확장자별 내보내기 형식
+EXPORT_FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".xlsx": "excel",
+}
+
+
+class CsvSink:
+    """CSV 파일 쓰기 (엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 사용)"""
+
+    def __init__(self, path, columns):
+        self.columns = columns
+        self.file = open(path, "w", encoding="utf-8-sig", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write_rows(self, rows):
+        self.writer.writerows([row.get(col, "") for col in self.columns] for row in rows)
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlSink:
+    """JSON Lines 파일 쓰기 (한 줄에 항목 하나)"""
+
+    def __init__(self, path, columns):
+        self.columns = columns
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write_rows(self, rows):
+        for row in rows:
+            record = {col: row.get(col) for col in self.columns}
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    """Parquet 파일 쓰기 (페이지마다 row group 하나로 기록)"""
+
+    def __init__(self, path, columns):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        self.columns = columns
+        self.schema = pa.schema(
+            [pa.field("id", pa.int64())] + [pa.field(col, pa.string()) for col in columns if col != "id"]
+        )
+        self.writer = pq.ParquetWriter(path, self.schema, compression="snappy")
+
+    def write_rows(self, rows):
+        data = {}
+        for col in self.columns:
+            if col == "id":
+                data[col] = [row.get(col) for row in rows]
+            else:
+                data[col] = [None if row.get(col) is None else str(row.get(col)) for row in rows]
+        self.writer.write_table(self.pa.Table.from_pydict(data, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+class ExcelSink:
+    """엑셀 파일 쓰기 (openpyxl 쓰기 전용 모드로 행 단위 기록)"""
+
+    def __init__(self, path, columns):
+        from openpyxl import Workbook
+
+        self.path = path
+        self.columns = columns
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+        self.sheet.append(columns)
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.sheet.append([row.get(col, "") for col in self.columns])
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+SINKS = {
+    "csv": CsvSink,
+    "jsonl": JsonlSink,
+    "parquet": ParquetSink,
+    "excel": ExcelSink,
+}
+
+
+class DataExporter:
+    """
+    뉴스 데이터 내보내기
+
+    DB에서 페이지 단위로 읽은 항목을 바로 파일에 기록하므로 메모리 사용량은
+    전체 데이터가 아닌 페이지 크기에 비례합니다. 임시 파일에 쓴 뒤 완료 시
+    대상 경로로 옮기므로 취소나 오류 시 불완전한 파일이 남지 않습니다.
+    """
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.cancel_event = threading.Event()
+        self.export_thread = None
+
+    @staticmethod
+    def detect_format(path):
+        """파일 확장자로 내보내기 형식 판단 (지원하지 않으면 None)"""
+        return EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+
+    def export(self, path, export_format=None, progress_callback=None):
+        """
+        뉴스 데이터를 파일로 내보내기
+
+        Args:
+            path (str): 저장할 파일 경로
+            export_format (str, optional): csv, jsonl, parquet, excel (기본값: 확장자로 판단)
+            progress_callback (callable, optional): progress_callback(기록한 항목 수, 전체 항목 수)
+
+        Returns:
+            dict: {"status": "done" | "cancelled" | "error", "rows": 기록한 항목 수, "path": 경로, "error": 오류}
+        """
+        export_format = export_format or self.detect_format(path)
+        result = {"status": "error", "rows": 0, "path": path, "error": None}
+
+        if export_format not in SINKS:
+            result["error"] = f"지원하지 않는 내보내기 형식입니다: {path}"
+            logger.error(result["error"])
+            return result
+
+        temp_path = path + ".part"
+        sink = None
+
+        try:
+            total_count = self.db_manager.count_news_items()
+
+            # 상태 열은 스트리밍 전에 미리 확정
+            columns = BASE_COLUMNS + [
+                f"페이스북_상태_{page_id}" for page_id in self.db_manager.get_posting_page_ids()
+            ]
+
+            sink = SINKS[export_format](temp_path, columns)
+
+            for page in self.db_manager.iter_news_pages():
+                if self.cancel_event.is_set():
+                    break
+
+                sink.write_rows(page)
+                result["rows"] += len(page)
+
+                if progress_callback:
+                    progress_callback(result["rows"], total_count)
+
+            sink.close()
+            sink = None
+
+            if self.cancel_event.is_set():
+                os.remove(temp_path)
+                result["status"] = "cancelled"
+                logger.info(f"데이터 내보내기가 취소되었습니다: {path}")
+                return result
+
+            os.replace(temp_path, path)
+            result["status"] = "done"
+            logger.info(f"{result['rows']}개 항목을 {export_format} 형식으로 내보냈습니다: {path}")
+            return result
+
+        except ImportError as e:
+            result["error"] = f"{export_format} 형식 내보내기에 필요한 패키지가 없습니다: {e}"
+            logger.error(result["error"])
+        except Exception as e:
+            result["error"] = str(e)
+            logger.error(f"데이터 내보내기 중 오류: {e}")
+
+        # 오류 시 임시 파일 정리
+        if sink:
+            try:
+                sink.close()
+            except Exception:
+                pass
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return result
+
+    def start_export(self, path, export_format=None, progress_callback=None, done_callback=None):
+        """
+        별도 스레드에서 내보내기 실행
+
+        Args:
+            path (str): 저장할 파일 경로
+            export_format (str, optional): 내보내기 형식 (기본값: 확장자로 판단)
+            progress_callback (callable, optional): 진행 상황 콜백 (작업 스레드에서 호출)
+            done_callback (callable, optional): 완료 시 done_callback(결과 사전) 호출 (작업 스레드에서 호출)
+
+        Returns:
+            bool: 내보내기를 시작했으면 True (이미 실행 중이면 False)
+        """
+        if self.export_thread and self.export_thread.is_alive():
+            logger.warning("이미 데이터 내보내기가 진행 중입니다.")
+            return False
+
+        self.cancel_event.clear()
+
+        def run_export():
+            result = self.export(path, export_format, progress_callback)
+            if done_callback:
+                done_callback(result)
+
+        self.export_thread = threading.Thread(target=run_export, name="DataExport", daemon=True)
+        self.export_thread.start()
+        return True
+
+    def cancel(self):
+        """진행 중인 내보내기 취소 (현재 페이지 기록 후 중단)"""
+        self.cancel_event.set()
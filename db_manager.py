@@ -3,14 +3,163 @@ import os
 import json
 import sqlite3
 import logging
-from datetime import datetime
+import threading
+import queue
+import time
+import gzip
+import shutil
+import csv
+from itertools import chain
+from datetime import datetime, timedelta
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+class WriteHandle:
+    """지연 쓰기 작업의 완료 대기 핸들 (커밋 후 결과 전달)"""
+    
+    def __init__(self):
+        self._event = threading.Event()
+        self.result = None
+        self.error = None
+    
+    def _complete(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self._event.set()
+    
+    def done(self):
+        """커밋(또는 실패) 완료 여부"""
+        return self._event.is_set()
+    
+    def wait(self, timeout=None):
+        """
+        커밋될 때까지 대기
+        
+        Args:
+            timeout (float, optional): 최대 대기 시간(초)
+            
+        Returns:
+            작업 결과 (실패 또는 시간 초과 시 None)
+        """
+        if not self._event.wait(timeout):
+            return None
+        return self.result
+
 class DatabaseManager:
     """SQLite 데이터베이스 관리 클래스"""
     
+    # 스키마 마이그레이션 목록 (PRAGMA user_version 기준, 순서대로 한 번만 실행)
+    MIGRATIONS = [
+        (1, "쓰레드 관련 열 추가", "_migrate_thread_columns"),
+        (2, "Threads 플랫폼 필드 및 설정 테이블 추가", "_migrate_threads_platform"),
+        (3, "조회용 인덱스 추가", "_migrate_hot_query_indexes"),
+        (4, "포스팅 상태 정수 state 열 추가 및 기존 상태 변환", "_migrate_posting_state"),
+        (5, "제목/요약 전문 검색 인덱스 추가", "_migrate_news_fts"),
+        (6, "가져오기 작업 진행 기록 테이블 및 제목 인덱스 추가", "_migrate_import_jobs"),
+        (7, "수집 작업 체크포인트 테이블 추가", "_migrate_collection_jobs"),
+        (8, "이미지 저장소 및 참조 수 테이블 추가", "_migrate_image_store"),
+        (9, "플랫폼별 게시 대기 행과 상태 인덱스 추가", "_migrate_posting_queue"),
+    ]
+    
+    # 포스팅 상태 (posting_status.state) - 상태 메시지는 status 열에 별도로 보관
+    POST_STATE_PENDING = 0
+    POST_STATE_IN_PROGRESS = 1
+    POST_STATE_POSTED = 2
+    POST_STATE_FAILED = 3
+    
+    # 뉴스 추가 시 미게시(PENDING) 상태 행을 미리 만들어 두는 플랫폼 {플랫폼 ID: 이름}
+    # 미게시 항목 조회가 news_data 전체가 아닌 (platform_id, state, news_id) 인덱스 범위만 읽도록 함
+    QUEUED_POSTING_PLATFORMS = {"threads": "Threads"}
+    
+    # 시작 시 실행 계획을 검사할 주요 쿼리 (이름, SQL, 파라미터, 전체 스캔 허용 테이블)
+    HOT_QUERIES = [
+        (
+            "포스팅 상태 조회",
+            "SELECT id FROM posting_status WHERE news_id = ? AND platform_id = ?",
+            (1, "threads"),
+            (),
+        ),
+        (
+            "페이지별 포스팅 상태 조회",
+            "SELECT id FROM posting_status WHERE news_id = ? AND page_id = ?",
+            (1, "threads"),
+            (),
+        ),
+        (
+            "플랫폼별 미게시 항목 조회",
+            """
+            SELECT n.id FROM posting_status ps
+            JOIN news_data n ON n.id = ps.news_id
+            WHERE ps.platform_id = ? AND ps.state IN (?, ?, ?)
+            AND NOT EXISTS (
+                SELECT 1 FROM posting_status done
+                WHERE done.news_id = ps.news_id AND done.platform_id = ps.platform_id AND done.state = ?
+            )
+            ORDER BY ps.news_id DESC LIMIT 5
+            """,
+            ("threads", 0, 1, 3, 2),
+            (),
+        ),
+        (
+            "뉴스 목록 페이지 조회",
+            """
+            SELECT n.id, ps.status
+            FROM (SELECT id FROM news_data WHERE id < ? ORDER BY id DESC LIMIT 500) n
+            LEFT JOIN posting_status ps ON ps.news_id = n.id
+            ORDER BY n.id DESC, ps.id
+            """,
+            (2 ** 63 - 1,),
+            ("n",),
+        ),
+        (
+            "처리된 제목 확인",
+            "SELECT id FROM processed_titles WHERE title = ?",
+            ("",),
+            (),
+        ),
+        (
+            "저장된 이미지 조회",
+            """
+            SELECT i.path FROM image_sources s
+            JOIN image_store i ON i.content_hash = s.content_hash
+            WHERE s.source_hash = ?
+            """,
+            ("",),
+            (),
+        ),
+    ]
+    
+    # 연결 설정 - 잠금 대기 시간(ms)과 재사용을 위해 보관할 유휴 연결 수
+    BUSY_TIMEOUT_MS = 5000
+    MAX_IDLE_CONNECTIONS = 4
+    
+    # 지연 쓰기 설정 - N개 작업 또는 T밀리초마다 하나의 트랜잭션으로 커밋
+    WRITE_BATCH_SIZE = 100
+    WRITE_BATCH_INTERVAL_MS = 200
+    # 결과를 기다리는 쓰기의 최대 대기 시간(ms) - 잠금 대기 + 묶음 대기 + 앞서 큐에 있던 묶음 처리 여유
+    WRITE_WAIT_TIMEOUT_MS = BUSY_TIMEOUT_MS + WRITE_BATCH_INTERVAL_MS + 5000
+    
+    # 백업 설정 - 단계당 복사 페이지 수, 단계 사이 대기(ms), 보관할 백업 수, 압축 여부
+    BACKUP_PAGES_PER_STEP = 256
+    BACKUP_STEP_SLEEP_MS = 20
+    BACKUP_RETENTION_COUNT = 10
+    BACKUP_COMPRESS = True
+    # 중단된 백업의 임시 파일 - 이 시간(시간 단위) 동안 수정되지 않았으면 정리 (진행 중인 백업 보호)
+    BACKUP_TEMP_MAX_AGE_HOURS = 24
+    
+    # 엑셀/CSV 가져오기 - 트랜잭션 하나로 커밋할 행 수
+    IMPORT_CHUNK_SIZE = 2000
+    
+    # 뉴스 목록 페이지 크기 - 조회 시 한 번에 메모리에 올리는 최대 항목 수
+    NEWS_PAGE_SIZE = 500
+    
+    # 수집 작업 이어하기 - 이 시간(시간 단위) 안에 갱신된 미완료 작업만 이어서 진행
+    COLLECTION_RESUME_HOURS = 6
+    
+    # 이미지 저장소 - 참조가 없는 이미지는 이 시간(시간 단위)이 지나면 정리 (처리 직후 아직 뉴스 행이 없는 이미지 보호)
+    IMAGE_ORPHAN_HOURS = 24
+    
     def __init__(self, base_path):
         """데이터베이스 초기화"""
         self.base_path = base_path
@@ -19,29 +168,274 @@ class DatabaseManager:
         os.makedirs(self.db_dir, exist_ok=True)
         
         self.db_path = os.path.join(self.db_dir, "newspick_data.db")
-        self.connection = None
+        
+        # 스레드별 연결 풀 (UI, 수집, 요약, 포스팅 스레드가 각자 연결 사용)
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._active_connections = {}  # 스레드 ID -> (스레드 객체, 연결)
+        self._idle_connections = []
+        
+        # 지연 쓰기 큐 (쓰기 전용 스레드가 묶음 단위로 커밋)
+        self._write_queue = queue.Queue()
+        self._writer_thread = None
+        self._writer_lock = threading.Lock()
+        
+        # 백그라운드 백업 (동시에 하나만 실행)
+        self._backup_lock = threading.Lock()
+        self._backup_thread = None
         
         # 로거 설정 추가
         self.logger = logging.getLogger(__name__)
         
         self.initialize_database()
+        
+        # 주요 쿼리가 전체 테이블 스캔으로 떨어지면 시작 단계에서 실패
+        self.verify_query_plans()
+    
+    @property
+    def connection(self):
+        """현재 스레드에 할당된 연결 (없으면 None)"""
+        return getattr(self._local, "connection", None)
+    
+    def _open_connection(self):
+        """WAL 모드와 잠금 대기 시간이 설정된 새 연결 생성"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False  # 종료 시 다른 스레드에서 닫기 위해 필요
+        )
+        conn.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+        # WAL: 읽기는 스냅샷을 보므로 수집기의 쓰기를 막지 않음
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+    
+    def _reclaim_dead_connections(self):
+        """종료된 스레드의 연결을 유휴 목록으로 회수 (_pool_lock 보유 상태에서 호출)"""
+        for thread_id, (thread, conn) in list(self._active_connections.items()):
+            if thread.is_alive():
+                continue
+            
+            del self._active_connections[thread_id]
+            try:
+                # 커밋되지 않은 작업은 버리고 재사용
+                conn.rollback()
+                if len(self._idle_connections) < self.MAX_IDLE_CONNECTIONS:
+                    self._idle_connections.append(conn)
+                else:
+                    conn.close()
+            except Exception as e:
+                logger.debug(f"종료된 스레드 연결 정리 중 무시된 오류: {e}")
     
     def get_connection(self):
-        """데이터베이스 연결 반환"""
-        if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        """현재 스레드 전용 데이터베이스 연결 반환"""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            with self._pool_lock:
+                self._reclaim_dead_connections()
+                conn = self._idle_connections.pop() if self._idle_connections else None
+            
+            if conn is None:
+                conn = self._open_connection()
+            
             # 행 이름으로 접근할 수 있도록 설정
-            self.connection.row_factory = sqlite3.Row
-        return self.connection
+            conn.row_factory = sqlite3.Row
+            
+            with self._pool_lock:
+                self._active_connections[threading.get_ident()] = (threading.current_thread(), conn)
+            self._local.connection = conn
+        return conn
     
     def close_connection(self):
-        """데이터베이스 연결 종료"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """모든 스레드의 데이터베이스 연결 종료"""
+        # 대기 중인 쓰기를 먼저 커밋하고 쓰기 스레드 종료
+        self.stop_writer()
+        
+        with self._pool_lock:
+            connections = [conn for _, conn in self._active_connections.values()]
+            connections.extend(self._idle_connections)
+            self._active_connections.clear()
+            self._idle_connections = []
+        
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.debug(f"연결 종료 중 무시된 오류: {e}")
+        
+        self._local = threading.local()
+    
+    def _ensure_writer(self):
+        """쓰기 전용 스레드가 없으면 시작"""
+        with self._writer_lock:
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+                self._writer_thread.start()
+    
+    def submit_write(self, operation, *args):
+        """
+        쓰기 작업을 지연 쓰기 큐에 추가
+        
+        Args:
+            operation (callable): operation(cursor, *args) 형태의 쓰기 함수 (None이면 flush 표시)
+            *args: 쓰기 함수 인자
+            
+        Returns:
+            WriteHandle: 커밋 완료 대기 핸들
+        """
+        handle = WriteHandle()
+        self._ensure_writer()
+        self._write_queue.put((handle, operation, args))
+        return handle
+    
+    def flush(self, timeout=None):
+        """
+        지금까지 큐에 들어간 모든 쓰기가 커밋될 때까지 대기
+        
+        Returns:
+            bool: 제한 시간 내에 커밋되었으면 True
+        """
+        handle = self.submit_write(None)
+        handle.wait(timeout)
+        return handle.done()
+    
+    def stop_writer(self, timeout=10):
+        """대기 중인 쓰기를 커밋한 뒤 쓰기 스레드 종료"""
+        with self._writer_lock:
+            writer = self._writer_thread
+            self._writer_thread = None
+        
+        if writer and writer.is_alive():
+            self._write_queue.put(None)
+            writer.join(timeout)
+    
+    def _writer_loop(self):
+        """지연 쓰기 스레드 - 큐의 작업을 묶어서 하나의 트랜잭션으로 커밋"""
+        conn = None
+        interval = self.WRITE_BATCH_INTERVAL_MS / 1000
+        stopping = False
+        
+        while not stopping:
+            first = self._write_queue.get()
+            if first is None:
+                break
+            
+            batch = [first]
+            deadline = time.monotonic() + interval
+            
+            # flush 요청이 있으면 기다리지 않고 바로 커밋
+            while len(batch) < self.WRITE_BATCH_SIZE and batch[-1][1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._write_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            
+            conn = self._run_write_batch(conn, batch)
+        
+        # 종료 전에 남은 작업 처리
+        remaining_batch = []
+        while True:
+            try:
+                entry = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not None:
+                remaining_batch.append(entry)
+        if remaining_batch:
+            self._run_write_batch(conn, remaining_batch)
+    
+    def _run_write_batch(self, conn, batch):
+        """
+        쓰기 묶음 실행 - 어떤 오류가 나도 쓰기 스레드는 계속 돌고 묶음의 핸들은 모두 완료됨
+        
+        Returns:
+            sqlite3.Connection or None: 다음 묶음에 쓸 연결 (오류 시 None - 다음 묶음에서 새로 엶)
+        """
+        try:
+            if conn is None:
+                conn = self.get_connection()
+            if self._apply_write_batch(conn, batch):
+                return conn
+        except Exception as e:
+            logger.error(f"지연 쓰기 묶음 처리 중 오류: {e}")
+            for handle, _, _ in batch:
+                if not handle.done():
+                    handle._complete(None, e)
+        
+        # 트랜잭션이 실패한 연결(닫힘 등)은 버리고 다음 묶음에서 새 연결 사용 (쓰기 스레드 자신의 연결만)
+        if conn is not None:
+            if getattr(self._local, "connection", None) is conn:
+                self._local.connection = None
+            try:
+                conn.close()
+            except Exception:
+                pass
+        return None
+    
+    def _apply_write_batch(self, conn, batch):
+        """
+        쓰기 묶음을 하나의 트랜잭션으로 실행 (작업별 SAVEPOINT로 실패 격리)
+        
+        Returns:
+            bool: 트랜잭션이 커밋되었으면 True (실패 시 묶음의 모든 핸들에 오류 전달)
+        """
+        results = []
+        committed = False
+        
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            for handle, operation, args in batch:
+                if operation is None:
+                    results.append((handle, True, None))
+                    continue
+                
+                cursor.execute("SAVEPOINT write_op")
+                try:
+                    result = operation(cursor, *args)
+                    cursor.execute("RELEASE SAVEPOINT write_op")
+                    results.append((handle, result, None))
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT write_op")
+                    cursor.execute("RELEASE SAVEPOINT write_op")
+                    results.append((handle, None, e))
+            
+            conn.commit()
+            committed = True
+        except Exception as e:
+            logger.error(f"지연 쓰기 트랜잭션 커밋 중 오류: {e}")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            results = [(handle, None, e) for handle, _, _ in batch]
+        
+        for handle, result, error in results:
+            handle._complete(result, error)
+        return committed
+    
+    def _wait_write(self, handle, error_message):
+        """쓰기 핸들을 최대 WRITE_WAIT_TIMEOUT_MS까지 기다린 뒤 오류를 기존 방식대로 로깅 (오류/시간 초과 시 None)"""
+        # 호출자가 결과를 기다리므로 묶음 대기 시간 없이 바로 커밋하도록 flush 표시 추가
+        self.submit_write(None)
+        result = handle.wait(self.WRITE_WAIT_TIMEOUT_MS / 1000)
+        if not handle.done():
+            logger.error(f"{error_message}: 쓰기 대기 시간 초과 ({self.WRITE_WAIT_TIMEOUT_MS}ms)")
+            return None
+        if handle.error:
+            logger.error(f"{error_message}: {handle.error}")
+            return None
+        return result
     
     def initialize_database(self):
-        """데이터베이스 테이블 초기화"""
+        """데이터베이스 테이블 초기화 (스키마 마이그레이션 실패 시 RuntimeError)"""
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
@@ -129,6 +523,435 @@ class DatabaseManager:
             
         except Exception as e:
             logger.error(f"데이터베이스 초기화 중 오류: {e}")
+        
+        # 버전별 스키마 마이그레이션 실행 - 실패하면 이전 스키마로 계속 실행하지 않고 시작 중단
+        try:
+            self.migrate_database()
+        except Exception as e:
+            raise RuntimeError(f"데이터베이스 스키마 마이그레이션에 실패해 시작을 중단합니다: {e}") from e
+    
+    def get_schema_version(self):
+        """현재 스키마 버전 (PRAGMA user_version) 반환"""
+        cursor = self.get_connection().cursor()
+        cursor.execute("PRAGMA user_version")
+        return cursor.fetchone()[0]
+    
+    def migrate_database(self):
+        """
+        PRAGMA user_version 기반 스키마 마이그레이션
+        
+        현재 버전보다 높은 단계만 순서대로 실행하며, 각 단계는 하나의 트랜잭션으로
+        적용된 뒤 user_version이 갱신됩니다.
+        
+        Returns:
+            int: 마이그레이션 후 스키마 버전
+        """
+        conn = self.get_connection()
+        current_version = self.get_schema_version()
+        
+        for version, description, method_name in self.MIGRATIONS:
+            if version <= current_version:
+                continue
+            
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN")
+                getattr(self, method_name)(cursor)
+                # PRAGMA는 파라미터 바인딩을 지원하지 않음 (정수 상수만 사용)
+                cursor.execute(f"PRAGMA user_version = {int(version)}")
+                conn.commit()
+                current_version = version
+                logger.info(f"스키마 마이그레이션 {version} 적용: {description}")
+            except Exception:
+                conn.rollback()
+                logger.error(f"스키마 마이그레이션 {version} 실패: {description}")
+                raise
+        
+        if current_version >= 5:
+            self._ensure_news_fts()
+        
+        return current_version
+    
+    def _ensure_news_fts(self):
+        """
+        전문 검색 테이블이 없으면 다시 생성하고 색인
+        
+        마이그레이션 5는 FTS5가 없는 SQLite에서 테이블 없이 버전만 올라가므로,
+        나중에 FTS5를 쓸 수 있는 환경에서 실행되면 시작할 때 여기서 만듭니다.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'")
+        if cursor.fetchone():
+            return
+        
+        try:
+            cursor.execute("BEGIN")
+            self._migrate_news_fts(cursor)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logger.error("전문 검색 인덱스 생성 실패")
+            raise
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'")
+        if cursor.fetchone():
+            logger.info("누락된 전문 검색 인덱스를 생성하고 기존 항목을 색인했습니다.")
+    
+    def _get_table_columns(self, cursor, table_name):
+        """테이블의 열 이름 목록 반환"""
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        return {row[1] for row in cursor.fetchall()}
+    
+    def _migrate_thread_columns(self, cursor):
+        """마이그레이션 1: news_data에 쓰레드 관련 열 추가"""
+        new_columns = [
+            "thread1 TEXT DEFAULT ''",
+            "thread2 TEXT DEFAULT ''",
+            "thread3 TEXT DEFAULT ''", 
+            "thread4 TEXT DEFAULT ''",
+            "thread5 TEXT DEFAULT ''",
+            "created_status TEXT DEFAULT ''"
+        ]
+        
+        existing_columns = self._get_table_columns(cursor, "news_data")
+        for column_def in new_columns:
+            if column_def.split()[0] not in existing_columns:
+                cursor.execute(f"ALTER TABLE news_data ADD COLUMN {column_def}")
+    
+    def _migrate_threads_platform(self, cursor):
+        """마이그레이션 2: posting_status.platform_id 및 threads_settings 테이블 추가"""
+        if "platform_id" not in self._get_table_columns(cursor, "posting_status"):
+            cursor.execute("ALTER TABLE posting_status ADD COLUMN platform_id TEXT DEFAULT 'facebook'")
+        
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS threads_settings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            account_name TEXT,
+            login_time TEXT,
+            auto_post BOOLEAN DEFAULT 0,
+            post_interval INTEGER DEFAULT 60,
+            max_posts_per_run INTEGER DEFAULT 5
+        )
+        ''')
+        
+        # 기본 설정값 추가 (없는 경우에만)
+        cursor.execute("SELECT COUNT(*) FROM threads_settings")
+        if cursor.fetchone()[0] == 0:
+            cursor.execute(
+                "INSERT INTO threads_settings (account_name, login_time, auto_post, post_interval, max_posts_per_run) VALUES (?, ?, ?, ?, ?)",
+                ("", "", 0, 60, 5)
+            )
+    
+    def _migrate_hot_query_indexes(self, cursor):
+        """
+        마이그레이션 3: 주요 조회 쿼리용 인덱스 추가
+        
+        - (news_id, platform_id, status): 플랫폼별 상태 조회와 미게시 항목 NOT EXISTS 검사를 커버
+        - (news_id, page_id): 페이지 단위 상태 갱신 조회
+        processed_titles.title은 UNIQUE 제약의 자동 인덱스를 그대로 사용합니다.
+        """
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_posting_status_news_platform "
+            "ON posting_status (news_id, platform_id, status)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_posting_status_news_page "
+            "ON posting_status (news_id, page_id)"
+        )
+    
+    def _migrate_posting_state(self, cursor):
+        """
+        마이그레이션 4: posting_status에 정수 상태와 시도 횟수 추가
+        
+        기존 상태 메시지(status)에서 state를 한 번 채우고, 미게시 검사용 인덱스를
+        (news_id, platform_id, state)로 교체합니다.
+        """
+        columns = self._get_table_columns(cursor, "posting_status")
+        if "state" not in columns:
+            cursor.execute("ALTER TABLE posting_status ADD COLUMN state INTEGER NOT NULL DEFAULT 0")
+        if "attempt_count" not in columns:
+            cursor.execute("ALTER TABLE posting_status ADD COLUMN attempt_count INTEGER NOT NULL DEFAULT 0")
+        if "last_attempt_date" not in columns:
+            cursor.execute("ALTER TABLE posting_status ADD COLUMN last_attempt_date TEXT")
+        
+        # 기존 행 변환 (LIKE 검사는 마이그레이션에서 한 번만 수행)
+        cursor.execute(
+            """
+            UPDATE posting_status
+            SET state = CASE
+                    WHEN status LIKE '%포스팅 완료%' THEN ?
+                    WHEN status LIKE '%실패%' OR status LIKE '%오류%' THEN ?
+                    ELSE ?
+                END,
+                attempt_count = CASE
+                    WHEN status LIKE '%포스팅 완료%' OR status LIKE '%실패%' OR status LIKE '%오류%' THEN 1
+                    ELSE 0
+                END,
+                last_attempt_date = post_date
+            """,
+            (self.POST_STATE_POSTED, self.POST_STATE_FAILED, self.POST_STATE_PENDING)
+        )
+        
+        cursor.execute("DROP INDEX IF EXISTS idx_posting_status_news_platform")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_posting_status_news_platform_state "
+            "ON posting_status (news_id, platform_id, state)"
+        )
+    
+    def _migrate_news_fts(self, cursor):
+        """
+        마이그레이션 5: news_data 제목/요약 FTS5 전문 검색 테이블 추가
+        
+        news_data를 외부 콘텐츠로 사용하는 news_fts를 만들고 트리거로 동기화합니다.
+        한국어는 조사가 붙어 토큰이 나뉘지 않으므로 검색어는 접두어 검색으로 처리하며,
+        이를 위해 2·3글자 접두어 인덱스를 함께 만듭니다.
+        """
+        try:
+            cursor.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+                    title, summary_500,
+                    content='news_data', content_rowid='id',
+                    tokenize='unicode61', prefix='2 3'
+                )
+                """
+            )
+        except sqlite3.OperationalError as e:
+            # FTS5 없이 빌드된 SQLite에서는 LIKE 검색으로 대체
+            logger.warning(f"FTS5를 사용할 수 없어 전문 검색 인덱스를 만들지 않습니다: {e}")
+            return
+        
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS news_fts_after_insert AFTER INSERT ON news_data BEGIN
+                INSERT INTO news_fts (rowid, title, summary_500)
+                VALUES (new.id, new.title, new.summary_500);
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS news_fts_after_delete AFTER DELETE ON news_data BEGIN
+                INSERT INTO news_fts (news_fts, rowid, title, summary_500)
+                VALUES ('delete', old.id, old.title, old.summary_500);
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS news_fts_after_update AFTER UPDATE OF title, summary_500 ON news_data BEGIN
+                INSERT INTO news_fts (news_fts, rowid, title, summary_500)
+                VALUES ('delete', old.id, old.title, old.summary_500);
+                INSERT INTO news_fts (rowid, title, summary_500)
+                VALUES (new.id, new.title, new.summary_500);
+            END
+            """
+        )
+        
+        # 기존 행 색인
+        cursor.execute("INSERT INTO news_fts (news_fts) VALUES ('rebuild')")
+    
+    def _migrate_import_jobs(self, cursor):
+        """
+        마이그레이션 6: 엑셀/CSV 가져오기 진행 기록 테이블과 news_data.title 인덱스 추가
+        
+        import_jobs는 원본 파일별로 커밋된 행 수를 기록해 중단된 가져오기를 이어서 진행하고,
+        title 인덱스는 병합 모드의 중복 확인에 사용합니다.
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS import_jobs (
+                source_path TEXT PRIMARY KEY,
+                file_size INTEGER,
+                file_mtime REAL,
+                merge_mode INTEGER,
+                rows_done INTEGER DEFAULT 0,
+                rows_imported INTEGER DEFAULT 0,
+                status TEXT,
+                started_at TEXT,
+                updated_at TEXT
+            )
+            """
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_data_title ON news_data (title)")
+    
+    def _migrate_collection_jobs(self, cursor):
+        """
+        마이그레이션 7: 수집 작업 체크포인트 테이블 추가
+        
+        collection_jobs는 수집 실행 하나, collection_job_urls는 URL별 완료 여부,
+        collection_job_items는 항목(nid)별 처리 결과를 기록해 중단된 수집을 이어서 진행합니다.
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS collection_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url_list TEXT,
+                status TEXT,
+                new_items INTEGER DEFAULT 0,
+                started_at TEXT,
+                updated_at TEXT
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS collection_job_urls (
+                job_id INTEGER,
+                url TEXT,
+                status TEXT,
+                new_items INTEGER DEFAULT 0,
+                updated_at TEXT,
+                PRIMARY KEY (job_id, url)
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS collection_job_items (
+                job_id INTEGER,
+                nid TEXT,
+                url TEXT,
+                title TEXT,
+                status TEXT,
+                attempts INTEGER DEFAULT 0,
+                updated_at TEXT,
+                PRIMARY KEY (job_id, nid)
+            )
+            """
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_collection_jobs_status ON collection_jobs (status)")
+    
+    def _migrate_image_store(self, cursor):
+        """
+        마이그레이션 8: 내용 주소 이미지 저장소 테이블 추가
+        
+        image_store는 처리된 이미지 내용 해시별 파일 하나와 이를 가리키는 news_data 행 수(refcount),
+        image_sources는 원본 URL 해시 -> 내용 해시 매핑으로, 같은 URL은 다시 내려받지 않고
+        같은 이미지는 한 번만 저장합니다. refcount는 news_data 트리거로 유지합니다.
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS image_store (
+                content_hash TEXT PRIMARY KEY,
+                path TEXT UNIQUE,
+                size INTEGER,
+                refcount INTEGER DEFAULT 0,
+                created_at TEXT,
+                updated_at TEXT
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS image_sources (
+                source_hash TEXT PRIMARY KEY,
+                source_url TEXT,
+                content_hash TEXT,
+                created_at TEXT
+            )
+            """
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_image_sources_content ON image_sources (content_hash)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_image_store_refcount ON image_store (refcount)")
+        
+        # news_data.image_path가 저장소 파일을 가리키는 동안 참조 수 유지 (추가/삭제/경로 변경)
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS image_store_ref_insert AFTER INSERT ON news_data
+            WHEN new.image_path IS NOT NULL AND new.image_path != '' BEGIN
+                UPDATE image_store SET refcount = refcount + 1 WHERE path = new.image_path;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS image_store_ref_delete AFTER DELETE ON news_data
+            WHEN old.image_path IS NOT NULL AND old.image_path != '' BEGIN
+                UPDATE image_store SET refcount = refcount - 1 WHERE path = old.image_path;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS image_store_ref_update AFTER UPDATE OF image_path ON news_data
+            WHEN old.image_path IS NOT new.image_path BEGIN
+                UPDATE image_store SET refcount = refcount - 1 WHERE path = old.image_path;
+                UPDATE image_store SET refcount = refcount + 1 WHERE path = new.image_path;
+            END
+            """
+        )
+    
+    def _migrate_posting_queue(self, cursor):
+        """
+        마이그레이션 9: 플랫폼별 게시 대기 행과 (platform_id, state, news_id) 인덱스 추가
+        
+        QUEUED_POSTING_PLATFORMS의 플랫폼은 뉴스 항목마다 posting_status 행을 항상 갖도록
+        기존 항목에는 미게시 행을 채우고, 새 항목은 트리거로 추가합니다. 미게시 항목 조회는
+        이 인덱스에서 미게시/진행 중/실패 상태 범위만 읽습니다.
+        """
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_posting_status_platform_state_news "
+            "ON posting_status (platform_id, state, news_id)"
+        )
+        
+        for platform_id, platform_name in self.QUEUED_POSTING_PLATFORMS.items():
+            # 상태 행이 없는 기존 항목 채우기
+            cursor.execute(
+                """
+                INSERT INTO posting_status
+                (news_id, platform_id, page_id, page_name, status, state, attempt_count)
+                SELECT n.id, ?, ?, ?, '미게시', ?, 0 FROM news_data n
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM posting_status ps WHERE ps.news_id = n.id AND ps.platform_id = ?
+                )
+                """,
+                (platform_id, platform_id, platform_name, self.POST_STATE_PENDING, platform_id)
+            )
+            
+            # 트리거 본문은 파라미터를 쓸 수 없으므로 상수 값만 문자열로 넣음
+            platform_sql = platform_id.replace("'", "''")
+            name_sql = platform_name.replace("'", "''")
+            cursor.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS posting_queue_{platform_id}_after_insert AFTER INSERT ON news_data BEGIN
+                    INSERT INTO posting_status
+                    (news_id, platform_id, page_id, page_name, status, state, attempt_count)
+                    SELECT new.id, '{platform_sql}', '{platform_sql}', '{name_sql}', '미게시', {int(self.POST_STATE_PENDING)}, 0
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM posting_status WHERE news_id = new.id AND platform_id = '{platform_sql}'
+                    );
+                END
+                """
+            )
+    
+    def verify_query_plans(self):
+        """
+        주요 쿼리의 실행 계획 검사
+        
+        EXPLAIN QUERY PLAN 결과에 인덱스 없이 테이블 전체를 읽는 SCAN 단계가 있으면
+        (허용된 테이블 제외) RuntimeError를 발생시켜 시작을 중단합니다.
+        """
+        cursor = self.get_connection().cursor()
+        problems = []
+        
+        for name, query, params, allowed_scans in self.HOT_QUERIES:
+            cursor.execute("EXPLAIN QUERY PLAN " + query, params)
+            for row in cursor.fetchall():
+                detail = row[3]
+                parts = detail.split()
+                if len(parts) >= 2 and parts[0] == "SCAN" and "USING" not in parts:
+                    if parts[1] not in allowed_scans:
+                        problems.append(f"{name}: {detail}")
+        
+        if problems:
+            for problem in problems:
+                logger.error(f"전체 테이블 스캔 실행 계획 감지 - {problem}")
+            raise RuntimeError("주요 쿼리의 실행 계획이 전체 테이블 스캔입니다: " + "; ".join(problems))
+        
+        logger.info("주요 쿼리 실행 계획 검사 완료")
+        return True
     
     def save_urls(self, urls):
         """URL 목록 저장"""
@@ -367,32 +1190,38 @@ class DatabaseManager:
             logger.error(traceback.format_exc())
             return []
     
+    def _write_news_item(self, cursor, category, title, copy_link, original_link, image_path, summary_500):
+        """뉴스 항목 INSERT (지연 쓰기 스레드에서 실행)"""
+        collection_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        cursor.execute(
+            """
+            INSERT INTO news_data 
+            (category, title, copy_link, original_link, collection_date, image_path, summary_500) 
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (category, title, copy_link, original_link, collection_date, image_path, summary_500)
+        )
+        
+        news_id = cursor.lastrowid
+        logger.info(f"뉴스 항목이 추가되었습니다. ID: {news_id}")
+        return news_id
+    
+    def queue_news_item(self, category, title, copy_link, original_link, image_path, summary_500):
+        """
+        뉴스 항목 추가를 지연 쓰기 큐에 등록
+        
+        Returns:
+            WriteHandle: wait()로 커밋 후 뉴스 ID를 받을 수 있는 핸들
+        """
+        return self.submit_write(
+            self._write_news_item, category, title, copy_link, original_link, image_path, summary_500
+        )
+    
     def add_news_item(self, category, title, copy_link, original_link, image_path, summary_500):
-        """뉴스 항목 추가"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            collection_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            cursor.execute(
-                """
-                INSERT INTO news_data 
-                (category, title, copy_link, original_link, collection_date, image_path, summary_500) 
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (category, title, copy_link, original_link, collection_date, image_path, summary_500)
-            )
-            
-            news_id = cursor.lastrowid
-            conn.commit()
-            
-            logger.info(f"뉴스 항목이 추가되었습니다. ID: {news_id}")
-            return news_id
-            
-        except Exception as e:
-            logger.error(f"뉴스 항목 추가 중 오류: {e}")
-            return None
+        """뉴스 항목 추가 (커밋될 때까지 대기)"""
+        handle = self.queue_news_item(category, title, copy_link, original_link, image_path, summary_500)
+        return self._wait_write(handle, "뉴스 항목 추가 중 오류")
     
     def update_posting_status(self, news_id, page_id, page_name, status):
         """포스팅 상태 업데이트"""
@@ -445,53 +1274,93 @@ class DatabaseManager:
             logger.error(f"포스팅 상태 업데이트 중 오류: {e}")
             return False
     
-    def get_news_items(self, posted_only=False, unposted_only=False, page_id=None, limit=None):
-        """뉴스 항목 조회"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # 여기 쿼리에서 gpt_message를 summary_500으로 변경
-            query = """
-                SELECT n.id, n.category, n.title, n.copy_link, n.original_link, 
-                    n.collection_date, n.image_path, n.summary_500, n.posting_time
-                FROM news_data n
-            """
-            
-            params = []
-            
-            # 포스팅 상태에 따른 필터링
-            if posted_only or unposted_only or page_id:
-                query += " LEFT JOIN posting_status ps ON n.id = ps.news_id"
-                
-                where_clauses = []
-                
-                if page_id:
-                    where_clauses.append("ps.page_id = ?")
-                    params.append(page_id)
-                
-                if posted_only:
-                    where_clauses.append("ps.status LIKE '%포스팅 완료%'")
-                
-                if unposted_only:
-                    if page_id:
-                        where_clauses.append("(ps.status IS NULL OR ps.status NOT LIKE '%포스팅 완료%')")
-                    else:
-                        where_clauses.append("NOT EXISTS (SELECT 1 FROM posting_status ps2 WHERE ps2.news_id = n.id AND ps2.status LIKE '%포스팅 완료%')")
-                
-                if where_clauses:
-                    query += " WHERE " + " AND ".join(where_clauses)
-            
-            query += " ORDER BY n.id DESC"
-            
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
-            cursor.execute(query, params)
-            
-            news_items = []
-            for row in cursor.fetchall():
+    def _build_news_filters(self, posted_only=False, unposted_only=False, page_id=None,
+                            missing_summary=False, news_ids=None):
+        """
+        뉴스 목록 필터를 SQL WHERE 절로 변환
+        
+        Returns:
+            tuple: (WHERE 조건 목록, 파라미터 목록)
+        """
+        # 상태 필터는 EXISTS로 처리 (JOIN으로 인한 행 중복 방지)
+        where_clauses = []
+        params = []
+        
+        status_filter = "ps2.news_id = n.id"
+        if page_id:
+            status_filter += " AND ps2.page_id = ?"
+        
+        if posted_only:
+            where_clauses.append(f"EXISTS (SELECT 1 FROM posting_status ps2 WHERE {status_filter} AND ps2.state = ?)")
+            if page_id:
+                params.append(page_id)
+            params.append(self.POST_STATE_POSTED)
+        
+        if unposted_only:
+            where_clauses.append(f"NOT EXISTS (SELECT 1 FROM posting_status ps2 WHERE {status_filter} AND ps2.state = ?)")
+            if page_id:
+                params.append(page_id)
+            params.append(self.POST_STATE_POSTED)
+        
+        if page_id and not (posted_only or unposted_only):
+            # 미리 만들어 둔 미게시 행(시도 없음)은 상태 기록으로 보지 않음
+            where_clauses.append(
+                f"EXISTS (SELECT 1 FROM posting_status ps2 WHERE {status_filter} "
+                "AND (ps2.state != ? OR ps2.attempt_count > 0))"
+            )
+            params.extend([page_id, self.POST_STATE_PENDING])
+        
+        if missing_summary:
+            where_clauses.append("(n.summary_500 IS NULL OR TRIM(n.summary_500) = '')")
+        
+        if news_ids is not None:
+            placeholders = ", ".join("?" for _ in news_ids)
+            where_clauses.append(f"n.id IN ({placeholders})")
+            params.extend(news_ids)
+        
+        return where_clauses, params
+    
+    def _fetch_news_page(self, cursor, where_clauses, params, before_id, page_size):
+        """
+        키셋 방식으로 뉴스 한 페이지 조회 (before_id보다 작은 ID를 내림차순으로 page_size개)
+        
+        Returns:
+            list: 뉴스 항목 목록. 각 항목의 "플랫폼_상태"에는
+                  {플랫폼 ID: {"status": 상태 메시지, "post_date": 날짜, "state": POST_STATE_* 값,
+                  "attempts": 시도 횟수}} 형태로 상태가 담깁니다.
+        """
+        page_clauses = list(where_clauses)
+        page_params = list(params)
+        if before_id is not None:
+            page_clauses.append("n.id < ?")
+            page_params.append(before_id)
+        
+        news_query = """
+            SELECT n.id, n.category, n.title, n.copy_link, n.original_link, 
+                n.collection_date, n.image_path, n.summary_500, n.posting_time
+            FROM news_data n
+        """
+        if page_clauses:
+            news_query += " WHERE " + " AND ".join(page_clauses)
+        news_query += " ORDER BY n.id DESC LIMIT ?"
+        page_params.append(page_size)
+        
+        query = f"""
+            SELECT n.*, ps.id AS ps_id, ps.page_id AS ps_page_id, ps.platform_id AS ps_platform_id,
+                ps.status AS ps_status, ps.post_date AS ps_post_date,
+                ps.state AS ps_state, ps.attempt_count AS ps_attempt_count
+            FROM ({news_query}) n
+            LEFT JOIN posting_status ps ON ps.news_id = n.id
+            ORDER BY n.id DESC, ps.id
+        """
+        
+        cursor.execute(query, page_params)
+        
+        news_items = []
+        item = None
+        for row in cursor:
+            # 같은 뉴스 ID의 상태 행은 연속해서 나오므로 ID가 바뀔 때만 새 항목 생성
+            if item is None or item["id"] != row['id']:
                 item = {
                     "id": row['id'],
                     "카테고리": row['category'],
@@ -501,31 +1370,237 @@ class DatabaseManager:
                     "수집 날짜": row['collection_date'],
                     "이미지 경로": row['image_path'],
                     "500자 요약": row['summary_500'],  # GPT_문구에서 500자 요약으로 변경
-                    "포스팅 시간": row['posting_time'] or ""
+                    "포스팅 시간": row['posting_time'] or "",
+                    "플랫폼_상태": {}
                 }
-                
-                # 페이지별 포스팅 상태 가져오기
-                sub_cursor = conn.cursor()
-                sub_cursor.execute(
-                    """
-                    SELECT page_id, page_name, status, post_date
-                    FROM posting_status
-                    WHERE news_id = ?
-                    """,
-                    (row['id'],)
+                news_items.append(item)
+            
+            if row['ps_id'] is None:
+                continue
+            
+            # 페이지별 포스팅 상태 (기존 키 형식 유지)
+            item[f"페이스북_상태_{row['ps_page_id']}"] = row['ps_status']
+            
+            platform_id = row['ps_platform_id'] or row['ps_page_id']
+            item["플랫폼_상태"][platform_id] = {
+                "status": row['ps_status'] or "",
+                "post_date": row['ps_post_date'] or "",
+                "state": row['ps_state'],
+                "attempts": row['ps_attempt_count']
+            }
+        
+        return news_items
+    
+    def iter_news_pages(self, page_size=None, posted_only=False, unposted_only=False, page_id=None,
+                        missing_summary=False, news_ids=None):
+        """
+        뉴스 항목을 고정 크기 페이지 단위로 순회 (ID 내림차순)
+        
+        OFFSET 대신 마지막 ID 기준 키셋 방식으로 다음 페이지를 조회하므로
+        메모리 사용량은 테이블 크기가 아닌 페이지 크기에 비례합니다.
+        
+        Args:
+            page_size (int, optional): 페이지당 항목 수 (기본값: NEWS_PAGE_SIZE)
+            posted_only (bool): 포스팅 완료된 항목만 조회
+            unposted_only (bool): 포스팅되지 않은 항목만 조회
+            page_id (str, optional): 상태 필터를 적용할 페이지/플랫폼 ID
+            missing_summary (bool): 500자 요약이 없는 항목만 조회
+            news_ids (list, optional): 조회할 뉴스 ID 목록
+            
+        Yields:
+            list: 뉴스 항목 목록 (get_news_items와 같은 형식)
+            
+        Raises:
+            Exception: 조회 중 오류 (기록한 뒤 그대로 전달 - 중간에 조용히 끝나지 않음)
+        """
+        page_size = page_size or self.NEWS_PAGE_SIZE
+        
+        # ID 목록은 SQLite 파라미터 수 제한을 넘지 않도록 페이지 크기 단위로 나눠 조회
+        if news_ids is None:
+            id_chunks = [None]
+        else:
+            ids = sorted({int(news_id) for news_id in news_ids}, reverse=True)
+            id_chunks = [ids[i:i + page_size] for i in range(0, len(ids), page_size)]
+        
+        total_count = 0
+        try:
+            for id_chunk in id_chunks:
+                where_clauses, params = self._build_news_filters(
+                    posted_only, unposted_only, page_id, missing_summary, id_chunk
                 )
                 
-                for status_row in sub_cursor.fetchall():
-                    status_key = f"페이스북_상태_{status_row['page_id']}"
-                    item[status_key] = status_row['status']
-                
-                news_items.append(item)
+                before_id = None
+                while True:
+                    # 페이지마다 현재 스레드의 연결로 새로 조회 (페이지 사이에 커서를 유지하지 않음)
+                    cursor = self.get_connection().cursor()
+                    page = self._fetch_news_page(cursor, where_clauses, params, before_id, page_size)
+                    if not page:
+                        break
+                    
+                    total_count += len(page)
+                    yield page
+                    
+                    if len(page) < page_size:
+                        break
+                    before_id = page[-1]["id"]
             
-            logger.info(f"{len(news_items)}개의 뉴스 항목을 조회했습니다.")
+            logger.debug(f"{total_count}개의 뉴스 항목을 페이지 단위로 조회했습니다.")
+            
+        except Exception as e:
+            # 호출자가 일부만 받은 목록을 전체로 오인하지 않도록 오류를 그대로 전달
+            logger.error(f"뉴스 항목 페이지 조회 중 오류 ({total_count}개 조회 후 중단): {e}")
+            raise
+    
+    def get_news_items(self, posted_only=False, unposted_only=False, page_id=None, limit=None):
+        """
+        뉴스 항목 목록 조회
+        
+        전체 목록이 필요한 경우에만 사용하고, 큰 테이블 순회는 iter_news_pages를 사용합니다.
+        
+        Args:
+            posted_only (bool): 포스팅 완료된 항목만 조회
+            unposted_only (bool): 포스팅되지 않은 항목만 조회
+            page_id (str, optional): 상태 필터를 적용할 페이지/플랫폼 ID
+            limit (int, optional): 조회할 최대 항목 수
+            
+        Returns:
+            list: 뉴스 항목 목록
+        """
+        page_size = min(limit, self.NEWS_PAGE_SIZE) if limit else None
+        
+        news_items = []
+        try:
+            for page in self.iter_news_pages(page_size, posted_only, unposted_only, page_id):
+                news_items.extend(page)
+                if limit and len(news_items) >= limit:
+                    del news_items[limit:]
+                    break
+        except Exception:
+            # 일부만 조회된 목록은 반환하지 않음 (오류는 iter_news_pages에서 기록)
+            return []
+        
+        logger.info(f"{len(news_items)}개의 뉴스 항목을 조회했습니다.")
+        return news_items
+    
+    def _build_fts_query(self, query):
+        """
+        사용자 검색어를 FTS5 MATCH 식으로 변환
+        
+        공백으로 나눈 각 단어를 큰따옴표로 감싸 연산자로 해석되지 않게 하고,
+        조사가 붙은 단어도 찾도록 접두어 검색(*)으로 만든 뒤 AND로 연결합니다.
+        """
+        terms = []
+        for term in query.split():
+            term = term.replace('"', '""')
+            terms.append(f'"{term}"*')
+        return " ".join(terms)
+    
+    def search_news(self, query, limit=100, platform_filter=None):
+        """
+        제목/500자 요약 전문 검색 (관련도 순)
+        
+        Args:
+            query (str): 검색어 (공백으로 구분된 모든 단어를 포함하는 항목 검색)
+            limit (int): 최대 결과 수
+            platform_filter (tuple, optional): (플랫폼 ID, 게시 여부) - 예: ("threads", False)는
+                                               Threads에 아직 게시되지 않은 항목만 검색
+            
+        Returns:
+            list: 뉴스 항목 목록 (get_news_items와 같은 형식, 제목 일치를 요약 일치보다 우선)
+        """
+        if not query or not query.strip():
+            return []
+        
+        try:
+            posted_only = unposted_only = False
+            page_id = None
+            if platform_filter:
+                page_id, posted = platform_filter
+                posted_only = bool(posted)
+                unposted_only = not posted
+            where_clauses, params = self._build_news_filters(posted_only, unposted_only, page_id)
+            
+            cursor = self.get_connection().cursor()
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'"
+            )
+            
+            if cursor.fetchone():
+                # 제목 일치에 가중치 (bm25 값이 작을수록 관련도 높음)
+                sql = """
+                    SELECT n.id FROM news_fts
+                    JOIN news_data n ON n.id = news_fts.rowid
+                    WHERE news_fts MATCH ?
+                """
+                sql_params = [self._build_fts_query(query)]
+                order_by = " ORDER BY bm25(news_fts, 10.0, 1.0), n.id DESC"
+            else:
+                # FTS5를 사용할 수 없는 경우 LIKE 검색 (최신순)
+                sql = "SELECT n.id FROM news_data n WHERE 1 = 1"
+                sql_params = []
+                for term in query.split():
+                    sql += " AND (n.title LIKE ? OR n.summary_500 LIKE ?)"
+                    sql_params.extend([f"%{term}%", f"%{term}%"])
+                order_by = " ORDER BY n.id DESC"
+            
+            if where_clauses:
+                sql += " AND " + " AND ".join(where_clauses)
+            sql += order_by + " LIMIT ?"
+            
+            cursor.execute(sql, sql_params + params + [limit])
+            ranked_ids = [row[0] for row in cursor.fetchall()]
+            
+            # 상세 정보는 ID로 한 번에 조회한 뒤 관련도 순서로 정렬
+            rank = {news_id: idx for idx, news_id in enumerate(ranked_ids)}
+            news_items = self.get_news_items_by_ids(ranked_ids)
+            news_items.sort(key=lambda item: rank[item["id"]])
+            
+            logger.info(f"검색어 '{query}': {len(news_items)}개 항목 검색됨")
             return news_items
             
         except Exception as e:
-            logger.error(f"뉴스 항목 조회 중 오류: {e}")
+            logger.error(f"뉴스 검색 중 오류: {e}")
+            return []
+    
+    def get_news_items_by_ids(self, news_ids):
+        """
+        ID 목록에 해당하는 뉴스 항목 조회 (ID 내림차순)
+        
+        Args:
+            news_ids (list): 뉴스 ID 목록
+            
+        Returns:
+            list: 뉴스 항목 목록
+        """
+        news_items = []
+        try:
+            for page in self.iter_news_pages(news_ids=news_ids):
+                news_items.extend(page)
+        except Exception:
+            # 일부만 조회된 목록은 반환하지 않음 (오류는 iter_news_pages에서 기록)
+            return []
+        return news_items
+    
+    def count_news_items(self):
+        """전체 뉴스 항목 수 조회"""
+        try:
+            cursor = self.get_connection().cursor()
+            cursor.execute("SELECT COUNT(*) FROM news_data")
+            return cursor.fetchone()[0]
+        except Exception as e:
+            logger.error(f"뉴스 항목 수 조회 중 오류: {e}")
+            return 0
+    
+    def get_posting_page_ids(self):
+        """포스팅 상태가 기록된 페이지/플랫폼 ID 목록 조회 (내보내기 열 구성용)"""
+        try:
+            cursor = self.get_connection().cursor()
+            cursor.execute(
+                "SELECT DISTINCT page_id FROM posting_status WHERE page_id IS NOT NULL ORDER BY page_id"
+            )
+            return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"포스팅 페이지 목록 조회 중 오류: {e}")
             return []
     
     def get_unposted_items_by_page(self, page_id):
@@ -542,7 +1617,14 @@ class DatabaseManager:
             cursor.execute("SELECT image_path FROM news_data WHERE id = ?", (news_id,))
             row = cursor.fetchone()
             
+            # 저장소 이미지는 다른 항목과 공유할 수 있으므로 참조가 없어졌을 때만 삭제
+            stored_image = None
             if row and row['image_path']:
+                cursor.execute("SELECT path FROM image_store WHERE path = ?", (row['image_path'],))
+                if cursor.fetchone():
+                    stored_image = row['image_path']
+            
+            if row and row['image_path'] and not stored_image:
                 image_path = row['image_path']
                 # 이미지 파일 삭제
                 if os.path.exists(image_path):
@@ -561,36 +1643,38 @@ class DatabaseManager:
             # 포스팅 상태 삭제
             cursor.execute("DELETE FROM posting_status WHERE news_id = ?", (news_id,))
             
-            # 뉴스 항목 삭제
+            # 뉴스 항목 삭제 (저장소 이미지 참조 수는 트리거로 감소)
             cursor.execute("DELETE FROM news_data WHERE id = ?", (news_id,))
             
             conn.commit()
             logger.info(f"뉴스 항목이 삭제되었습니다. ID: {news_id}")
+            
+            if stored_image:
+                self.prune_unreferenced_images(paths=[stored_image])
             return True
             
         except Exception as e:
             logger.error(f"뉴스 항목 삭제 중 오류: {e}")
             return False
     
+    def _write_processed_title(self, cursor, title):
+        """처리된 제목 INSERT (지연 쓰기 스레드에서 실행)"""
+        processed_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        cursor.execute(
+            "INSERT OR IGNORE INTO processed_titles (title, processed_date) VALUES (?, ?)",
+            (title, processed_date)
+        )
+        return True
+    
+    def queue_processed_title(self, title):
+        """처리된 제목 추가를 지연 쓰기 큐에 등록 (WriteHandle 반환)"""
+        return self.submit_write(self._write_processed_title, title)
+    
     def add_processed_title(self, title):
-        """처리된 제목 추가"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            processed_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            cursor.execute(
-                "INSERT OR IGNORE INTO processed_titles (title, processed_date) VALUES (?, ?)",
-                (title, processed_date)
-            )
-            
-            conn.commit()
-            return True
-            
-        except Exception as e:
-            logger.error(f"처리된 제목 추가 중 오류: {e}")
-            return False
+        """처리된 제목 추가 (커밋될 때까지 대기)"""
+        handle = self.queue_processed_title(title)
+        return bool(self._wait_write(handle, "처리된 제목 추가 중 오류"))
 
     def delete_processed_title(self, title):
         """처리된 제목 삭제"""
@@ -621,6 +1705,36 @@ class DatabaseManager:
             logger.error(f"제목 처리 확인 중 오류: {e}")
             return False
     
+    def find_processed_titles(self, titles):
+        """
+        주어진 제목 중 이미 처리된 제목 조회 (항목마다 is_title_processed를 호출하지 않도록 한 번에 확인)
+        
+        Args:
+            titles (list): 확인할 제목 목록
+            
+        Returns:
+            set: 이미 처리된 제목 집합
+        """
+        processed = set()
+        titles = list(dict.fromkeys(titles))
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(titles), 500):
+                chunk = titles[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT title FROM processed_titles WHERE title IN ({placeholders})", chunk)
+                processed.update(row['title'] for row in cursor.fetchall())
+            
+            return processed
+            
+        except Exception as e:
+            logger.error(f"처리된 제목 조회 중 오류: {e}")
+            return processed
+    
     def get_processed_titles(self):
         """처리된 제목 목록 조회"""
         try:
@@ -636,83 +1750,590 @@ class DatabaseManager:
             logger.error(f"처리된 제목 목록 조회 중 오류: {e}")
             return []
     
-    def convert_excel_to_db(self, excel_path):
-        """엑셀 데이터를 데이터베이스로 변환"""
+    def _iter_import_rows(self, source_path):
+        """
+        가져올 파일의 행을 {열 이름: 값} 사전으로 하나씩 반환 (전체 파일을 메모리에 올리지 않음)
+        
+        Returns:
+            tuple: (행 생성기, 전체 행 수 또는 None)
+        """
+        extension = os.path.splitext(source_path)[1].lower()
+        
+        if extension == ".csv":
+            def csv_rows():
+                with open(source_path, "r", encoding="utf-8-sig", newline="") as f:
+                    yield from csv.DictReader(f)
+            return csv_rows(), None
+        
+        if extension in (".xlsx", ".xlsm"):
+            # 읽기 전용 모드는 시트를 행 단위로 읽음
+            from openpyxl import load_workbook
+            
+            workbook = load_workbook(source_path, read_only=True, data_only=True)
+            sheet = workbook.worksheets[0]
+            total_rows = sheet.max_row - 1 if sheet.max_row else None
+            
+            def xlsx_rows():
+                try:
+                    rows = sheet.iter_rows(values_only=True)
+                    header = next(rows, None)
+                    if not header:
+                        return
+                    header = [str(name).strip() if name is not None else "" for name in header]
+                    for values in rows:
+                        if values is None or all(value is None for value in values):
+                            continue
+                        yield dict(zip(header, values))
+                finally:
+                    workbook.close()
+            return xlsx_rows(), total_rows
+        
+        # 구형 .xls 등은 행 단위 읽기를 지원하지 않으므로 pandas로 한 번에 읽음
+        logger.warning(f"행 단위로 읽을 수 없는 형식이라 전체를 읽어 가져옵니다: {source_path}")
+        df = pd.read_excel(source_path, dtype=object)
+        df = df.where(pd.notna(df), None)
+        return (row for row in df.to_dict("records")), len(df)
+    
+    def _import_value(self, value, default=""):
+        """가져온 셀 값을 DB 저장용 문자열로 변환"""
+        if value is None:
+            return default
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(value, float) and value != value:  # NaN
+            return default
+        value = str(value)
+        return value if value.strip() else default
+    
+    def _write_import_chunk(self, cursor, rows, merge):
+        """
+        가져온 행 묶음을 executemany로 추가 (병합 모드에서는 같은 제목이 있으면 건너뜀)
+        
+        Returns:
+            int: 추가한 뉴스 항목 수
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        if merge:
+            # 이미 있는 제목 확인 (title 인덱스 사용, 파라미터 수 제한 고려해 나눠 조회)
+            titles = list({self._import_value(row.get("게시물 제목")) for row in rows})
+            existing_titles = set()
+            for i in range(0, len(titles), 500):
+                part = titles[i:i + 500]
+                cursor.execute(
+                    f"SELECT title FROM news_data WHERE title IN ({', '.join('?' for _ in part)})",
+                    part
+                )
+                existing_titles.update(row[0] for row in cursor.fetchall())
+        
+        # 상태 행에 뉴스 ID가 필요하므로 ID를 직접 지정해 한 번에 추가
+        cursor.execute(
+            "SELECT MAX(COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'news_data'), 0), "
+            "COALESCE((SELECT MAX(id) FROM news_data), 0))"
+        )
+        next_id = cursor.fetchone()[0] + 1
+        
+        news_rows = []
+        status_rows = []
+        for row in rows:
+            title = self._import_value(row.get("게시물 제목"))
+            if merge:
+                if title in existing_titles:
+                    continue
+                existing_titles.add(title)
+            
+            news_id = next_id
+            next_id += 1
+            news_rows.append((
+                news_id,
+                self._import_value(row.get("카테고리")),
+                title,
+                self._import_value(row.get("복사링크")),
+                self._import_value(row.get("원본링크")),
+                self._import_value(row.get("수집 날짜"), now),
+                self._import_value(row.get("이미지 경로")),
+                self._import_value(row.get("500자 요약")),
+                self._import_value(row.get("포스팅 시간"))
+            ))
+            
+            # 페이지별 상태 추가
+            for col, status in row.items():
+                if not isinstance(col, str) or not col.startswith("페이스북_상태_"):
+                    continue
+                status = self._import_value(status)
+                if not status:
+                    continue
+                
+                page_id = col.replace("페이스북_상태_", "")
+                
+                # 페이지 이름 추출 시도
+                page_name = "알 수 없는 페이지"
+                if "(" in status and ")" in status:
+                    try:
+                        page_name = status.split("(")[1].split(",")[0].strip()
+                    except IndexError:
+                        pass
+                
+                state = self._posting_state_from_status(status)
+                status_rows.append((
+                    news_id,
+                    page_id if page_id == "threads" else "facebook",
+                    page_id,
+                    page_name,
+                    status,
+                    now,
+                    state,
+                    0 if state == self.POST_STATE_PENDING else 1
+                ))
+        
+        cursor.executemany(
+            """
+            INSERT INTO news_data 
+            (id, category, title, copy_link, original_link, collection_date, image_path, summary_500, posting_time) 
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            news_rows
+        )
+        # 트리거가 만든 미게시 행은 파일의 상태로 대체
+        cursor.executemany(
+            "DELETE FROM posting_status WHERE news_id = ? AND platform_id = ? AND state = ? AND attempt_count = 0",
+            [(row[0], row[1], self.POST_STATE_PENDING) for row in status_rows]
+        )
+        cursor.executemany(
+            """
+            INSERT INTO posting_status 
+            (news_id, platform_id, page_id, page_name, status, post_date, state, attempt_count) 
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            status_rows
+        )
+        
+        return len(news_rows)
+    
+    def start_collection_job(self, urls):
+        """
+        수집 작업 시작 - 같은 URL 목록의 중단된 작업이 있으면 이어서 진행
+        
+        COLLECTION_RESUME_HOURS 안에 갱신된 'running' 작업만 이어받고, 그보다 오래된
+        미완료 작업은 'abandoned'로 표시한 뒤 새 작업을 만듭니다.
+        
+        Args:
+            urls (list): 수집할 URL 목록
+            
+        Returns:
+            tuple: (작업 ID, 이미 완료한 URL 집합, 이전 실행의 새 항목 수) - 실패 시 (None, set(), 0)
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            url_list = json.dumps(list(urls), ensure_ascii=False)
+            now = datetime.now()
+            now_text = now.strftime("%Y-%m-%d %H:%M:%S")
+            
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute(
+                    "SELECT id, url_list, new_items, updated_at FROM collection_jobs "
+                    "WHERE status = 'running' ORDER BY id DESC"
+                )
+                resume_job = None
+                stale_ids = []
+                for job in cursor.fetchall():
+                    try:
+                        age_hours = (now - datetime.strptime(job['updated_at'], "%Y-%m-%d %H:%M:%S")).total_seconds() / 3600
+                    except (TypeError, ValueError):
+                        age_hours = None
+                    
+                    if (resume_job is None and job['url_list'] == url_list
+                            and age_hours is not None and age_hours <= self.COLLECTION_RESUME_HOURS):
+                        resume_job = job
+                    else:
+                        stale_ids.append(job['id'])
+                
+                for job_id in stale_ids:
+                    cursor.execute(
+                        "UPDATE collection_jobs SET status = 'abandoned', updated_at = ? WHERE id = ?",
+                        (now_text, job_id)
+                    )
+                    cursor.execute("DELETE FROM collection_job_items WHERE job_id = ?", (job_id,))
+                
+                if resume_job is not None:
+                    job_id = resume_job['id']
+                    previous_new_items = resume_job['new_items'] or 0
+                    cursor.execute(
+                        "UPDATE collection_jobs SET updated_at = ? WHERE id = ?",
+                        (now_text, job_id)
+                    )
+                    cursor.execute(
+                        "SELECT url FROM collection_job_urls WHERE job_id = ? AND status = 'done'",
+                        (job_id,)
+                    )
+                    done_urls = {row['url'] for row in cursor.fetchall()}
+                else:
+                    cursor.execute(
+                        "INSERT INTO collection_jobs (url_list, status, new_items, started_at, updated_at) "
+                        "VALUES (?, 'running', 0, ?, ?)",
+                        (url_list, now_text, now_text)
+                    )
+                    job_id = cursor.lastrowid
+                    previous_new_items = 0
+                    done_urls = set()
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO collection_job_urls (job_id, url, status, new_items, updated_at) "
+                        "VALUES (?, ?, 'pending', 0, ?)",
+                        [(job_id, url, now_text) for url in urls]
+                    )
+                
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            
+            if resume_job is not None:
+                logger.info(f"중단된 수집 작업 {job_id}을 이어서 진행합니다 (완료한 URL {len(done_urls)}/{len(urls)}개)")
+            return job_id, done_urls, previous_new_items
+            
+        except Exception as e:
+            logger.error(f"수집 작업 시작 기록 중 오류: {e}")
+            return None, set(), 0
+    
+    def get_collection_job_items(self, job_id):
+        """
+        수집 작업의 항목별 처리 결과 조회
+        
+        Returns:
+            dict: {nid: (상태, 시도 횟수)}
+        """
+        try:
+            cursor = self.get_connection().cursor()
+            cursor.execute(
+                "SELECT nid, status, attempts FROM collection_job_items WHERE job_id = ?",
+                (job_id,)
+            )
+            return {row['nid']: (row['status'], row['attempts']) for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"수집 작업 항목 조회 중 오류: {e}")
+            return {}
+    
+    def _write_collection_job_item(self, cursor, job_id, url, nid, title, status):
+        """항목 처리 결과 기록 (지연 쓰기 스레드에서 실행 - 같은 항목은 시도 횟수 증가)"""
+        cursor.execute(
+            """
+            INSERT INTO collection_job_items (job_id, nid, url, title, status, attempts, updated_at)
+            VALUES (?, ?, ?, ?, ?, 1, ?)
+            ON CONFLICT (job_id, nid) DO UPDATE SET
+                status = excluded.status,
+                attempts = collection_job_items.attempts + 1,
+                updated_at = excluded.updated_at
+            """,
+            (job_id, nid, url, title, status, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        )
+        return True
+    
+    def queue_collection_job_item(self, job_id, url, nid, title, status):
+        """
+        항목 처리 결과 기록을 지연 쓰기 큐에 등록
+        
+        수집 결과(queue_news_item)보다 나중에 큐에 넣으므로, 'done' 기록은 해당 뉴스 행과
+        같거나 이후의 트랜잭션으로 커밋됩니다.
+        """
+        return self.submit_write(self._write_collection_job_item, job_id, url, nid, title, status)
+    
+    def _write_collection_job_url(self, cursor, job_id, url, new_items):
+        """URL 완료 기록 (지연 쓰기 스레드에서 실행)"""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cursor.execute(
+            "UPDATE collection_job_urls SET status = 'done', new_items = ?, updated_at = ? WHERE job_id = ? AND url = ?",
+            (new_items, now, job_id, url)
+        )
+        cursor.execute(
+            "UPDATE collection_jobs SET new_items = new_items + ?, updated_at = ? WHERE id = ?",
+            (new_items, now, job_id)
+        )
+        return True
+    
+    def complete_collection_job_url(self, job_id, url, new_items):
+        """URL 완료 기록 (앞서 큐에 들어간 수집 결과와 함께 커밋될 때까지 대기)"""
+        handle = self.submit_write(self._write_collection_job_url, job_id, url, new_items)
+        return bool(self._wait_write(handle, "수집 URL 완료 기록 중 오류"))
+    
+    def finish_collection_job(self, job_id, status="done"):
+        """
+        수집 작업 종료 기록 - 완료된 작업의 항목별 기록은 삭제
+        
+        Args:
+            job_id (int): 작업 ID
+            status (str): 'done' 또는 'abandoned'
+        """
+        try:
+            self.flush()
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE collection_jobs SET status = ?, updated_at = ? WHERE id = ?",
+                (status, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), job_id)
+            )
+            cursor.execute("DELETE FROM collection_job_items WHERE job_id = ?", (job_id,))
+            conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"수집 작업 종료 기록 중 오류: {e}")
+            return False
+    
+    def get_stored_image(self, source_hash):
+        """
+        원본 URL 해시로 저장소 이미지 경로 조회 (파일 시스템은 확인하지 않음)
+        
+        Returns:
+            str: 처리된 이미지 경로 (처리한 적이 없으면 None)
+        """
+        try:
+            cursor = self.get_connection().cursor()
+            cursor.execute(
+                """
+                SELECT i.path FROM image_sources s
+                JOIN image_store i ON i.content_hash = s.content_hash
+                WHERE s.source_hash = ?
+                """,
+                (source_hash,)
+            )
+            row = cursor.fetchone()
+            return row['path'] if row else None
+        except Exception as e:
+            logger.error(f"저장된 이미지 조회 중 오류: {e}")
+            return None
+    
+    def _write_stored_image(self, cursor, content_hash, path, size, source_hash, source_url):
+        """저장소 이미지와 원본 URL 매핑 기록 (지연 쓰기 스레드에서 실행 - 이미 있으면 갱신 시각만 변경)"""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cursor.execute(
+            """
+            INSERT INTO image_store (content_hash, path, size, refcount, created_at, updated_at)
+            VALUES (?, ?, ?, 0, ?, ?)
+            ON CONFLICT (content_hash) DO UPDATE SET updated_at = excluded.updated_at
+            """,
+            (content_hash, path, size, now, now)
+        )
+        if source_hash:
+            cursor.execute(
+                "INSERT OR REPLACE INTO image_sources (source_hash, source_url, content_hash, created_at) VALUES (?, ?, ?, ?)",
+                (source_hash, source_url, content_hash, now)
+            )
+        return True
+    
+    def queue_stored_image(self, content_hash, path, size, source_hash=None, source_url=None):
+        """
+        저장소 이미지 기록을 지연 쓰기 큐에 등록
+        
+        이 이미지를 쓰는 뉴스 항목(queue_news_item)보다 먼저 큐에 넣어야 참조 수 트리거가 적용됩니다.
+        """
+        return self.submit_write(self._write_stored_image, content_hash, path, size, source_hash, source_url)
+    
+    def _remove_store_files(self, cursor, files, started):
+        """
+        정리한 저장소 이미지 파일 삭제 (지연 쓰기 스레드에서 실행 - 기록 추가와 순서가 보장됨)
+        
+        기록을 지운 뒤 같은 내용 해시가 다시 기록됐거나, 정리 시작 후 파일이 다시 저장됐으면
+        (처리 중인 작업자가 곧 기록할 파일) 삭제하지 않습니다.
+        
+        Args:
+            files (list): [(content_hash, path), ...]
+            started (float): 정리 시작 시각 (time.time())
+            
+        Returns:
+            int: 삭제한 파일 수
+        """
+        removed = 0
+        # 파일 시각은 해상도가 거칠어 (FAT 2초, 리눅스 커널 틱) 시작 직전 기록도 보호하도록 여유를 둠
+        cutoff = started - 2
+        for content_hash, path in files:
+            cursor.execute("SELECT 1 FROM image_store WHERE content_hash = ?", (content_hash,))
+            if cursor.fetchone():
+                continue
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"저장소 이미지 파일 삭제 중 오류: {path} - {e}")
+        return removed
+    
+    def prune_unreferenced_images(self, min_age_hours=None, paths=None):
+        """
+        참조하는 뉴스 항목이 없는 저장소 이미지 파일과 기록 삭제
+        
+        Args:
+            min_age_hours (float, optional): 마지막 기록 후 이 시간이 지난 이미지만 삭제 (기본값: IMAGE_ORPHAN_HOURS)
+            paths (list, optional): 지정한 경로만 확인 (뉴스 항목 삭제 직후 - 경과 시간 무시)
+            
+        Returns:
+            int: 삭제한 이미지 수
+        """
+        try:
+            self.flush()
+            started = time.time()
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # 확인과 삭제 사이에 지연 쓰기 스레드가 참조를 추가하지 않도록 쓰기 잠금
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                if paths:
+                    placeholders = ",".join("?" for _ in paths)
+                    cursor.execute(
+                        f"SELECT content_hash, path FROM image_store WHERE refcount <= 0 AND path IN ({placeholders})",
+                        list(paths)
+                    )
+                else:
+                    hours = self.IMAGE_ORPHAN_HOURS if min_age_hours is None else min_age_hours
+                    cutoff = (datetime.now() - timedelta(hours=hours)).strftime("%Y-%m-%d %H:%M:%S")
+                    cursor.execute(
+                        "SELECT content_hash, path FROM image_store WHERE refcount <= 0 AND updated_at < ?",
+                        (cutoff,)
+                    )
+                rows = cursor.fetchall()
+                
+                for row in rows:
+                    cursor.execute("DELETE FROM image_sources WHERE content_hash = ?", (row['content_hash'],))
+                    cursor.execute("DELETE FROM image_store WHERE content_hash = ?", (row['content_hash'],))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            
+            # 파일은 지연 쓰기 스레드에서 삭제 - 그 사이 같은 이미지가 다시 기록됐으면 남김
+            if rows:
+                files = [(row['content_hash'], row['path']) for row in rows]
+                handle = self.submit_write(self._remove_store_files, files, started)
+                removed = self._wait_write(handle, "저장소 이미지 파일 삭제 중 오류")
+                logger.info(f"참조가 없는 저장소 이미지 {len(rows)}개 기록 삭제 (파일 {removed or 0}개 삭제)")
+            return len(rows)
+        except Exception as e:
+            logger.error(f"저장소 이미지 정리 중 오류: {e}")
+            return 0
+    
+    def convert_excel_to_db(self, excel_path, merge=False, progress_callback=None, chunk_size=None):
+        """
+        엑셀/CSV 데이터를 데이터베이스로 가져오기
+        
+        파일을 행 단위로 읽어 chunk_size개씩 하나의 트랜잭션으로 추가합니다.
+        커밋된 행 수는 import_jobs에 함께 기록되므로, 같은 파일을 다시 가져오면
+        중단된 위치부터 이어서 진행합니다.
+        
+        Args:
+            excel_path (str): 엑셀(.xlsx) 또는 CSV 파일 경로
+            merge (bool): True면 기존 데이터를 유지하고 없는 제목만 추가,
+                          False면 기존 뉴스/포스팅 상태를 모두 지우고 가져오기
+            progress_callback (callable, optional): progress_callback(처리한 행 수, 전체 행 수 또는 None)
+            chunk_size (int, optional): 트랜잭션당 행 수 (기본값: IMPORT_CHUNK_SIZE)
+            
+        Returns:
+            bool: 성공 여부
+        """
         try:
             if not os.path.exists(excel_path):
                 logger.warning(f"변환할 엑셀 파일이 없습니다: {excel_path}")
                 return False
             
-            # 엑셀 파일 읽기
-            df = pd.read_excel(excel_path)
+            chunk_size = chunk_size or self.IMPORT_CHUNK_SIZE
+            source_path = os.path.abspath(excel_path)
+            file_stat = os.stat(source_path)
             
-            if df.empty:
+            # 빈 파일이면 기존 데이터를 지우기 전에 중단
+            rows, total_rows = self._iter_import_rows(source_path)
+            first_row = next(rows, None)
+            if first_row is None:
                 logger.warning("엑셀 파일에 데이터가 없습니다.")
                 return False
+            rows = chain([first_row], rows)
             
             conn = self.get_connection()
+            cursor = conn.cursor()
             
-            # 기존 테이블 내용 삭제
-            conn.execute("DELETE FROM news_data")
-            conn.execute("DELETE FROM posting_status")
+            # 같은 파일(크기/수정 시각 동일)의 중단된 작업이 있으면 이어서 진행
+            cursor.execute(
+                "SELECT file_size, file_mtime, merge_mode, rows_done, rows_imported, status "
+                "FROM import_jobs WHERE source_path = ?",
+                (source_path,)
+            )
+            job = cursor.fetchone()
+            resume = (
+                job is not None
+                and job['status'] == "running"
+                and job['file_size'] == file_stat.st_size
+                and job['file_mtime'] == file_stat.st_mtime
+                and bool(job['merge_mode']) == merge
+            )
             
-            # 뉴스 데이터 추가
-            for _, row in df.iterrows():
-                cursor = conn.cursor()
-                
-                # 뉴스 데이터 추가
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if resume:
+                rows_done = job['rows_done']
+                rows_imported = job['rows_imported']
+                logger.info(f"중단된 가져오기를 {rows_done}번째 행부터 이어서 진행합니다: {source_path}")
+            else:
+                rows_done = 0
+                rows_imported = 0
+                cursor.execute("BEGIN IMMEDIATE")
+                if not merge:
+                    # 기존 테이블 내용 삭제
+                    cursor.execute("DELETE FROM posting_status")
+                    cursor.execute("DELETE FROM news_data")
                 cursor.execute(
                     """
-                    INSERT INTO news_data 
-                    (category, title, copy_link, original_link, collection_date, image_path, summary_500, posting_time) 
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    INSERT OR REPLACE INTO import_jobs 
+                    (source_path, file_size, file_mtime, merge_mode, rows_done, rows_imported, status, started_at, updated_at) 
+                    VALUES (?, ?, ?, ?, 0, 0, 'running', ?, ?)
                     """,
-                    (
-                        row.get("카테고리", ""),
-                        row.get("게시물 제목", ""),
-                        row.get("복사링크", ""),
-                        row.get("원본링크", ""),
-                        row.get("수집 날짜", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-                        row.get("이미지 경로", ""),
-                        row.get("500자 요약", ""),
-                        row.get("포스팅 시간", "")
-                    )
+                    (source_path, file_stat.st_size, file_stat.st_mtime, int(merge), now, now)
                 )
+                conn.commit()
+            
+            resume_offset = rows_done
+            skipped = 0
+            chunk = []
+            
+            def commit_chunk():
+                nonlocal rows_done, rows_imported
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    rows_imported += self._write_import_chunk(cursor, chunk, merge)
+                    rows_done += len(chunk)
+                    # 진행 위치는 데이터와 같은 트랜잭션으로 기록
+                    cursor.execute(
+                        "UPDATE import_jobs SET rows_done = ?, rows_imported = ?, updated_at = ? WHERE source_path = ?",
+                        (rows_done, rows_imported, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), source_path)
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                chunk.clear()
+                if progress_callback:
+                    progress_callback(rows_done, total_rows)
+            
+            for row in rows:
+                # 이미 커밋된 행은 건너뜀
+                if skipped < resume_offset:
+                    skipped += 1
+                    continue
                 
-                news_id = cursor.lastrowid
-                
-                # 페이지별 상태 추가
-                for col in row.index:
-                    if col.startswith("페이스북_상태_"):
-                        page_id = col.replace("페이스북_상태_", "")
-                        status = row[col]
-                        
-                        if status and isinstance(status, str) and status.strip():
-                            # 페이지 이름 추출 시도
-                            page_name = "알 수 없는 페이지"
-                            if "(" in status and ")" in status:
-                                try:
-                                    page_name = status.split("(")[1].split(",")[0].strip()
-                                except:
-                                    pass
-                            
-                            cursor.execute(
-                                """
-                                INSERT INTO posting_status 
-                                (news_id, page_id, page_name, status, post_date) 
-                                VALUES (?, ?, ?, ?, ?)
-                                """,
-                                (
-                                    news_id,
-                                    page_id,
-                                    page_name,
-                                    status,
-                                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                                )
-                            )
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    commit_chunk()
             
+            if chunk:
+                commit_chunk()
+            
+            cursor.execute(
+                "UPDATE import_jobs SET status = 'done', updated_at = ? WHERE source_path = ?",
+                (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), source_path)
+            )
             conn.commit()
-            logger.info(f"{len(df)}개의 엑셀 데이터가 데이터베이스로 변환되었습니다.")
+            
+            logger.info(f"{rows_done}개의 엑셀 행 중 {rows_imported}개 항목이 데이터베이스로 변환되었습니다.")
             return True
             
         except Exception as e:
@@ -724,11 +2345,19 @@ class DatabaseManager:
     def export_to_dataframe(self):
         """데이터베이스 내용을 pandas DataFrame으로 변환"""
         try:
-            # 뉴스 데이터 조회
-            news_items = self.get_news_items()
+            # 뉴스 데이터를 페이지 단위로 조회해 페이지별 DataFrame으로 변환
+            frames = []
+            for page in self.iter_news_pages():
+                # 내부용 플랫폼 상태 사전은 내보내기 열에서 제외
+                for item in page:
+                    item.pop("플랫폼_상태", None)
+                frames.append(pd.DataFrame(page))
+            
+            if not frames:
+                return pd.DataFrame()
             
             # DataFrame 생성
-            df = pd.DataFrame(news_items)
+            df = pd.concat(frames, ignore_index=True)
             
             return df
             
@@ -736,121 +2365,182 @@ class DatabaseManager:
             logger.error(f"DataFrame 변환 중 오류: {e}")
             return pd.DataFrame()
     
-    def backup_database(self, backup_path=None):
-        """데이터베이스 백업 (필요한 경우에만 실행)"""
-        # 데이터베이스 사용 기간이 일정 시간 이상인 경우에만 백업
-        # 또는 환경 변수나 설정으로 백업 활성화 여부 제어
+    def backup_database(self, backup_path=None, compress=None, progress_callback=None):
+        """
+        데이터베이스 온라인 백업
         
-        # 백업 비활성화 옵션: True로 설정하면 백업하지 않음
-        disable_backup = False  # 여기를 True로 변경하면 백업이 생성되지 않음
+        SQLite 백업 API로 BACKUP_PAGES_PER_STEP 페이지씩 복사하고 단계 사이에 쉬므로
+        수집/게시 작업의 쓰기를 막지 않습니다. 원본에서 읽기 트랜잭션을 유지해
+        백업 중 다른 연결의 쓰기가 있어도 처음부터 다시 복사하지 않고 시작 시점의
+        스냅샷을 복사합니다. 복사본은 PRAGMA integrity_check로 검증한 뒤 보관합니다.
         
-        if disable_backup:
-            logger.info("데이터베이스 백업이 비활성화되었습니다.")
-            return False
+        Args:
+            backup_path (str, optional): 백업 파일 경로 (기본값: data/backup/newspick_data_<시각>.db)
+            compress (bool, optional): gzip 압축 여부 (기본값: BACKUP_COMPRESS)
+            progress_callback (callable, optional): progress_callback(복사한 페이지 수, 전체 페이지 수)
+            
+        Returns:
+            str: 생성된 백업 파일 경로 (실패 시 None)
+        """
+        if compress is None:
+            compress = self.BACKUP_COMPRESS
+        
+        use_retention = backup_path is None
+        if backup_path is None:
+            # 기본 백업 경로 생성
+            backup_dir = os.path.join(self.data_dir, "backup")
+            os.makedirs(backup_dir, exist_ok=True)
+            
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_path = os.path.join(backup_dir, f"newspick_data_{timestamp}.db")
+        
+        temp_path = backup_path + ".tmp"
+        source_conn = None
+        backup_conn = None
         
         try:
-            if self.connection:
-                self.connection.commit()
-                
-            if backup_path is None:
-                # 기본 백업 경로 생성
-                backup_dir = os.path.join(self.data_dir, "backup")
-                os.makedirs(backup_dir, exist_ok=True)
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_path = os.path.join(backup_dir, f"newspick_data_{timestamp}.db")
+            # 이전에 중단된 백업의 임시 파일 정리
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            
+            source_conn = self._open_connection()
+            backup_conn = sqlite3.connect(temp_path)
             
-            # pragmas 설정으로 안전한 백업
-            source_conn = sqlite3.connect(self.db_path)
-            source_conn.execute("PRAGMA foreign_keys=OFF")
-            source_conn.execute("PRAGMA journal_mode=DELETE")
+            # 읽기 트랜잭션으로 스냅샷 고정 (WAL 모드에서는 쓰기를 막지 않음)
+            source_conn.execute("BEGIN")
+            source_conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
             
-            # 백업 실행
-            backup_conn = sqlite3.connect(backup_path)
-            source_conn.backup(backup_conn)
+            step_sleep = self.BACKUP_STEP_SLEEP_MS / 1000
             
+            def on_progress(status, remaining, total):
+                if progress_callback:
+                    progress_callback(total - remaining, total)
+                if remaining:
+                    time.sleep(step_sleep)
+            
+            source_conn.backup(backup_conn, pages=self.BACKUP_PAGES_PER_STEP, progress=on_progress)
+            source_conn.rollback()
+            
+            # 복사본 검증
+            result = backup_conn.execute("PRAGMA integrity_check").fetchone()[0]
             backup_conn.close()
-            source_conn.close()
+            backup_conn = None
+            
+            if result != "ok":
+                logger.error(f"백업 파일 무결성 검사 실패: {result}")
+                os.remove(temp_path)
+                return None
+            
+            if compress:
+                backup_path += ".gz"
+                with open(temp_path, "rb") as src, gzip.open(backup_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, backup_path)
             
             logger.info(f"데이터베이스가 백업되었습니다: {backup_path}")
-            return True
+            
+            if use_retention:
+                self.prune_backups(os.path.dirname(backup_path))
+            
+            return backup_path
             
         except Exception as e:
             logger.error(f"데이터베이스 백업 중 오류: {e}")
-            return False
-
-    def update_database_for_thread_columns(self):
-        """쓰레드 관련 열을 데이터베이스에 추가"""
+            if backup_conn:
+                backup_conn.close()
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return None
+        
+        finally:
+            if source_conn:
+                source_conn.close()
+    
+    def start_background_backup(self, compress=None, callback=None):
+        """
+        백그라운드 스레드에서 백업 실행
+        
+        Args:
+            compress (bool, optional): gzip 압축 여부 (기본값: BACKUP_COMPRESS)
+            callback (callable, optional): 완료 시 callback(백업 파일 경로 또는 None) 호출
+            
+        Returns:
+            bool: 백업을 시작했으면 True (이미 실행 중이면 False)
+        """
+        with self._backup_lock:
+            if self._backup_thread and self._backup_thread.is_alive():
+                logger.info("데이터베이스 백업이 이미 실행 중입니다.")
+                return False
+            
+            def run_backup():
+                backup_path = self.backup_database(compress=compress)
+                if callback:
+                    callback(backup_path)
+            
+            self._backup_thread = threading.Thread(target=run_backup, name="DatabaseBackup", daemon=True)
+            self._backup_thread.start()
+            return True
+    
+    def prune_backups(self, backup_dir=None, keep=None):
+        """
+        보관 개수를 넘는 오래된 백업 파일 삭제
+        
+        Args:
+            backup_dir (str, optional): 백업 디렉토리 (기본값: data/backup)
+            keep (int, optional): 보관할 최신 백업 수 (기본값: BACKUP_RETENTION_COUNT)
+            
+        Returns:
+            int: 삭제한 파일 수
+        """
+        backup_dir = backup_dir or os.path.join(self.data_dir, "backup")
+        keep = self.BACKUP_RETENTION_COUNT if keep is None else keep
+        
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            # 파일명에 시각이 들어가므로 이름순 정렬이 생성 순서
+            backups = sorted(
+                name for name in os.listdir(backup_dir)
+                if name.startswith("newspick_data_") and name.endswith((".db", ".db.gz"))
+            )
             
-            # 새로운 열 추가 (존재하지 않을 경우에만)
-            new_columns = [
-                "thread1 TEXT DEFAULT ''",
-                "thread2 TEXT DEFAULT ''",
-                "thread3 TEXT DEFAULT ''", 
-                "thread4 TEXT DEFAULT ''",
-                "thread5 TEXT DEFAULT ''",
-                "created_status TEXT DEFAULT ''"
-            ]
-            
-            # 각 열이 있는지 확인하고 없으면 추가
-            for column_def in new_columns:
-                column_name = column_def.split()[0]
-                try:
-                    # 열 존재 여부 확인
-                    cursor.execute(f"SELECT {column_name} FROM news_data LIMIT 1")
-                except:
-                    # 열이 없으면 추가
-                    cursor.execute(f"ALTER TABLE news_data ADD COLUMN {column_def}")
-                    # 전역 logger 변수 사용
-                    print(f"news_data 테이블에 {column_name} 열 추가됨")
+            removed_count = 0
+            for name in backups[:max(len(backups) - keep, 0)]:
+                os.remove(os.path.join(backup_dir, name))
+                removed_count += 1
             
-            conn.commit()
-            print("쓰레드 관련 열 추가 완료")
+            # 프로그램 종료 등으로 중단된 백업의 임시 파일 삭제 (최근에 수정된 파일은 진행 중인 백업일 수 있음)
+            cutoff = time.time() - self.BACKUP_TEMP_MAX_AGE_HOURS * 3600
+            for name in os.listdir(backup_dir):
+                if name.startswith("newspick_data_") and name.endswith(".tmp"):
+                    temp_path = os.path.join(backup_dir, name)
+                    if os.path.getmtime(temp_path) < cutoff:
+                        os.remove(temp_path)
+            
+            if removed_count:
+                logger.info(f"오래된 백업 {removed_count}개를 삭제했습니다.")
+            return removed_count
+            
+        except Exception as e:
+            logger.error(f"백업 정리 중 오류: {e}")
+            return 0
+
+    def update_database_for_thread_columns(self):
+        """쓰레드 관련 열을 데이터베이스에 추가 (스키마 마이그레이션으로 처리)"""
+        try:
+            self.migrate_database()
             return True
-                
         except Exception as e:
-            # 전역 logger 변수 사용
-            print(f"쓰레드 열 추가 중 오류: {e}")
+            logger.error(f"쓰레드 열 추가 중 오류: {e}")
             return False
 
     def update_database_for_threads(self):
-        """Threads SNS 기능을 위한 데이터베이스 업데이트"""
+        """Threads SNS 기능을 위한 데이터베이스 업데이트 (스키마 마이그레이션으로 처리)"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # 포스팅 상태 테이블에 platform 필드 추가 확인
-            try:
-                cursor.execute("SELECT platform_id FROM posting_status LIMIT 1")
-            except:
-                # platform_id 필드가 없으면 추가
-                cursor.execute("ALTER TABLE posting_status ADD COLUMN platform_id TEXT DEFAULT 'facebook'")
-                logger.info("posting_status 테이블에 platform_id 필드 추가")
-                
-            # threads 설정 테이블 추가
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS threads_settings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                account_name TEXT,
-                login_time TEXT,
-                auto_post BOOLEAN DEFAULT 0,
-                post_interval INTEGER DEFAULT 60,
-                max_posts_per_run INTEGER DEFAULT 5
-            )
-            ''')
-            
-            # 기본 설정값 추가 (없는 경우에만)
-            cursor.execute("SELECT COUNT(*) FROM threads_settings")
-            if cursor.fetchone()[0] == 0:
-                cursor.execute(
-                    "INSERT INTO threads_settings (account_name, login_time, auto_post, post_interval, max_posts_per_run) VALUES (?, ?, ?, ?, ?)",
-                    ("", "", 0, 60, 5)
-                )
-            
-            conn.commit()
+            self.migrate_database()
             logger.info("Threads SNS 기능을 위한 데이터베이스 업데이트 완료")
             return True
             
@@ -990,20 +2680,40 @@ class DatabaseManager:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
-            query = """
-                SELECT n.id, n.category, n.title, n.copy_link, n.original_link, 
-                    n.collection_date, n.image_path, n.summary_500, n.posting_time
-                FROM news_data n
-                WHERE NOT EXISTS (
-                    SELECT 1 FROM posting_status ps 
-                    WHERE ps.news_id = n.id 
-                    AND ps.platform_id = ? 
-                    AND ps.status LIKE '%포스팅 완료%'
-                )
-                ORDER BY n.id DESC
-            """
-            
-            params = [platform_id]
+            if platform_id in self.QUEUED_POSTING_PLATFORMS:
+                # 모든 항목에 상태 행이 있으므로 인덱스에서 게시 완료가 아닌 상태 범위만 조회
+                query = """
+                    SELECT n.id, n.category, n.title, n.copy_link, n.original_link, 
+                        n.collection_date, n.image_path, n.summary_500, n.posting_time
+                    FROM posting_status ps
+                    JOIN news_data n ON n.id = ps.news_id
+                    WHERE ps.platform_id = ? AND ps.state IN (?, ?, ?)
+                    AND NOT EXISTS (
+                        SELECT 1 FROM posting_status done
+                        WHERE done.news_id = ps.news_id AND done.platform_id = ps.platform_id AND done.state = ?
+                    )
+                    ORDER BY ps.news_id DESC
+                """
+                params = [
+                    platform_id,
+                    self.POST_STATE_PENDING, self.POST_STATE_IN_PROGRESS, self.POST_STATE_FAILED,
+                    self.POST_STATE_POSTED
+                ]
+            else:
+                # 상태 행을 미리 만들지 않는 플랫폼은 한 번도 시도하지 않은 항목까지 포함하도록 전체 확인
+                query = """
+                    SELECT n.id, n.category, n.title, n.copy_link, n.original_link, 
+                        n.collection_date, n.image_path, n.summary_500, n.posting_time
+                    FROM news_data n
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM posting_status ps 
+                        WHERE ps.news_id = n.id 
+                        AND ps.platform_id = ? 
+                        AND ps.state = ?
+                    )
+                    ORDER BY n.id DESC
+                """
+                params = [platform_id, self.POST_STATE_POSTED]
             
             if limit:
                 query += " LIMIT ?"
@@ -1033,67 +2743,102 @@ class DatabaseManager:
             logger.error(f"{platform_id} 플랫폼용 미게시 항목 조회 중 오류: {e}")
             return []
 
-    def update_posting_status(self, news_id, platform_id, platform_name, status):
+    def _posting_state_from_status(self, status):
+        """상태 메시지로 포스팅 state 추정 (state를 지정하지 않은 기존 호출용)"""
+        if "포스팅 완료" in status:
+            return self.POST_STATE_POSTED
+        if "실패" in status or "오류" in status:
+            return self.POST_STATE_FAILED
+        return self.POST_STATE_PENDING
+
+    def _write_posting_status(self, cursor, news_id, platform_id, platform_name, status, state=None):
+        """
+        포스팅 상태 UPDATE 후 없으면 INSERT (지연 쓰기 스레드에서 실행)
+        
+        post_date는 게시 완료(POSTED)일 때만 기록하고, 시작/실패 시각은 last_attempt_date에 기록합니다.
         """
-        포스팅 상태 업데이트 (플랫폼 지정 버전)
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if state is None:
+            state = self._posting_state_from_status(status)
+        
+        # 시도 횟수는 게시 시작 시 1 증가 (시작 기록 없이 완료/실패가 기록된 경우에도 1회로 계산)
+        is_attempt = state == self.POST_STATE_IN_PROGRESS
+        is_result = state in (self.POST_STATE_POSTED, self.POST_STATE_FAILED)
+        is_posted = state == self.POST_STATE_POSTED
+        
+        # 기존 상태 업데이트 (없으면 새로 추가) - 별도 SELECT 없이 처리
+        cursor.execute(
+            """
+            UPDATE posting_status 
+            SET status = ?, post_date = CASE WHEN ? THEN ? ELSE post_date END, state = ?,
+                attempt_count = attempt_count + CASE
+                    WHEN ? THEN 1
+                    WHEN ? AND state != ? THEN 1
+                    ELSE 0
+                END,
+                last_attempt_date = CASE WHEN ? OR ? THEN ? ELSE last_attempt_date END
+            WHERE news_id = ? AND platform_id = ?
+            """,
+            (status, is_posted, now, state,
+             is_attempt, is_result, self.POST_STATE_IN_PROGRESS,
+             is_attempt, is_result, now,
+             news_id, platform_id)
+        )
+        
+        if cursor.rowcount == 0:
+            attempted = is_attempt or is_result
+            cursor.execute(
+                """
+                INSERT INTO posting_status 
+                (news_id, platform_id, page_id, page_name, status, post_date, state, attempt_count, last_attempt_date) 
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (news_id, platform_id, platform_id, platform_name, status, now if is_posted else None, state,
+                 1 if attempted else 0, now if attempted else None)
+            )
+        
+        # 포스팅 시간 업데이트
+        if is_posted:
+            cursor.execute(
+                "UPDATE news_data SET posting_time = ? WHERE id = ?",
+                (now, news_id)
+            )
+        
+        logger.info(f"포스팅 상태 업데이트: 뉴스 ID: {news_id}, 플랫폼: {platform_name}, 상태: {status}")
+        return True
+    
+    def queue_posting_status(self, news_id, platform_id, platform_name, status, state=None):
+        """포스팅 상태 업데이트를 지연 쓰기 큐에 등록 (WriteHandle 반환)"""
+        return self.submit_write(self._write_posting_status, news_id, platform_id, platform_name, status, state)
+
+    def update_posting_status(self, news_id, platform_id, platform_name, status, state=None):
+        """
+        포스팅 상태 업데이트 (플랫폼 지정 버전, 커밋될 때까지 대기)
         
         Args:
             news_id (int): 뉴스 항목 ID
             platform_id (str): 플랫폼 ID
             platform_name (str): 플랫폼 이름
             status (str): 상태 메시지
+            state (int, optional): POST_STATE_* 값 (생략 시 상태 메시지로 판단)
             
         Returns:
             bool: 성공 여부
         """
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            post_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # 기존 상태 확인
-            cursor.execute(
-                "SELECT id FROM posting_status WHERE news_id = ? AND platform_id = ?",
-                (news_id, platform_id)
-            )
-            result = cursor.fetchone()
-            
-            if result:
-                # 기존 상태 업데이트
-                cursor.execute(
-                    """
-                    UPDATE posting_status 
-                    SET status = ?, post_date = ? 
-                    WHERE news_id = ? AND platform_id = ?
-                    """,
-                    (status, post_date, news_id, platform_id)
-                )
-            else:
-                # 새 상태 추가
-                cursor.execute(
-                    """
-                    INSERT INTO posting_status 
-                    (news_id, platform_id, page_id, page_name, status, post_date) 
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (news_id, platform_id, platform_id, platform_name, status, post_date)
-                )
-            
-            # 포스팅 시간 업데이트
-            if "포스팅 완료" in status:
-                cursor.execute(
-                    "UPDATE news_data SET posting_time = ? WHERE id = ?",
-                    (post_date, news_id)
-                )
-            
-            conn.commit()
-            logger.info(f"포스팅 상태 업데이트: 뉴스 ID: {news_id}, 플랫폼: {platform_name}, 상태: {status}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"포스팅 상태 업데이트 중 오류: {e}")
-            return False
+        handle = self.queue_posting_status(news_id, platform_id, platform_name, status, state)
+        return bool(self._wait_write(handle, "포스팅 상태 업데이트 중 오류"))
+
+    def mark_posting_started(self, news_id, platform_id, platform_name):
+        """게시 시작 기록 (state: 진행 중, 시도 횟수 1 증가)"""
+        return self.update_posting_status(
+            news_id, platform_id, platform_name, "포스팅 중", self.POST_STATE_IN_PROGRESS
+        )
+
+    def mark_posting_failed(self, news_id, platform_id, platform_name, message="포스팅 실패"):
+        """게시 실패 기록 (state: 실패, 메시지는 status 열에 보관)"""
+        return self.update_posting_status(
+            news_id, platform_id, platform_name, message, self.POST_STATE_FAILED
+        )
 
     def get_posting_status(self, news_id, platform_id='threads'):
         """
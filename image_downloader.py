@@ -0,0 +1,272 @@
+# image_downloader.py
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class ImageDownloader:
+    """
+    이미지 다운로드 전용 HTTP 클라이언트
+
+    호스트별 연결 풀을 유지하는 세션으로 연결을 재사용하고, 응답은 나눠서 읽으며
+    크기 제한을 넘거나 이미지가 아닌 응답은 본문을 다 받기 전에 중단합니다.
+    ETag/Last-Modified가 있는 응답은 디스크 캐시에 보관했다가 조건부 요청으로
+    바뀌지 않았으면 (304) 다시 받지 않고 캐시 본문을 사용합니다.
+    """
+
+    REQUEST_TIMEOUT = 10
+    # 연결 풀 - 풀을 유지할 호스트 수, 호스트당 최대 연결 수
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 8
+    # 이미지 한 개의 최대 크기 (바이트)
+    MAX_BYTES = 15 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
+    # 디스크 캐시 최대 크기 (바이트) - 넘으면 오래 쓰지 않은 항목부터 삭제
+    CACHE_MAX_BYTES = 200 * 1024 * 1024
+    # 캐시 크기 확인 간격 (저장 횟수)
+    CACHE_TRIM_INTERVAL = 50
+    # 이미지로 받아들일 Content-Type (image/* 외에 형식을 밝히지 않는 서버용)
+    ALLOWED_CONTENT_TYPES = ("image/", "application/octet-stream", "binary/octet-stream")
+
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
+        'Referer': 'https://fmkorea.com/',  # 이미지 출처 사이트로 보이는 리퍼러
+        'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    }
+    # 도메인별 리퍼러 (URL에 키가 들어 있으면 적용)
+    REFERERS = {
+        'cboard.net': 'https://fmkorea.com/',
+        'image.fmkorea.com': 'https://fmkorea.com/',
+    }
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        """
+        Args:
+            cache_dir (str, optional): 디스크 캐시 폴더 (없으면 캐시 사용 안 함)
+            max_bytes (int, optional): 이미지 최대 크기 (기본값: MAX_BYTES)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes or self.MAX_BYTES
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.cache_lock = threading.Lock()
+        self.cache_writes = 0
+
+    def fetch(self, url, timeout=None):
+        """
+        이미지 본문 다운로드
+
+        Args:
+            url (str): 이미지 URL
+            timeout (int, optional): 연결/읽기 타임아웃 (초)
+
+        Returns:
+            bytes or None: 이미지 데이터 (실패, 크기 초과, 이미지가 아닌 응답이면 None)
+        """
+        headers = {}
+        for domain, referer in self.REFERERS.items():
+            if domain in url:
+                headers['Referer'] = referer
+                break
+
+        cached = self._load_cache_meta(url)
+        if cached:
+            if cached.get("etag"):
+                headers['If-None-Match'] = cached["etag"]
+            if cached.get("last_modified"):
+                headers['If-Modified-Since'] = cached["last_modified"]
+
+        try:
+            with self.session.get(url, headers=headers, timeout=timeout or self.REQUEST_TIMEOUT, stream=True) as response:
+                if response.status_code == 304 and cached:
+                    data = self._load_cache_body(url)
+                    if data is not None:
+                        logger.debug(f"이미지가 바뀌지 않아 캐시 사용: {url}")
+                        return data
+                    # 캐시 본문이 없어졌으면 조건 없이 다시 요청
+                    return self._refetch(url, headers, timeout)
+
+                if response.status_code != 200:
+                    logger.warning(f"이미지 다운로드 실패 (상태 코드: {response.status_code}): {url}")
+                    return None
+
+                data = self._read_body(response, url)
+                if data is None:
+                    return None
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._save_cache(url, data, etag, last_modified)
+                return data
+
+        except requests.RequestException as e:
+            logger.error(f"이미지 다운로드 중 오류: {url} ({e})")
+            return None
+
+    def _refetch(self, url, headers, timeout):
+        """조건부 요청 헤더를 빼고 다시 다운로드"""
+        self._remove_cache(url)
+        headers = {name: value for name, value in headers.items() if not name.startswith("If-")}
+        with self.session.get(url, headers=headers, timeout=timeout or self.REQUEST_TIMEOUT, stream=True) as response:
+            if response.status_code != 200:
+                logger.warning(f"이미지 다운로드 실패 (상태 코드: {response.status_code}): {url}")
+                return None
+            return self._read_body(response, url)
+
+    def _read_body(self, response, url):
+        """
+        응답 본문을 나눠서 읽기 - 이미지가 아니거나 크기 제한을 넘으면 바로 중단
+
+        Returns:
+            bytes or None: 본문 (중단 시 None)
+        """
+        content_type = (response.headers.get("Content-Type") or "").lower()
+        if content_type and not content_type.startswith(self.ALLOWED_CONTENT_TYPES):
+            logger.warning(f"이미지가 아닌 응답이라 다운로드 중단 ({content_type}): {url}")
+            return None
+
+        try:
+            content_length = int(response.headers.get("Content-Length") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > self.max_bytes:
+            logger.warning(f"이미지 크기 제한 초과로 다운로드 중단 ({content_length} > {self.max_bytes}바이트): {url}")
+            return None
+
+        data = bytearray()
+        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+            data.extend(chunk)
+            if len(data) > self.max_bytes:
+                logger.warning(f"이미지 크기 제한 초과로 다운로드 중단 (>{self.max_bytes}바이트): {url}")
+                return None
+        return bytes(data)
+
+    # ---- 디스크 캐시 ----
+
+    def _cache_paths(self, url):
+        """URL의 캐시 파일 경로 (메타데이터, 본문)"""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".json", base + ".body"
+
+    def _load_cache_meta(self, url):
+        """캐시 메타데이터 (ETag, Last-Modified) 읽기 - 없으면 None"""
+        if not self.cache_dir:
+            return None
+        meta_path, _ = self._cache_paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            return meta if meta.get("url") == url else None
+        except (OSError, ValueError):
+            return None
+
+    def _load_cache_body(self, url):
+        """캐시 본문 읽기 (사용 시각 갱신) - 없으면 None"""
+        _, body_path = self._cache_paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                data = f.read()
+            os.utime(body_path)
+            return data
+        except OSError:
+            return None
+
+    def _save_cache(self, url, data, etag, last_modified):
+        """본문과 메타데이터 저장 (다른 프로세스가 읽는 중이어도 깨지지 않도록 임시 파일 후 교체)"""
+        if not self.cache_dir:
+            return
+        meta_path, body_path = self._cache_paths(url)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            with open(body_path + suffix, 'wb') as f:
+                f.write(data)
+            os.replace(body_path + suffix, body_path)
+
+            meta = {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": len(data),
+                "stored_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(meta_path + suffix, meta_path)
+        except OSError as e:
+            logger.debug(f"이미지 캐시 저장 실패: {url} ({e})")
+            return
+
+        with self.cache_lock:
+            self.cache_writes += 1
+            trim = self.cache_writes % self.CACHE_TRIM_INTERVAL == 0
+        if trim:
+            self.trim_cache()
+
+    def _remove_cache(self, url):
+        """URL의 캐시 항목 삭제"""
+        if not self.cache_dir:
+            return
+        for path in self._cache_paths(url):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def trim_cache(self):
+        """
+        캐시가 CACHE_MAX_BYTES를 넘으면 오래 쓰지 않은 항목부터 삭제
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        if not self.cache_dir:
+            return 0
+
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".body"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        for _, size, body_path in sorted(entries):
+            if total <= self.CACHE_MAX_BYTES:
+                break
+            for path in (body_path, body_path[:-len(".body")] + ".json"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"이미지 캐시 정리: {removed}개 삭제")
+        return removed
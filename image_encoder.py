@@ -0,0 +1,182 @@
+# image_encoder.py
+import os
+import json
+import logging
+from io import BytesIO
+
+from PIL import Image, features
+
+logger = logging.getLogger(__name__)
+
+
+class ImageEncoder:
+    """
+    처리된 이미지 저장 형식/품질 관리 (Threads 업로드 크기 절감용)
+
+    프로필마다 형식(JPEG/WEBP), 최대 품질, 최소 품질, 목표 최대 크기를 정하고,
+    목표 크기를 넘으면 품질을 이진 탐색해 크기 안에 드는 가장 높은 품질로 저장합니다.
+    설정은 data/DB/image_encoding.json에 저장되며 파일이 없으면 기본값으로 만듭니다.
+    비교용으로 기존 방식(JPEG 기본값)으로 저장했을 때의 크기도 함께 계산합니다.
+    """
+
+    FORMAT_EXTENSIONS = {
+        "JPEG": ".jpg",
+        "WEBP": ".webp",
+    }
+
+    DEFAULT_CONFIG = {
+        # 사용할 프로필 이름
+        "profile": "jpeg",
+        # 프로필별 설정 - max_bytes가 없으면(null) 크기 목표 없이 quality로 저장
+        "profiles": {
+            "legacy": {"format": "JPEG"},
+            "jpeg": {
+                "format": "JPEG", "quality": 75, "min_quality": 40, "max_bytes": 100 * 1024,
+                "progressive": True, "optimize": True,
+            },
+            "webp": {
+                "format": "WEBP", "quality": 75, "min_quality": 35, "max_bytes": 80 * 1024,
+                "method": 6,
+            },
+        },
+        # 투명 영역을 채울 배경색
+        "background": [255, 255, 255],
+    }
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.config_file = os.path.join(base_path, "data", "DB", "image_encoding.json")
+        self.config = self._load_config()
+
+    def _load_config(self):
+        """설정 로드 (없는 키는 기본값으로 채우고, 파일이 없으면 기본 설정 저장)"""
+        config = json.loads(json.dumps(self.DEFAULT_CONFIG))
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config.update(json.load(f))
+            else:
+                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.warning(f"이미지 인코딩 설정 로드 중 오류 (기본값 사용): {e}")
+        return config
+
+    @property
+    def profile(self):
+        return self.config.get("profile", "legacy")
+
+    def profile_names(self):
+        """사용 가능한 프로필 이름 목록"""
+        return list(self.config.get("profiles", {}).keys())
+
+    def set_profile(self, profile):
+        """
+        이번 실행에 사용할 프로필 변경 (설정 파일은 바꾸지 않음)
+
+        Returns:
+            bool: 알 수 없는 프로필이면 False
+        """
+        if profile not in self.config.get("profiles", {}):
+            logger.warning(f"알 수 없는 이미지 인코딩 프로필: {profile}")
+            return False
+        self.config["profile"] = profile
+        return True
+
+    def _settings(self):
+        """현재 프로필 설정 (WEBP를 쓸 수 없는 Pillow면 JPEG으로 대체)"""
+        settings = dict(self.config.get("profiles", {}).get(self.profile) or {"format": "JPEG"})
+        settings["format"] = str(settings.get("format", "JPEG")).upper()
+        if settings["format"] not in self.FORMAT_EXTENSIONS:
+            logger.warning(f"지원하지 않는 이미지 형식 ({settings['format']}), JPEG으로 저장")
+            settings["format"] = "JPEG"
+        if settings["format"] == "WEBP" and not features.check("webp"):
+            logger.warning("Pillow에 WEBP 지원이 없어 JPEG으로 저장")
+            settings["format"] = "JPEG"
+        return settings
+
+    def flatten(self, img):
+        """
+        투명도가 있는 이미지를 배경색 위에 합성해 RGB로 변환 (그 외 모드는 RGB/L로 변환)
+
+        알파 채널을 버리고 변환하면 투명 영역이 검게 나오므로 알파를 마스크로 사용합니다.
+        """
+        if img.mode == "P" and "transparency" in img.info:
+            img = img.convert("RGBA")
+        elif img.mode in ("LA", "PA"):
+            img = img.convert("RGBA")
+
+        if img.mode == "RGBA":
+            background = Image.new("RGB", img.size, tuple(self.config.get("background") or (255, 255, 255)))
+            background.paste(img, mask=img.getchannel("A"))
+            return background
+        if img.mode not in ("RGB", "L"):
+            return img.convert("RGB")
+        return img
+
+    @staticmethod
+    def _save(img, settings, quality):
+        """한 번 저장해 바이트 반환 (quality가 None이면 형식 기본값)"""
+        options = {}
+        if quality is not None:
+            options["quality"] = quality
+        if settings["format"] == "JPEG":
+            if settings.get("progressive"):
+                options["progressive"] = True
+            if settings.get("optimize"):
+                options["optimize"] = True
+        elif settings["format"] == "WEBP":
+            options["method"] = settings.get("method", 4)
+
+        buffer = BytesIO()
+        img.save(buffer, format=settings["format"], **options)
+        return buffer.getvalue()
+
+    def encode(self, img):
+        """
+        현재 프로필로 이미지 저장 - 목표 크기를 넘으면 품질 이진 탐색
+
+        Args:
+            img (PIL.Image): RGB 또는 L 모드 이미지 (flatten 이후)
+
+        Returns:
+            dict: data(바이트), format, extension, quality, bytes, baseline_bytes(기존 방식 크기)
+        """
+        settings = self._settings()
+        quality = settings.get("quality")
+        min_quality = settings.get("min_quality") or quality
+        max_bytes = settings.get("max_bytes")
+
+        data = self._save(img, settings, quality)
+        if max_bytes and quality is not None and len(data) > max_bytes:
+            # max_bytes 이하가 되는 가장 높은 품질 찾기 (없으면 최소 품질로 저장)
+            low, high = min_quality, quality - 1
+            best = None
+            while low <= high:
+                mid = (low + high) // 2
+                candidate = self._save(img, settings, mid)
+                if len(candidate) <= max_bytes:
+                    best = (mid, candidate)
+                    low = mid + 1
+                else:
+                    high = mid - 1
+
+            if best is None:
+                quality = min_quality
+                data = self._save(img, settings, quality)
+                logger.warning(f"최소 품질({quality})에서도 목표 크기 초과: {len(data)} > {max_bytes}바이트")
+            else:
+                quality, data = best
+
+        # 기존 저장 방식(JPEG 기본값)과 크기 비교용
+        baseline = len(self._save(img, {"format": "JPEG"}, None))
+
+        return {
+            "data": data,
+            "format": settings["format"],
+            "extension": self.FORMAT_EXTENSIONS[settings["format"]],
+            "quality": quality,
+            "bytes": len(data),
+            "baseline_bytes": baseline,
+        }
@@ -1,26 +1,97 @@
 # File: image_processor.py
 import os
+import time
+import asyncio
+import hashlib
 import logging
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from PIL import Image
-import requests
 from io import BytesIO
 
+from image_downloader import ImageDownloader
+from image_encoder import ImageEncoder
+
 logger = logging.getLogger(__name__)
 
+# 작업 프로세스별 ImageProcessor (다운로드 연결 풀을 작업 사이에 재사용)
+_worker_processors = {}
+
+
+def _worker_processor(base_path, encoding_profile):
+    """작업 프로세스의 ImageProcessor (제출한 쪽과 같은 인코딩 프로필 사용)"""
+    processor = _worker_processors.get(base_path)
+    if processor is None:
+        processor = _worker_processors[base_path] = ImageProcessor(base_path)
+    if processor.encoder.profile != encoding_profile:
+        processor.encoder.set_profile(encoding_profile)
+    return processor
+
+
+def _process_image_job(base_path, encoding_profile, image_src, row_index):
+    """프로세스 풀 작업 함수 - 작업 프로세스에서 이미지 다운로드/디코딩/크기 조정/저장 (피클 가능하도록 모듈 수준에 정의)"""
+    processor = _worker_processor(base_path, encoding_profile)
+    return processor.process_image(image_src, row_index, with_stats=True)
+
+
+def _process_image_data_job(base_path, encoding_profile, data, image_src, row_index):
+    """프로세스 풀 작업 함수 - 다운로드 단계에서 받은 데이터로 디코딩/크기 조정/저장"""
+    processor = _worker_processor(base_path, encoding_profile)
+    return processor.process_image_data(data, image_src, row_index, with_stats=True)
+
+
 class ImageProcessor:
     """
     이미지 다운로드 및 처리를 위한 클래스
     500x500 크기로 이미지를 조정하고 필요시 패딩 또는 크롭 수행
+
+    큰 이미지는 목표 크기 가까이로 줄여서 디코딩하고 (JPEG draft, 그 외 reduce),
+    여러 이미지는 submit_batch/process_batch로 처리합니다 - asyncio 다운로드 단계가 URL들을
+    동시에 내려받고, 끝나는 순서대로 프로세스 풀에서 크기를 조정합니다.
+    다운로드 단계는 인스턴스당 하나의 이벤트 루프 스레드로, 모든 배치가 같은 동시 요청 제한을 공유합니다.
+    shutdown() 이후에는 reopen() 전까지 새 작업을 처리하지 않고 결과를 None으로 돌려줍니다.
+
+    처리된 이미지는 ImageEncoder 프로필(JPEG/WEBP, 목표 크기)로 저장하며,
+    내용 해시로 data/images/store/ab/cd/<해시>.jpg(.webp)에 한 번만 저장합니다.
+    db_manager가 있으면 원본 URL 해시 -> 저장 경로를 DB에서 찾아 같은 URL은 다시 처리하지 않고,
+    참조 수는 news_data 트리거로 관리됩니다 (작업 프로세스에서는 db_manager 없이 저장만 수행).
     """
-    def __init__(self, base_path):
+
+    # 프로세스 풀 작업자 수 상한 (이미지 다운로드도 작업자에서 하므로 코어 수와 함께 제한)
+    MAX_POOL_WORKERS = 4
+    # 다운로드 단계 - 전체 동시 요청 수, 호스트당 동시 요청 수
+    FETCH_CONCURRENCY = 8
+    FETCH_PER_HOST = 4
+    # 저장소 디렉터리 분할 - 해시 앞부분 2글자씩 몇 단계로 나눌지
+    STORE_SHARD_LEVELS = 2
+
+    def __init__(self, base_path, db_manager=None):
         self.base_path = base_path
+        self.db_manager = db_manager
         self.target_size = (500, 500)
         self.images_dir = os.path.join(base_path, "data", "images")  # data/images 폴더로 변경
+        self.store_dir = os.path.join(self.images_dir, "store")
         os.makedirs(self.images_dir, exist_ok=True)
+        self.pool = None  # 처음 일괄 처리할 때 생성
+        self.pool_lock = threading.Lock()
+        self.closed = False  # shutdown() 이후 True (남은 다운로드가 풀을 다시 만들지 않도록)
+        # 다운로드 단계 - 배치들이 공유하는 이벤트 루프, 요청 실행 스레드, 동시 요청 제한 (처음 다운로드할 때 생성)
+        self.fetch_loop = None
+        self.fetch_executor = None
+        self.fetch_limit = None  # 전체 동시 요청 제한 (루프 스레드에서 생성)
+        self.host_limits = {}  # 호스트 -> 호스트별 동시 요청 제한
+        self.fetch_batches = 0  # 다운로드 단계에서 진행 중인 배치 수
+        self.job_sources = {}  # 풀에 제출한 작업 Future -> 원본 (결과를 받을 때 저장소에 기록)
+        # 연결 재사용, 크기 제한, ETag/Last-Modified 디스크 캐시
+        self.downloader = ImageDownloader(os.path.join(base_path, "data", "cache", "images"))
+        self.encoder = ImageEncoder(base_path)  # 저장 형식/품질/목표 크기
+        self.encoding_stats = []  # 이번 실행에서 저장한 이미지별 인코딩 결과 (절감량 보고용)
+        self.stats_lock = threading.Lock()
 
     def download_image(self, image_url, timeout=10):
         """
-        이미지 URL에서 이미지 다운로드
+        이미지 URL에서 이미지 다운로드 (ImageDownloader - 연결 재사용, 크기 제한, 디스크 캐시)
         
         Args:
             image_url (str): 다운로드할 이미지 URL
@@ -29,49 +100,36 @@ class ImageProcessor:
         Returns:
             PIL.Image or None: 다운로드된 이미지 객체 또는 실패 시 None
         """
+        data = self.downloader.fetch(image_url, timeout=timeout)
+        if data is None:
+            return None
+        
         try:
-            # 일반적인 브라우저처럼 보이는 헤더 추가
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-                'Referer': 'https://fmkorea.com/',  # 이미지 출처 사이트로 보이는 리퍼러
-                'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache'
-            }
-            
-            # 도메인별 리퍼러 설정
-            if 'cboard.net' in image_url:
-                headers['Referer'] = 'https://fmkorea.com/'
-            elif 'image.fmkorea.com' in image_url:
-                headers['Referer'] = 'https://fmkorea.com/'
-            # 필요에 따라 다른 도메인에 대한 리퍼러 추가
-            
-            response = requests.get(image_url, timeout=timeout, headers=headers)
-            
-            if response.status_code != 200:
-                logger.warning(f"이미지 다운로드 실패 (상태 코드: {response.status_code}): {image_url}")
-                return None
-                
-            return Image.open(BytesIO(response.content))
-            
+            return Image.open(BytesIO(data))
         except Exception as e:
-            logger.error(f"이미지 다운로드 중 오류: {e}")
+            logger.error(f"다운로드한 이미지를 열 수 없습니다: {image_url} ({e})")
             return None
 
-    def process_image(self, image_src, row_index):
+    def process_image(self, image_src, row_index, with_stats=False):
         """
         이미지 다운로드 후 가로 500px 기준으로 크기 조절,
         세로가 500px 미만이면 패딩, 500px 초과이면 중앙 크롭하여 500x500로 조정.
         
         Args:
             image_src (str): 이미지 URL 또는 파일 경로
-            row_index (int): 엑셀에서 해당 행 인덱스 (이미지 저장 폴더 구분용)
+            row_index (int): 엑셀에서 해당 행 인덱스 (로그용 - 저장 경로는 내용 해시로 결정)
+            with_stats (bool): True면 (경로, 인코딩 결과) 반환 (작업 프로세스에서 결과를 돌려보낼 때)
             
         Returns:
             str or None: 처리된 이미지의 저장 경로 또는 실패 시 None
         """
         try:
+            # 이미 처리한 URL이면 저장소 경로 재사용 (DB 조회만 수행)
+            stored_path = self.lookup(image_src)
+            if stored_path:
+                logger.info(f"저장소 이미지 재사용 (행 {row_index+2}): {stored_path}")
+                return (stored_path, None) if with_stats else stored_path
+            
             # 로컬 파일인지 URL인지 확인
             if os.path.exists(image_src):
                 # 로컬 파일인 경우
@@ -80,59 +138,515 @@ class ImageProcessor:
                 # URL인 경우
                 img = self.download_image(image_src)
                 if img is None:
-                    return None
+                    return (None, None) if with_stats else None
             else:
                 logger.warning(f"이미지 파일/URL이 유효하지 않습니다: {image_src}")
-                return None
+                return (None, None) if with_stats else None
                 
-            # 원본 이미지 크기
+            return self._finish(*self._render_and_store(img, image_src), with_stats)
+            
+        except Exception as e:
+            logger.error(f"이미지 처리 중 오류: {e}")
+            return (None, None) if with_stats else None
+
+    def process_image_data(self, data, image_src, row_index, with_stats=False):
+        """
+        이미 내려받은 이미지 데이터를 process_image와 같은 방식으로 처리 (비동기 다운로드 단계 이후)
+        
+        Args:
+            data (bytes): 이미지 데이터
+            image_src (str): 원본 URL (저장소 기록용)
+            row_index (int): 행 인덱스 (로그용)
+            with_stats (bool): True면 (경로, 인코딩 결과) 반환
+            
+        Returns:
+            str or None: 처리된 이미지의 저장 경로 또는 실패 시 None
+        """
+        try:
+            return self._finish(*self._render_and_store(Image.open(BytesIO(data)), image_src), with_stats)
+        except Exception as e:
+            logger.error(f"이미지 처리 중 오류 (행 {row_index+2}): {e}")
+            return (None, None) if with_stats else None
+
+    def _finish(self, path, stats, with_stats):
+        """처리 결과 반환 - 작업 프로세스면 인코딩 결과를 함께 돌려보내고, 아니면 여기서 기록"""
+        if with_stats:
+            return path, stats
+        self._record_encoding(path, stats)
+        return path
+
+    def _render_and_store(self, img, image_src):
+        """
+        열린 이미지를 500x500으로 조정해 저장소에 저장
+        
+        Returns:
+            tuple: (저장 경로, 인코딩 결과 dict)
+        """
+        # 원본 이미지 크기
+        width, height = img.size
+        logger.info(f"원본 이미지 크기: {width}x{height}")
+        
+        # 목표 크기의 2배 이상이면 줄여서 디코딩 (전체 해상도 디코딩과 LANCZOS 연산량 절감)
+        img = self.decode_near_target(img)
+        width, height = img.size
+        
+        # 투명 영역은 배경색으로 합성 (알파를 버리고 변환하면 검게 나옴)
+        img = self.encoder.flatten(img)
+        
+        # 가로 500px 기준으로 크기 조절
+        if width != 500:
+            ratio = 500 / width
+            new_height = int(height * ratio)
+            img = img.resize((500, new_height), Image.LANCZOS)
             width, height = img.size
-            logger.info(f"원본 이미지 크기: {width}x{height}")
+            logger.info(f"이미지 가로 크기 조정: {width}x{height}")
+        
+        # 세로 크기에 따른 처리
+        if height < 500:
+            # 500px 미만인 경우 패딩 추가
+            new_img = Image.new("RGB", (500, 500), (255, 255, 255))
+            paste_y = (500 - height) // 2
+            new_img.paste(img, (0, paste_y))
+            img = new_img
+            logger.info(f"이미지 패딩 추가: 세로 {height} -> 500px")
+        elif height > 500:
+            # 500px 초과인 경우 중앙 크롭
+            crop_top = (height - 500) // 2
+            img = img.crop((0, crop_top, 500, crop_top + 500))
+            logger.info(f"이미지 세로 크롭: {height} -> 500px")
+        
+        # 인코딩 프로필로 저장 (목표 크기를 넘으면 품질 이진 탐색)
+        encoded = self.encoder.encode(img)
+        data = encoded.pop("data")
+        logger.info(
+            f"이미지 인코딩: {encoded['format']} 품질 {encoded['quality'] or '기본'}, "
+            f"{encoded['baseline_bytes']} -> {encoded['bytes']}바이트"
+        )
+        
+        # 내용 해시 경로에 저장 - 같은 이미지가 있어도 다시 기록 (정리 중인 파일을 믿고 건너뛰지 않도록,
+        # 내용이 같으므로 교체해도 읽는 쪽에는 차이가 없고 수정 시각이 갱신되어 정리 대상에서 빠짐)
+        content_hash = hashlib.sha256(data).hexdigest()
+        save_path = self.store_path(content_hash, encoded["extension"])
+        existed = os.path.exists(save_path)
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        temp_path = f"{save_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, save_path)
+        if existed:
+            logger.info(f"같은 이미지가 저장소에 있음: {save_path}")
+        else:
+            logger.info(f"이미지 처리 완료: {save_path}")
+        
+        self.register(image_src, save_path)
+        return save_path, encoded
+
+    def decode_near_target(self, img):
+        """
+        목표 가로 크기 이상을 유지하는 범위에서 이미지를 줄여서 디코딩
+        
+        JPEG은 draft로 디코더가 1/2, 1/4, 1/8 크기로 바로 디코딩하고,
+        그 외 형식은 reduce로 정수배 축소합니다. 이후 LANCZOS 조정은 작아진 이미지에서 수행됩니다.
+        
+        Args:
+            img (PIL.Image): 아직 디코딩하지 않은 (Image.open 직후) 이미지
             
-            # 가로 500px 기준으로 크기 조절
-            if width != 500:
-                ratio = 500 / width
-                new_height = int(height * ratio)
-                img = img.resize((500, new_height), Image.LANCZOS)
-                width, height = img.size
-                logger.info(f"이미지 가로 크기 조정: {width}x{height}")
+        Returns:
+            PIL.Image: 축소된 이미지 (축소할 필요가 없거나 실패하면 원래 이미지)
+        """
+        target_width = self.target_size[0]
+        width, height = img.size
+        if width < target_width * 2:
+            return img
+        
+        try:
+            if img.format == "JPEG":
+                # 요청 크기 이상이 되는 가장 작은 배율로 디코딩 (가로 500px 기준 비율 유지)
+                target_height = max(1, height * target_width // width)
+                if img.draft(None, (target_width, target_height)) is not None:
+                    logger.info(f"JPEG 축소 디코딩: {width}x{height} -> {img.size[0]}x{img.size[1]}")
+                return img
             
-            # 세로 크기에 따른 처리
-            if height < 500:
-                # 500px 미만인 경우 패딩 추가
-                new_img = Image.new("RGB", (500, 500), (255, 255, 255))
-                paste_y = (500 - height) // 2
-                new_img.paste(img, (0, paste_y))
-                img = new_img
-                logger.info(f"이미지 패딩 추가: 세로 {height} -> 500px")
-            elif height > 500:
-                # 500px 초과인 경우 중앙 크롭
-                crop_top = (height - 500) // 2
-                img = img.crop((0, crop_top, 500, crop_top + 500))
-                logger.info(f"이미지 세로 크롭: {height} -> 500px")
+            if img.mode in ("P", "1"):
+                # 팔레트 이미지는 reduce를 지원하지 않음
+                return img
             
-            # 저장 경로 설정
-            save_dir = os.path.join(self.images_dir, f"row_{row_index+2}")
-            os.makedirs(save_dir, exist_ok=True)
+            factor = width // target_width
+            reduced = img.reduce(factor)
+            logger.info(f"이미지 축소 디코딩: {width}x{height} -> {reduced.size[0]}x{reduced.size[1]}")
+            return reduced
+        except Exception as e:
+            logger.warning(f"축소 디코딩 실패 (전체 크기로 처리): {e}")
+            return img
+
+    def store_path(self, content_hash, extension=".jpg"):
+        """내용 해시의 저장소 경로 (해시 앞부분으로 디렉터리 분할)"""
+        shards = [content_hash[i * 2:i * 2 + 2] for i in range(self.STORE_SHARD_LEVELS)]
+        return os.path.join(self.store_dir, *shards, f"{content_hash}{extension}")
+
+    @staticmethod
+    def source_hash(image_src):
+        """원본 URL 해시 (URL이 아니면 None - 로컬 파일은 내용이 바뀔 수 있으므로 원본으로 찾지 않음)"""
+        if not image_src.startswith(('http://', 'https://')):
+            return None
+        return hashlib.sha256(image_src.encode('utf-8')).hexdigest()
+
+    def lookup(self, image_src):
+        """
+        원본 URL로 이미 처리한 이미지 경로 조회 (DB만 조회, 파일 시스템 확인 없음)
+        
+        Returns:
+            str or None: 저장소 경로 (db_manager가 없거나 처리한 적이 없으면 None)
+        """
+        source_hash = self.source_hash(image_src)
+        if self.db_manager is None or source_hash is None:
+            return None
+        return self.db_manager.get_stored_image(source_hash)
+
+    def register(self, image_src, path):
+        """처리된 이미지와 원본 URL을 저장소 기록에 추가 (지연 쓰기 - db_manager가 없으면 무시)"""
+        if self.db_manager is None or not path:
+            return
+        content_hash = os.path.splitext(os.path.basename(path))[0]
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = None
+        self.db_manager.queue_stored_image(content_hash, path, size, self.source_hash(image_src), image_src)
+
+    def _get_pool(self):
+        """프로세스 풀 반환 (없으면 생성, 생성할 수 없거나 종료된 뒤면 None)"""
+        with self.pool_lock:
+            if self.closed:
+                return None
+            if self.pool is None:
+                try:
+                    workers = max(1, min(self.MAX_POOL_WORKERS, os.cpu_count() or 1))
+                    self.pool = ProcessPoolExecutor(max_workers=workers)
+                    logger.info(f"이미지 처리 프로세스 풀 시작 (작업자 {workers}개)")
+                except Exception as e:
+                    logger.warning(f"이미지 처리 프로세스 풀 생성 실패 (현재 프로세스에서 처리): {e}")
+                    return None
+            return self.pool
+
+    def submit_batch(self, jobs):
+        """
+        이미지 작업들을 제출 (결과를 기다리지 않음)
+        
+        URL 이미지는 비동기 다운로드 단계에서 동시에 내려받고, 다운로드가 끝나는 순서대로
+        프로세스 풀에 크기 조정을 맡깁니다. 로컬 파일은 바로 프로세스 풀에 제출합니다.
+        
+        Args:
+            jobs (list): [(image_src, row_index), ...] - process_image와 같은 인자
             
-            # 파일명 설정 (URL인 경우 고유 타임스탬프 사용)
-            if os.path.exists(image_src):
-                filename = "processed_" + os.path.basename(image_src)
+        Returns:
+            list: 작업 순서대로 Future (결과는 process_image 반환값 - 저장소에 있으면 바로 완료)
+        """
+        futures = []
+        downloads = []
+        for image_src, row_index in jobs:
+            future = Future()
+            stored_path = None if self.closed else self.lookup(image_src)
+            if stored_path:
+                future.set_result(stored_path)
+            elif self.closed:
+                future.set_result(None)
+            elif image_src.startswith(('http://', 'https://')):
+                downloads.append((image_src, row_index, future))
             else:
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-                filename = f"image_{timestamp}.jpg"
+                self._submit_to_pool(future, image_src, row_index)
             
-            # 저장 전에 모드 변환 (P 모드를 RGB로 변환)
-            if img.mode in ('P', 'RGBA'):
-                img = img.convert('RGB')
-                
-            save_path = os.path.join(save_dir, filename)
-            img.save(save_path)
-            logger.info(f"이미지 처리 완료: {save_path}")
+            if not future.done():
+                with self.pool_lock:
+                    self.job_sources[future] = image_src
+            futures.append(future)
+        
+        if downloads:
+            loop = self._get_fetch_loop()
+            stage = asyncio.run_coroutine_threadsafe(self._fetch_stage(downloads), loop)
+            stage.add_done_callback(lambda done: self._fetch_stage_done(done, downloads))
+        return futures
+
+    def _submit_to_pool(self, future, image_src, row_index, data=None):
+        """
+        이미지 처리 작업을 프로세스 풀에 맡기고 결과를 future에 전달 (풀을 쓸 수 없으면 현재 스레드에서 처리)
+        
+        Args:
+            data (bytes, optional): 이미 내려받은 이미지 데이터 (없으면 작업 프로세스에서 image_src를 직접 처리)
+        """
+        if self.closed:
+            # shutdown() 뒤에 끝난 다운로드 - 풀을 새로 만들지 않고 실패로 처리
+            if not future.done():
+                future.set_result(None)
+            return
+        
+        pool = self._get_pool()
+        if pool is not None:
+            try:
+                if data is None:
+                    inner = pool.submit(_process_image_job, self.base_path, self.encoder.profile, image_src, row_index)
+                else:
+                    inner = pool.submit(
+                        _process_image_data_job, self.base_path, self.encoder.profile, data, image_src, row_index
+                    )
+                inner.add_done_callback(lambda done: self._relay_result(done, future))
+                return
+            except Exception as e:
+                # 작업 프로세스가 비정상 종료되면 풀이 깨지므로 다음 제출 때 새로 생성
+                logger.warning(f"이미지 작업 제출 실패 (현재 프로세스에서 처리): {e}")
+                self._reset_pool()
+        
+        if data is None:
+            future.set_result(self.process_image(image_src, row_index))
+        else:
+            future.set_result(self.process_image_data(data, image_src, row_index))
+
+    def _relay_result(self, inner, future):
+        """프로세스 풀 작업 결과(경로, 인코딩 결과)를 기록하고 경로를 제출 시 돌려준 Future에 전달"""
+        if future.done():
+            return
+        if inner.cancelled():
+            future.set_result(None)
+        elif inner.exception() is not None:
+            logger.warning(f"이미지 처리 작업 실패: {inner.exception()!r}")
+            future.set_result(None)
+        else:
+            path, stats = inner.result()
+            self._record_encoding(path, stats)
+            future.set_result(path)
+
+    def _get_fetch_loop(self):
+        """다운로드 단계 이벤트 루프 반환 (없으면 전용 스레드에서 시작) - 호출마다 진행 중인 배치 수 1 증가"""
+        with self.pool_lock:
+            if self.fetch_loop is None:
+                self.fetch_loop = asyncio.new_event_loop()
+                # ImageDownloader는 블로킹 세션이므로 요청은 스레드에서 실행 (연결 풀은 세션이 공유)
+                self.fetch_executor = ThreadPoolExecutor(
+                    max_workers=self.FETCH_CONCURRENCY, thread_name_prefix="ImageFetch"
+                )
+                self.fetch_limit = None
+                self.host_limits = {}
+                threading.Thread(
+                    target=self._run_fetch_loop, args=(self.fetch_loop,), name="ImageFetchStage", daemon=True
+                ).start()
+            self.fetch_batches += 1
+            return self.fetch_loop
+
+    @staticmethod
+    def _run_fetch_loop(loop):
+        """다운로드 단계 이벤트 루프 실행 (stop될 때까지)"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _stop_fetch_stage(self):
+        """다운로드 단계 이벤트 루프와 요청 스레드 종료 (pool_lock 보유 상태에서 호출)"""
+        loop, self.fetch_loop = self.fetch_loop, None
+        executor, self.fetch_executor = self.fetch_executor, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _fetch_stage_done(self, stage, downloads):
+        """배치 다운로드가 끝나면 호출 - 단계 오류 시 남은 작업 실패 처리"""
+        error = None if stage.cancelled() else stage.exception()
+        if stage.cancelled() or error is not None:
+            logger.error(f"이미지 다운로드 단계 오류: {error!r}")
+            # 다운로드를 시작하지 못한 작업은 실패 처리 (기다리는 쪽이 시간 초과까지 멈추지 않도록)
+            for _, _, future in downloads:
+                if not future.done() and not future.running() and future.set_running_or_notify_cancel():
+                    future.set_result(None)
+
+    async def _fetch_stage(self, downloads):
+        """
+        이미지들을 전체/호스트별 동시 요청 수 제한 안에서 동시에 내려받고,
+        끝나는 순서대로 크기 조정 작업에 넘김 (페이지 전체 다운로드 시간 ~ 가장 느린 한 개)
+        
+        동시 요청 제한은 같은 루프에서 실행 중인 다른 배치와 공유합니다.
+        """
+        try:
+            await self._fetch_downloads(downloads)
+        finally:
+            with self.pool_lock:
+                self.fetch_batches -= 1
+                # 종료된 뒤 마지막 배치가 끝나면 루프와 요청 스레드 정리
+                if self.closed and self.fetch_batches == 0:
+                    self._stop_fetch_stage()
+
+    async def _fetch_downloads(self, downloads):
+        """배치의 이미지들을 공유 동시 요청 제한 안에서 내려받기"""
+        loop = asyncio.get_running_loop()
+        executor = self.fetch_executor
+        # 제한은 루프 스레드에서만 만들고 사용 (루프가 바뀌면 새로 생성)
+        if self.fetch_limit is None:
+            self.fetch_limit = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+        total_limit = self.fetch_limit
+        host_limits = self.host_limits
+        start_time = time.monotonic()
+        durations = []
+        
+        async def fetch(image_src, row_index, future):
+            # 결과가 필요 없어진 (취소된) 작업은 내려받지 않음
+            if not future.set_running_or_notify_cancel():
+                return
             
-            return save_path
+            host = urlparse(image_src).hostname or ""
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.FETCH_PER_HOST))
+            async with total_limit, host_limit:
+                fetch_start = time.monotonic()
+                data = await loop.run_in_executor(executor, self.downloader.fetch, image_src)
+                durations.append(time.monotonic() - fetch_start)
             
+            if data is None:
+                future.set_result(None)
+                return
+            await loop.run_in_executor(executor, self._submit_to_pool, future, image_src, row_index, data)
+        
+        results = await asyncio.gather(*(fetch(*job) for job in downloads), return_exceptions=True)
+        
+        for (image_src, _, future), result in zip(downloads, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"이미지 다운로드 중 오류: {image_src} ({result!r})")
+                if not future.done():
+                    future.set_result(None)
+        
+        if durations:
+            logger.info(
+                f"이미지 {len(durations)}개 다운로드 완료: 전체 {(time.monotonic() - start_time) * 1000:.0f}ms, "
+                f"가장 느린 요청 {max(durations) * 1000:.0f}ms, 합계 {sum(durations) * 1000:.0f}ms"
+            )
+
+    def process_batch(self, jobs, timeout=20):
+        """
+        이미지 작업들을 프로세스 풀에서 동시에 처리하고 결과 대기
+        
+        Args:
+            jobs (list): [(image_src, row_index), ...]
+            timeout (int): 작업당 최대 대기 시간 (초)
+            
+        Returns:
+            list: 작업 순서대로 저장 경로 (실패 또는 시간 초과 시 None)
+        """
+        return [self.get_result(future, timeout) for future in self.submit_batch(jobs)]
+
+    def get_result(self, future, timeout=20):
+        """
+        제출한 이미지 작업 결과 대기 - 작업 프로세스에서 처리한 이미지는 여기서 저장소에 기록
+        
+        뉴스 항목을 큐에 넣기 전에 호출해야 참조 수가 올바르게 증가합니다.
+        
+        Returns:
+            str or None: 처리된 이미지의 저장 경로 또는 실패/시간 초과 시 None
+        """
+        try:
+            path = future.result(timeout=timeout)
         except Exception as e:
-            logger.error(f"이미지 처리 중 오류: {e}")
-            return None
\ No newline at end of file
+            logger.warning(f"이미지 처리 작업 실패 또는 시간 초과: {e!r}")
+            return None
+        
+        with self.pool_lock:
+            image_src = self.job_sources.pop(future, None)
+        if image_src is not None:
+            self.register(image_src, path)
+        return path
+
+    def discard(self, future):
+        """
+        결과가 필요 없어진 작업 취소
+        
+        이미 실행 중이면 끝난 뒤 참조 없는 이미지로 기록만 하고, 파일은 다른 항목과 공유할 수 있으므로
+        DatabaseManager.prune_unreferenced_images가 정리합니다.
+        """
+        with self.pool_lock:
+            image_src = self.job_sources.pop(future, None)
+        if future.cancel() or image_src is None:
+            return
+        
+        def register_output(done):
+            try:
+                self.register(image_src, done.result())
+            except Exception:
+                pass
+        future.add_done_callback(register_output)
+
+    def _record_encoding(self, path, stats):
+        """저장한 이미지의 인코딩 결과 기록 (저장소 재사용 등 새로 저장하지 않은 경우는 제외)"""
+        if not path or not stats:
+            return
+        with self.stats_lock:
+            self.encoding_stats.append(dict(stats, path=path))
+
+    def encoding_report(self):
+        """
+        이번 실행에서 저장한 이미지별 크기 절감량 (기존 방식 JPEG 기본값 대비)
+        
+        Returns:
+            list: [{"path", "format", "quality", "bytes", "baseline_bytes", "saved_bytes", "saved_ratio"}]
+        """
+        with self.stats_lock:
+            entries = [dict(entry) for entry in self.encoding_stats]
+        for entry in entries:
+            entry["saved_bytes"] = entry["baseline_bytes"] - entry["bytes"]
+            entry["saved_ratio"] = entry["saved_bytes"] / entry["baseline_bytes"] if entry["baseline_bytes"] else 0.0
+        return entries
+
+    def log_encoding_report(self, title="이미지 인코딩 절감량"):
+        """이미지별 절감량과 합계 로깅"""
+        entries = self.encoding_report()
+        if not entries:
+            return entries
+        
+        baseline_total = sum(entry["baseline_bytes"] for entry in entries)
+        total = sum(entry["bytes"] for entry in entries)
+        saved_ratio = (baseline_total - total) / baseline_total * 100 if baseline_total else 0.0
+        logger.info(
+            f"{title} (프로필 {self.encoder.profile}): {len(entries)}개, "
+            f"{baseline_total} -> {total}바이트 ({saved_ratio:.1f}% 절감)"
+        )
+        for entry in entries:
+            logger.info(
+                f"  {os.path.basename(entry['path'])}: {entry['format']} 품질 {entry['quality'] or '기본'}, "
+                f"{entry['baseline_bytes']} -> {entry['bytes']}바이트 ({entry['saved_ratio'] * 100:.1f}% 절감)"
+            )
+        return entries
+
+    def reopen(self):
+        """shutdown() 이후 다시 작업을 받도록 열기 (풀과 다운로드 단계는 다음 제출 때 생성)"""
+        with self.pool_lock:
+            self.closed = False
+
+    def reset_encoding_stats(self):
+        """인코딩 결과 기록 초기화"""
+        with self.stats_lock:
+            self.encoding_stats.clear()
+
+    def _reset_pool(self):
+        """깨진 프로세스 풀 버리기 (다음 제출 때 새로 생성)"""
+        with self.pool_lock:
+            pool, self.pool = self.pool, None
+        if pool is not None:
+            try:
+                pool.shutdown(wait=False)
+            except Exception:
+                pass
+
+    def shutdown(self):
+        """
+        프로세스 풀과 다운로드 단계 종료 (대기 중인 작업은 취소)
+        
+        아직 진행 중인 다운로드는 끝난 뒤 풀에 넘기지 않고 None으로 완료됩니다.
+        """
+        with self.pool_lock:
+            self.closed = True
+            pool, self.pool = self.pool, None
+            self.job_sources.clear()
+            if self.fetch_batches == 0:
+                self._stop_fetch_stage()
+        if pool is not None:
+            try:
+                pool.shutdown(wait=False, cancel_futures=True)
+            except Exception as e:
+                logger.warning(f"이미지 처리 프로세스 풀 종료 중 오류: {e}")
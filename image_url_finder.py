@@ -0,0 +1,203 @@
+# image_url_finder.py
+import re
+import time
+import logging
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# NewspickCollector.extract_image_url과 같은 순서의 선택자 ("상위요소 img" 형태)
+# 일반 선택자(body img) 앞에서 og:image를 먼저 확인
+IMAGE_SELECTORS = [
+    "div.link_photo_wrap img",
+    "img.main-image",
+    "div.content img",
+    "article img",
+    "div.photo img",
+    "og:image",
+    "body img",
+]
+
+# 닫는 태그가 없는 요소 (열린 요소 목록에 넣지 않음)
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+
+def _parse_selector_part(part):
+    """'div.content' -> ('div', 'content'), 'img' -> ('img', None)"""
+    tag, _, cls = part.partition(".")
+    return tag or None, cls or None
+
+
+def _matches(tag, attrs, selector_part):
+    """요소가 선택자 한 단계(태그.클래스)와 일치하는지 확인"""
+    want_tag, want_class = selector_part
+    if want_tag and tag != want_tag:
+        return False
+    if want_class and want_class not in (attrs.get("class") or "").split():
+        return False
+    return True
+
+
+class ArticleImageParser(HTMLParser):
+    """
+    기사 HTML에서 이미지 후보 수집
+
+    이미지마다 상위 요소 목록을 함께 기록해 두었다가 IMAGE_SELECTORS 순서대로 첫 번째로
+    일치하는 이미지를 고릅니다. 속성은 브라우저 추출과 같이 data-original, data-src, src 순으로 봅니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []  # 열린 요소 [(태그, 속성)]
+        self.images = []  # [(상위 요소 목록, 이미지 속성)]
+        self.og_image = None
+        self.refresh_url = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: (value or "") for name, value in attrs}
+
+        if tag == "meta":
+            if attrs.get("property") == "og:image" and attrs.get("content") and not self.og_image:
+                self.og_image = attrs["content"]
+            elif attrs.get("http-equiv", "").lower() == "refresh" and not self.refresh_url:
+                match = re.search(r"url\s*=\s*['\"]?([^'\";]+)", attrs.get("content", ""), re.I)
+                if match:
+                    self.refresh_url = match.group(1).strip()
+        elif tag == "img":
+            self.images.append((list(self.stack), attrs))
+
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        # <img ... /> 형태도 같은 처리 (열린 요소 목록에는 넣지 않음)
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self.stack and self.stack[-1][0] == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        # 닫히지 않은 요소가 섞여 있어도 가장 가까운 같은 태그까지 닫음
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                del self.stack[index:]
+                break
+
+    def find_image(self):
+        """선택자 순서대로 첫 번째 이미지 URL 반환 (없으면 None)"""
+        for selector in IMAGE_SELECTORS:
+            if selector == "og:image":
+                if self.og_image:
+                    return self.og_image
+                continue
+
+            parts = [_parse_selector_part(part) for part in selector.split()]
+            ancestor_part, image_part = parts[0], parts[-1]
+
+            for ancestors, attrs in self.images:
+                if not _matches("img", attrs, image_part):
+                    continue
+                if len(parts) > 1 and not any(_matches(tag, a, ancestor_part) for tag, a in ancestors):
+                    continue
+                img_url = attrs.get("data-original") or attrs.get("data-src") or attrs.get("src")
+                if img_url:
+                    return img_url
+        return None
+
+
+class ImageUrlFinder:
+    """
+    원본 기사 페이지를 브라우저 대신 HTTP로 받아 대표 이미지 URL 찾기
+
+    여러 기사를 동시에 요청하므로 수집 중 브라우저는 목록 페이지에 머물러 있을 수 있습니다.
+    """
+
+    MAX_CONCURRENCY = 8
+    REQUEST_TIMEOUT = 10
+    # meta refresh로 이동하는 페이지를 따라가는 최대 횟수
+    MAX_REFRESH_HOPS = 2
+
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    }
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.MAX_CONCURRENCY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @staticmethod
+    def unwrap_proxy_url(img_url):
+        """cboard.net 이미지 프록시 URL이면 원본 이미지 URL 반환"""
+        if 'img-api.cboard.net' in img_url and 'image_url=' in img_url:
+            return img_url.split('image_url=')[1]
+        return img_url
+
+    def find(self, article_url):
+        """
+        기사 페이지의 대표 이미지 URL 찾기
+
+        Args:
+            article_url (str): 원본 기사 URL
+
+        Returns:
+            str: 이미지 URL (찾지 못하면 None)
+        """
+        url = article_url
+        try:
+            for _ in range(self.MAX_REFRESH_HOPS + 1):
+                response = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
+                response.raise_for_status()
+                if not response.encoding or response.encoding.lower() == "iso-8859-1":
+                    response.encoding = response.apparent_encoding
+
+                parser = ArticleImageParser()
+                parser.feed(response.text)
+                parser.close()
+
+                img_url = parser.find_image()
+                if img_url:
+                    return self.unwrap_proxy_url(urljoin(response.url, img_url))
+
+                if not parser.refresh_url:
+                    break
+                url = urljoin(response.url, parser.refresh_url)
+
+            logger.debug(f"기사 HTML에서 이미지를 찾지 못했습니다: {article_url}")
+        except requests.RequestException as e:
+            logger.warning(f"기사 페이지 요청 실패: {article_url} ({e})")
+        except Exception as e:
+            logger.warning(f"기사 HTML 분석 중 오류: {article_url} ({e})")
+        return None
+
+    def find_many(self, article_urls):
+        """
+        여러 기사의 이미지 URL을 동시에 찾기
+
+        Args:
+            article_urls (list): 원본 기사 URL 목록
+
+        Returns:
+            dict: {기사 URL: 이미지 URL} (찾지 못한 기사는 제외)
+        """
+        if not article_urls:
+            return {}
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENCY, len(article_urls))) as executor:
+            results = list(executor.map(self.find, article_urls))
+
+        found = {url: img_url for url, img_url in zip(article_urls, results) if img_url}
+        logger.info(f"기사 이미지 URL {len(found)}/{len(article_urls)}개 찾음 ({(time.time() - start_time) * 1000:.0f}ms)")
+        return found
@@ -6,6 +6,8 @@ import logging
 import pandas as pd
 import pyperclip
 import sys
+import queue
+import shutil
 import threading
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -21,14 +23,128 @@ import random
 from datetime import datetime
 from db_manager import DatabaseManager
 from perplexity_api_handler import PerplexityAPIHandler
+from short_link_resolver import ShortLinkResolver
+from image_url_finder import ImageUrlFinder
+from cdp_network import CdpNetworkCapture
+from resource_blocker import ResourceBlocker
+from wait_engine import WaitEngine
 
 logger = logging.getLogger(__name__)
 
+class BrowserSession:
+    """
+    수집용 Chromium 프로세스와 연결된 WebDriver
+    
+    URL마다 브라우저를 새로 띄우지 않도록 수집 실행 사이에도 유지하며,
+    프로세스 종료 또는 WebDriver 응답 실패가 감지된 경우에만 다시 시작합니다.
+    """
+    def __init__(self, driver, process, port, headless):
+        self.driver = driver
+        self.process = process
+        self.port = port
+        self.headless = headless
+        self.started_at = time.time()
+        self.network_capture = None  # DevTools 네트워크 수신기 (처음 필요할 때 연결, 연결 실패 시 False)
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def is_alive(self):
+        """
+        브라우저 상태 확인 - 프로세스 확인 후 WebDriver 명령 한 번만 보냄
+        
+        Returns:
+            bool: 사용 가능 여부
+        """
+        if self.process.poll() is not None:
+            return False
+        try:
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """WebDriver와 Chromium 프로세스 종료"""
+        if self.network_capture:
+            self.network_capture.close()
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        try:
+            self.process.terminate()
+            self.process.wait(timeout=2)
+        except Exception:
+            try:
+                self.process.kill()
+            except Exception:
+                pass
+
+
 class NewspickCollector:
     """
     뉴스픽 파트너스 페이지에서 데이터를 수집하는 클래스
     """
-    def __init__(self, base_path, scroll_count=5, wait_time=3, headless=False, max_items=10, custom_message="", selected_option=0):
+    # 수집 실행 사이에 유지되는 브라우저 세션 (프로그램 전체에서 하나)
+    _shared_session = None
+    _session_lock = threading.Lock()
+    
+    # 브라우저 시작 시 디버깅 포트가 열릴 때까지 최대 대기 시간(초)
+    BROWSER_START_TIMEOUT = 15
+    
+    # 병렬 수집 설정 - 작업자마다 별도 포트와 프로필 복사본으로 Chromium 실행
+    _worker_sessions = {}
+    MAX_PARALLEL_WORKERS = 4
+    WORKER_BASE_PORT = 9501  # 수집(9222~)·Threads(9333~) 포트와 겹치지 않는 범위
+    # 작업자 프로필 복사 시 제외할 캐시 폴더 (로그인 쿠키만 있으면 충분)
+    WORKER_PROFILE_SKIP = ("Cache", "Code Cache", "GPUCache", "Service Worker", "blob_storage", "Crashpad")
+    
+    # 일반 모드 복사 링크는 OS 클립보드를 거치므로 작업자 간 순서대로 사용
+    _clipboard_lock = threading.Lock()
+    
+    # DevTools 수신 시 복사 버튼 클릭 후 단축 링크 응답 최대 대기 시간(초)
+    SHORT_LINK_WAIT = 3
+    
+    # 스크롤 후 새 항목이 로드될 때까지 최대 대기 시간(밀리초) - 이 시간 안에 늘지 않으면 피드 끝으로 판단
+    SCROLL_GROWTH_TIMEOUT_MS = 3000
+    # 스크롤 후 항목 수가 늘어날 때 즉시 반환하는 스크립트 (고정 대기 대신 DOM 변화 감시)
+    SCROLL_AND_WAIT_SCRIPT = """
+        const selector = arguments[0], previous = arguments[1], timeout = arguments[2];
+        const count = function() { return document.querySelectorAll(selector).length; };
+        window.scrollTo(0, document.body.scrollHeight);
+        return new Promise(function(resolve) {
+            if (count() > previous) { resolve(count()); return; }
+            const observer = new MutationObserver(function() {
+                if (count() > previous) {
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    resolve(count());
+                }
+            });
+            const timer = setTimeout(function() { observer.disconnect(); resolve(count()); }, timeout);
+            observer.observe(document.body, {childList: true, subtree: true});
+        });
+    """
+    
+    # 수집 작업 체크포인트 - 같은 작업에서 이 횟수만큼 실패한 항목은 다시 시도하지 않음
+    JOB_ITEM_MAX_ATTEMPTS = 2
+    
+    # 복사 버튼 선택자와 버튼 속성 일괄 추출 스크립트 (항목마다 get_attribute 호출하지 않도록 한 번에 읽음)
+    COPY_BUTTON_SELECTOR = "button[data-type='copyurl']"
+    EXTRACT_ITEMS_SCRIPT = """
+        return Array.from(document.querySelectorAll(arguments[0])).map(function(btn, index) {
+            return {
+                index: index,
+                title: btn.getAttribute('data-title') || '',
+                nid: btn.getAttribute('data-nid') || '',
+                pn: btn.getAttribute('data-pn') || ''
+            };
+        });
+    """
+    
+    def __init__(self, base_path, scroll_count=5, wait_time=3, headless=False, max_items=10, custom_message="", selected_option=0, db_manager=None):
         self.logger = logger
         self.base_path = base_path
         self.scroll_count = scroll_count
@@ -44,17 +160,36 @@ class NewspickCollector:
         os.makedirs(self.data_dir, exist_ok=True)
         os.makedirs(self.images_dir, exist_ok=True)
         
-        # 데이터베이스 매니저 초기화 (SQLite로 변경)
-        self.db_manager = DatabaseManager(base_path)
+        # 데이터베이스 매니저 초기화 (SQLite로 변경) - 앱의 매니저를 받으면 쓰기 스레드/연결을 공유
+        self.owns_db_manager = db_manager is None
+        self.db_manager = db_manager or DatabaseManager(base_path)
         
-        self.image_processor = ImageProcessor(base_path)
+        self.image_processor = ImageProcessor(base_path, self.db_manager)  # 처리된 이미지는 내용 해시 저장소에 한 번만 저장
+        self.link_resolver = ShortLinkResolver(base_path)
+        self.use_direct_links = True  # 단축 링크를 복사 버튼 클릭 대신 HTTP로 직접 요청 (실패 시 클릭 방식)
+        self.image_url_finder = ImageUrlFinder()
+        self.use_http_images = True  # 원본 기사 이미지를 HTTP로 찾기 (실패 시 브라우저로 원본 페이지 이동)
+        self.use_image_pool = True  # HTTP로 찾은 이미지를 프로세스 풀에서 미리 처리 (페이지 항목들을 여러 코어에서 동시에)
+        self.use_cdp_capture = True  # 헤드리스 링크/이미지를 DevTools 네트워크 이벤트로 수신 (불가 시 페이지 스크립트 방식)
+        # 고정 sleep 대신 준비 조건 대기 (복사 버튼 대기는 기존 대기 시간의 2배까지, 클립보드는 3초까지)
+        self.waits = WaitEngine({"selector": max(wait_time * 2, 5), "clipboard": 3})
+        self.resource_blocker = ResourceBlocker(base_path)  # 페이지를 열 때 광고/글꼴 등 불필요한 리소스 차단
+        self.blocking_reports = []  # 측정 모드에서 URL별 차단 전후 로드 시간/전송량
         self.collected_titles = set()
+        self.titles_in_progress = set()  # 작업자가 처리 중인 제목 (병렬 수집 중복 방지)
+        self.titles_lock = threading.Lock()
+        self.pending_news_writes = []  # 커밋 대기 중인 (WriteHandle, 제목) 목록
+        self.use_checkpoints = True  # 수집 작업을 URL/항목 단위로 기록해 중단 시 이어서 진행
+        self.job_id = None  # 현재 수집 작업 ID (체크포인트 미사용 시 None)
+        self.job_items = {}  # 현재 작업의 항목별 처리 결과 {nid: (상태, 시도 횟수)}
         
         # 이미 처리된 제목들을 데이터베이스에서 로드
         self.load_titles_from_db()
         
         self.should_stop = False
         self.auto_mode = False  # 자동화 모드 플래그 추가
+        self.keep_browser_alive = True  # 수집 완료 후 다음 실행을 위해 브라우저 유지
+        self.parallel_workers = 1  # 동시에 실행할 브라우저 수 (1이면 순차 수집)
         logger.info("뉴스픽 데이터 수집기가 초기화되었습니다.")
 
         # 요약 처리 핸들러 초기화
@@ -228,6 +363,29 @@ class NewspickCollector:
         Returns:
             webdriver.Chrome: 웹드라이버 객체
         """
+        session = self.launch_browser(module_name=module_name)
+        if session is None:
+            return None
+        
+        # 인스턴스 변수에 정보 저장
+        self.chromium_pid = session.pid
+        self.chromium_process = session.process
+        self.debug_port = session.port
+        
+        return session.driver
+
+    def launch_browser(self, module_name=None, preferred_port=9222, user_data_dir=None):
+        """
+        로컬 Chromium 실행 후 WebDriver 연결
+        
+        Args:
+            module_name (str, optional): 모듈 이름 (로그 표시용)
+            preferred_port (int): 우선 사용할 디버깅 포트 (사용 중이면 대체 포트 사용)
+            user_data_dir (str, optional): 사용자 데이터 디렉토리 (기본값: chromeTEMP1)
+            
+        Returns:
+            BrowserSession: 브라우저 세션 (실패 시 None)
+        """
         # 모듈 이름이 제공되지 않으면 기본값 설정
         module_name = module_name or "newspick_collector"
         
@@ -235,8 +393,8 @@ class NewspickCollector:
         base_dir = os.path.abspath(self.base_path)
         chromium_path = os.path.join(base_dir, "win", "chromium.exe")
         
-        # 모듈별 사용자 데이터 디렉토리 설정 - 항상 고정 디렉토리 사용
-        user_data_dir = os.path.join(base_dir, "win", "TEMP", "chromeTEMP1")
+        # 사용자 데이터 디렉토리 설정 - 지정하지 않으면 고정 디렉토리 사용
+        user_data_dir = user_data_dir or os.path.join(base_dir, "win", "TEMP", "chromeTEMP1")
         os.makedirs(user_data_dir, exist_ok=True)
         
         # 경로 존재 확인
@@ -252,9 +410,6 @@ class NewspickCollector:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 return s.connect_ex(('localhost', port)) == 0
         
-        # 고정 포트 설정 - newspick_collector용 9222 포트
-        preferred_port = 9222
-        
         # 선호 포트가 사용 가능하면 그대로 사용
         if not is_port_in_use(preferred_port):
             debug_port = preferred_port
@@ -302,12 +457,12 @@ class NewspickCollector:
         proc = subprocess.Popen(cmd)
         pid = proc.pid
         
-        # 인스턴스 변수에 정보 저장
-        self.chromium_pid = pid
-        self.debug_port = debug_port
-        
         logger.info(f"{module_name} Chromium 시작 (프로세스 ID: {pid}, 포트: {debug_port}")
-        time.sleep(5)  # 크로미움 시작 대기
+        
+        # 크로미움 시작 대기 - 고정 대기 대신 디버깅 포트가 응답하는 즉시 진행
+        if not self.waits.port_open(debug_port, timeout=self.BROWSER_START_TIMEOUT,
+                                    label="collector.browser_start", process=proc):
+            logger.warning(f"{module_name} Chromium 디버깅 포트 대기 실패 (포트: {debug_port})")
         
         # WebDriver 설정
         try:
@@ -319,6 +474,7 @@ class NewspickCollector:
             
             if not os.path.exists(driver_path):
                 logger.error(f"ChromeDriver 파일이 존재하지 않습니다: {driver_path}")
+                BrowserSession(None, proc, debug_port, self.headless).close()
                 return None
             
             # Selenium 3.x 스타일로 초기화
@@ -359,11 +515,163 @@ class NewspickCollector:
                 except:
                     pass
             
-            return driver
+            return BrowserSession(driver, proc, debug_port, self.headless)
         except Exception as e:
             logger.error(f"{module_name}용 웹드라이버 설정 오류: {e}")
+            BrowserSession(None, proc, debug_port, self.headless).close()
             return None
 
+    def acquire_browser(self, worker_id=None):
+        """
+        수집용 WebDriver 반환 - 유지 중인 세션이 정상이면 재사용하고, 없거나 비정상이면 새로 시작
+        
+        Args:
+            worker_id (int, optional): 병렬 수집 작업자 번호 (None이면 기본 세션)
+        
+        Returns:
+            webdriver.Chrome: 웹드라이버 객체 (시작 실패 시 None)
+        """
+        with NewspickCollector._session_lock:
+            session = self._get_session(worker_id)
+            
+            if session and session.headless == self.headless and session.is_alive():
+                if worker_id is None:
+                    self.chromium_pid = session.pid
+                    self.chromium_process = session.process
+                    self.debug_port = session.port
+                return session.driver
+            
+            if session:
+                if session.headless != self.headless:
+                    self.logger.info("헤드리스 설정이 바뀌어 브라우저를 다시 시작합니다.")
+                else:
+                    self.logger.warning("브라우저 비정상 종료가 감지되어 다시 시작합니다.")
+            self._close_session_locked(worker_id)
+            
+            if worker_id is None:
+                driver = self.setup_webdriver(module_name="newspick_collector")
+                if driver is None:
+                    return None
+                session = BrowserSession(driver, self.chromium_process, self.debug_port, self.headless)
+            else:
+                session = self.launch_browser(
+                    module_name=f"newspick_collector(작업자 {worker_id + 1})",
+                    preferred_port=self.WORKER_BASE_PORT + worker_id,
+                    user_data_dir=self._prepare_worker_profile(worker_id)
+                )
+                if session is None:
+                    return None
+            
+            self._set_session(worker_id, session)
+            return session.driver
+
+    def _get_session(self, worker_id):
+        """작업자 번호에 해당하는 유지 세션 조회 (None이면 기본 세션)"""
+        if worker_id is None:
+            return NewspickCollector._shared_session
+        return NewspickCollector._worker_sessions.get(worker_id)
+
+    def _set_session(self, worker_id, session):
+        """작업자 번호에 해당하는 유지 세션 설정 (session이 None이면 해제)"""
+        if worker_id is None:
+            NewspickCollector._shared_session = session
+        elif session is None:
+            NewspickCollector._worker_sessions.pop(worker_id, None)
+        else:
+            NewspickCollector._worker_sessions[worker_id] = session
+
+    def _prepare_worker_profile(self, worker_id):
+        """
+        작업자용 사용자 데이터 디렉토리 준비 - 기본 프로필(chromeTEMP1)의 로그인 정보를 복사
+        
+        Args:
+            worker_id (int): 작업자 번호
+            
+        Returns:
+            str: 작업자 프로필 경로
+        """
+        temp_base = os.path.join(os.path.abspath(self.base_path), "win", "TEMP")
+        source_dir = os.path.join(temp_base, "chromeTEMP1")
+        profile_dir = os.path.join(temp_base, f"chromeTEMP1_w{worker_id + 1}")
+        os.makedirs(profile_dir, exist_ok=True)
+        
+        try:
+            # 쿠키 암호화 키는 Local State에 있으므로 함께 복사
+            local_state = os.path.join(source_dir, "Local State")
+            if os.path.exists(local_state):
+                shutil.copy2(local_state, profile_dir)
+            
+            default_dir = os.path.join(source_dir, "Default")
+            if os.path.isdir(default_dir):
+                shutil.copytree(
+                    default_dir,
+                    os.path.join(profile_dir, "Default"),
+                    ignore=shutil.ignore_patterns(*self.WORKER_PROFILE_SKIP),
+                    dirs_exist_ok=True
+                )
+        except OSError as e:
+            # 사용 중인 파일 등 일부 복사 실패는 무시 (로그인 쿠키가 없으면 수집 중 로그인 확인에서 드러남)
+            logger.warning(f"작업자 {worker_id + 1} 프로필 복사 중 일부 파일을 건너뛰었습니다: {e}")
+        
+        return profile_dir
+
+    def is_browser_alive(self, worker_id=None):
+        """유지 중인 브라우저 세션이 정상인지 확인"""
+        session = self._get_session(worker_id)
+        return bool(session and session.is_alive())
+
+    def close_browser_session(self, worker_id=None):
+        """유지 중인 브라우저 세션 종료"""
+        with NewspickCollector._session_lock:
+            self._close_session_locked(worker_id)
+
+    def close_worker_sessions(self, keep=0):
+        """
+        병렬 수집용 브라우저 세션 종료
+        
+        Args:
+            keep (int): 유지할 작업자 수 (번호가 keep 이상인 작업자만 종료)
+        """
+        with NewspickCollector._session_lock:
+            for worker_id in sorted(NewspickCollector._worker_sessions):
+                if worker_id >= keep:
+                    self._close_session_locked(worker_id)
+
+    def _close_session_locked(self, worker_id=None):
+        """브라우저 세션 종료 (_session_lock 보유 상태에서 호출)"""
+        session = self._get_session(worker_id)
+        self._set_session(worker_id, None)
+        
+        # 작업자 세션은 자신이 띄운 프로세스만 종료
+        if worker_id is not None:
+            if session:
+                session.close()
+            return
+        
+        if session:
+            self.chromium_pid = session.pid
+            self.debug_port = session.port
+            try:
+                session.driver.quit()
+            except Exception:
+                pass
+        
+        self.kill_browser_processes()
+
+    @classmethod
+    def close_shared_session(cls):
+        """프로그램 종료 시 유지 중인 브라우저 종료"""
+        with cls._session_lock:
+            sessions = list(cls._worker_sessions.values())
+            if cls._shared_session:
+                sessions.append(cls._shared_session)
+            cls._shared_session = None
+            cls._worker_sessions.clear()
+        
+        for session in sessions:
+            session.close()
+            logger.info(f"유지 중이던 수집용 브라우저를 종료했습니다 (PID: {session.pid})")
+
     def clean_temp_directory(self):
         """크로미움 임시 디렉토리 정리"""
         import shutil
@@ -385,6 +693,11 @@ class NewspickCollector:
         import subprocess
         import time
         
+        # 유지 중인 세션의 브라우저를 종료하는 경우 세션도 해제
+        session = NewspickCollector._shared_session
+        if session and getattr(self, 'chromium_pid', None) == session.pid:
+            NewspickCollector._shared_session = None
+        
         # 시작된 프로세스 PID가 있는 경우에만 해당 프로세스 종료
         if hasattr(self, 'chromium_pid') and self.chromium_pid:
             try:
@@ -453,9 +766,25 @@ class NewspickCollector:
 
     # newspick_collector.py 파일의 collect_data 메서드 수정
     def collect_data(self, urls, progress_callback=None):
+        try:
+            return self._run_collection(urls, progress_callback)
+        finally:
+            # 수집기가 직접 만든 매니저면 쓰기 스레드와 연결 정리 (다시 쓰면 필요할 때 새로 열림)
+            if self.owns_db_manager:
+                self.db_manager.close_connection()
+
+    def _run_collection(self, urls, progress_callback=None):
         # 데이터 수집 시작 시 should_stop 플래그 명시적으로 False로 설정
         self.should_stop = False
-        self.kill_browser_processes()  # 기존 프로세스 종료
+        self.pending_news_writes = []
+        self.titles_in_progress = set()
+        self.blocking_reports = []
+        self.waits.reset()
+        self.image_processor.reopen()  # 이전 실행 끝에 종료한 이미지 풀 다시 사용
+        self.image_processor.reset_encoding_stats()
+        # 유지 중인 브라우저가 없을 때만 이전 실행에서 남은 프로세스 정리
+        if not self.is_browser_alive() and not NewspickCollector._worker_sessions:
+            self.kill_browser_processes()
         self.initialize_db()  # 엑셀 대신 DB 초기화 함수 호출
         
         # 첫 실행 시 기본 매핑으로 초기화 시도
@@ -469,302 +798,510 @@ class NewspickCollector:
         except Exception as e:
             self.logger.error(f"카테고리 매핑 초기화 중 오류: {e}")
         
+        # 수집 작업 기록 - 같은 URL 목록의 중단된 작업이 있으면 완료한 URL은 다시 열지 않음
+        self.job_id, done_urls, resumed_items = None, set(), 0
+        self.job_items = {}
+        if self.use_checkpoints:
+            self.job_id, done_urls, resumed_items = self.db_manager.start_collection_job(urls)
+            if self.job_id is not None:
+                self.job_items = self.db_manager.get_collection_job_items(self.job_id)
+        
+        if done_urls:
+            self.logger.info(f"이전 실행에서 완료한 URL {len(done_urls)}개 건너뜀 (수집된 항목 {resumed_items}개)")
+            urls = [url for url in urls if url not in done_urls]
+        
         total_urls = len(urls)
         new_items_total = 0
 
-        for url_idx, url in enumerate(urls):
-            if self.should_stop:
-                self.logger.info("데이터 수집이 취소되었습니다.")
-                break
-
-            if progress_callback:
-                progress_callback(url_idx, total_urls, f"URL 처리 중: {url}")
-            self.logger.info(f"URL 처리 중 ({url_idx+1}/{total_urls}): {url}")
+        if self._use_parallel_workers(urls):
+            new_items_total = self._collect_parallel(urls, progress_callback)
+            if new_items_total is None:
+                return False
+        else:
+            # 병렬 수집에서 쓰던 작업자 브라우저는 순차 수집에서 필요 없음
+            self.close_worker_sessions()
             
-            # 브라우저 재시작 최대 시도 횟수
-            max_restart_attempts = 3
-            restart_count = 0
-            driver = None  # 이 줄을 추가하여 driver 변수 초기화
+            for url_idx, url in enumerate(urls):
+                if self.should_stop:
+                    self.logger.info("데이터 수집이 취소되었습니다.")
+                    break
+                
+                new_items_count = self._collect_url(url, url_idx, total_urls, progress_callback)
+                if new_items_count is None:
+                    return False
+                new_items_total += new_items_count
+                self._complete_job_url(url, new_items_count)
+
+        # 지연 쓰기 큐에 남은 항목 커밋
+        self.flush_pending_writes()
+        self.image_processor.shutdown()
+        self.image_processor.log_encoding_report()
+        
+        # 수집하지 않았거나 삭제된 항목의 저장소 이미지 정리
+        self.db_manager.prune_unreferenced_images()
+        
+        # 모든 URL을 마쳤으면 작업 종료 (취소된 작업은 다음 실행에서 이어서 진행)
+        if self.job_id is not None and not self.should_stop:
+            self.db_manager.finish_collection_job(self.job_id)
+        
+        if self.blocking_reports:
+            self.log_blocking_report()
+        self.waits.log_report("수집 대기 시간 통계")
+        
+        # 수집 완료 후 캐시 저장
+        self.save_titles_to_cache()
+        self.logger.info(f"데이터 수집 완료. 총 {new_items_total}개의 새 항목 추가됨.")
+        
+        if progress_callback:
+            progress_callback(total_urls, total_urls, f"수집 완료: {new_items_total}개 항목 추가")
+        try:
+            # 다음 수집 실행을 위해 브라우저 유지 (유지하지 않도록 설정된 경우에만 종료)
+            if self.keep_browser_alive and not self.should_stop:
+                self.logger.info("다음 수집을 위해 브라우저 세션을 유지합니다.")
+            else:
+                self.close_browser_session()
+                self.close_worker_sessions()
+        except Exception as e:
+            self.logger.error(f"완료 처리 중 오류: {e}")
+
+        # 요약 생성 통계 로깅
+        if hasattr(self, 'auto_summary') and self.auto_summary:
+            self.logger.info(f"요약 생성 통계: 성공 {self.generated_summaries}개, 건너뜀 {self.skipped_summaries}개")
+        return True
+
+    def _collect_url(self, url, url_idx, total_urls, progress_callback=None, worker_id=None):
+        """
+        URL 하나 수집 - 페이지 이동, 로그인 확인, 스크롤 후 항목 처리
+        
+        Args:
+            url (str): 수집할 URL
+            url_idx (int): URL 순번
+            total_urls (int): 전체 URL 수
+            progress_callback (callable, optional): 진행 상황 콜백
+            worker_id (int, optional): 병렬 수집 작업자 번호 (None이면 기본 세션 사용)
             
-            while restart_count <= max_restart_attempts:
+        Returns:
+            int: 새로 수집한 항목 수 (수집을 중단해야 하면 None)
+        """
+        if progress_callback:
+            progress_callback(url_idx, total_urls, f"URL 처리 중: {url}")
+        self.logger.info(f"URL 처리 중 ({url_idx+1}/{total_urls}): {url}")
+        
+        # 브라우저 재시작 최대 시도 횟수
+        max_restart_attempts = 3
+        restart_count = 0
+        driver = None  # 이 줄을 추가하여 driver 변수 초기화
+        new_items_count = 0
+        
+        while restart_count <= max_restart_attempts:
+            try:
+                # 유지 중인 브라우저 세션 사용 (없거나 비정상이면 새로 시작)
+                driver = self.acquire_browser(worker_id)
+                
+                # 드라이버가 None인지 명시적으로 확인
+                if driver is None:
+                    self.logger.error("웹드라이버 설정에 실패했습니다.")
+                    if progress_callback:
+                        progress_callback(1, 1, "웹드라이버 설정 실패")
+                    return None
+                
+                # 이제 driver 변수를 사용해야 함 (self.driver가 아님)
+                if self.resource_blocker.measure:
+                    self.measure_page_load(driver, url)
+                else:
+                    self._open_page(driver, url)
+                
+                # 여기서 다시 한번 should_stop 체크 (브라우저 설정 중 취소된 경우)
+                if self.should_stop:
+                    self.logger.info("브라우저 설정 후 데이터 수집이 취소되었습니다.")
+                    self.close_browser_session(worker_id)
+                    return None
+                
+                # 로그인 상태를 먼저 기록에서 확인 - 추가된 코드
+                login_status_file = os.path.join(self.base_path, "data", "DB", "login_status.cfg")
+                login_from_file = False
+                
+                if os.path.exists(login_status_file):
+                    try:
+                        with open(login_status_file, 'r', encoding='utf-8') as f:
+                            content = f.read()
+                            if "로그인_상태: 완료" in content:
+                                login_from_file = True
+                                self.logger.info("로그인 상태 파일에서 확인됨. 로그인 검사 건너뜀.")
+                    except Exception as e:
+                        self.logger.error(f"로그인 상태 파일 읽기 중 오류: {e}")
+                
+                # 첫 번째 URL로 이동하여 HTML 내용에서 카테고리 매핑 업데이트
                 try:
-                    # 드라이버 설정 부분
-                    driver = self.setup_webdriver(module_name="newspick_collector")
-                    
-                    # 드라이버가 None인지 명시적으로 확인
-                    if driver is None:
-                        self.logger.error("웹드라이버 설정에 실패했습니다.")
-                        if progress_callback:
-                            progress_callback(1, 1, "웹드라이버 설정 실패")
-                        return False
-                    
-                    # 이제 driver 변수를 사용해야 함 (self.driver가 아님)
-                    driver.get(url)
-                    time.sleep(self.wait_time)
-                    
-                    # 여기서 다시 한번 should_stop 체크 (브라우저 설정 중 취소된 경우)
-                    if self.should_stop:
-                        self.logger.info("브라우저 설정 후 데이터 수집이 취소되었습니다.")
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                        self.kill_browser_processes()
-                        return False
+                    # HTML 내용 가져오기
+                    html_content = driver.page_source
                     
-                    # 로그인 상태를 먼저 기록에서 확인 - 추가된 코드
-                    login_status_file = os.path.join(self.base_path, "data", "DB", "login_status.cfg")
-                    login_from_file = False
-                    
-                    if os.path.exists(login_status_file):
-                        try:
-                            with open(login_status_file, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if "로그인_상태: 완료" in content:
-                                    login_from_file = True
-                                    self.logger.info("로그인 상태 파일에서 확인됨. 로그인 검사 건너뜀.")
-                        except Exception as e:
-                            self.logger.error(f"로그인 상태 파일 읽기 중 오류: {e}")
-                    
-                    # 첫 번째 URL로 이동하여 HTML 내용에서 카테고리 매핑 업데이트
+                    # 카테고리 매핑 업데이트
+                    updated_count = self.category_mapper.update_from_html(html_content)
+                    if updated_count > 0:
+                        self.logger.info(f"{updated_count}개의 카테고리 매핑 정보가 업데이트되었습니다.")
+                        
+                    # 현재 모든 카테고리 매핑 정보 로깅
+                    all_mappings = self.category_mapper.get_all_mappings()
+                    self.logger.info(f"현재 카테고리 매핑 정보: {len(all_mappings)}개")
+                    for category_id, category_name in all_mappings.items():
+                        self.logger.info(f"카테고리 매핑: {category_id} -> {category_name}")
+                except Exception as e:
+                    self.logger.warning(f"카테고리 매핑 업데이트 중 오류 (무시됨): {e}")
+                
+                # 로그인 상태 확인 (Selenium 3.x 스타일)
+                # 헤드리스 모드에서는 파일에서 확인된 로그인만 신뢰
+                if not login_from_file:
                     try:
-                        # HTML 내용 가져오기
-                        html_content = driver.page_source
+                        login_button = driver.find_element_by_xpath("//button[contains(text(), '로그인')]")
+                        self.logger.warning("로그인이 필요합니다. 로그인 페이지로 이동합니다.")
                         
-                        # 카테고리 매핑 업데이트
-                        updated_count = self.category_mapper.update_from_html(html_content)
-                        if updated_count > 0:
-                            self.logger.info(f"{updated_count}개의 카테고리 매핑 정보가 업데이트되었습니다.")
+                        # 로그인 페이지로 이동
+                        before_url = driver.current_url
+                        login_button.click()
+                        self.waits.url_changed(driver, before_url, label="collector.login_page")
+                        self.waits.document_ready(driver, label="collector.login_page")
+                        
+                        # 사용자에게 로그인 완료 요청
+                        if not self.headless:
+                            self.logger.info("로그인 페이지가 열렸습니다. 로그인을 진행해주세요...")
                             
-                        # 현재 모든 카테고리 매핑 정보 로깅
-                        all_mappings = self.category_mapper.get_all_mappings()
-                        self.logger.info(f"현재 카테고리 매핑 정보: {len(all_mappings)}개")
-                        for category_id, category_name in all_mappings.items():
-                            self.logger.info(f"카테고리 매핑: {category_id} -> {category_name}")
-                    except Exception as e:
-                        self.logger.warning(f"카테고리 매핑 업데이트 중 오류 (무시됨): {e}")
-                    
-                    # 로그인 상태 확인 (Selenium 3.x 스타일)
-                    # 헤드리스 모드에서는 파일에서 확인된 로그인만 신뢰
-                    if not login_from_file:
-                        try:
-                            login_button = driver.find_element_by_xpath("//button[contains(text(), '로그인')]")
-                            self.logger.warning("로그인이 필요합니다. 로그인 페이지로 이동합니다.")
+                            # 현재 URL 저장 (로그인 페이지 URL)
+                            login_url = driver.current_url
+                            self.logger.info(f"로그인 페이지 URL: {login_url}")
                             
-                            # 로그인 페이지로 이동
-                            login_button.click()
-                            time.sleep(2)
+                            # URL 변경 감지 및 자동 진행
+                            max_wait_time = 120  # 최대 대기 시간(초)
+                            start_time = time.time()
                             
-                            # 사용자에게 로그인 완료 요청
-                            if not self.headless:
-                                self.logger.info("로그인 페이지가 열렸습니다. 로그인을 진행해주세요...")
-                                
-                                # 현재 URL 저장 (로그인 페이지 URL)
-                                login_url = driver.current_url
-                                self.logger.info(f"로그인 페이지 URL: {login_url}")
+                            # URL 변경 감지
+                            while time.time() - start_time < max_wait_time:
+                                # 취소 요청 확인 (추가)
+                                if self.should_stop:
+                                    self.logger.info("로그인 대기 중 사용자가 취소했습니다.")
+                                    return None
                                 
-                                # URL 변경 감지 및 자동 진행
-                                max_wait_time = 120  # 최대 대기 시간(초)
-                                start_time = time.time()
+                                # 현재 URL 확인
+                                current_url = driver.current_url
                                 
-                                # URL 변경 감지
-                                while time.time() - start_time < max_wait_time:
-                                    # 취소 요청 확인 (추가)
-                                    if self.should_stop:
-                                        self.logger.info("로그인 대기 중 사용자가 취소했습니다.")
-                                        return False
+                                # URL이 변경되었는지 확인 (로그인 완료로 판단)
+                                if current_url != login_url and "/login" not in current_url:
+                                    self.logger.info(f"URL 변경이 감지되었습니다: {login_url} -> {current_url}")
+                                    self.logger.info("로그인이 완료된 것으로 판단하고 다음 단계로 진행합니다.")
+                                    break
                                     
-                                    # 현재 URL 확인
-                                    current_url = driver.current_url
-                                    
-                                    # URL이 변경되었는지 확인 (로그인 완료로 판단)
-                                    if current_url != login_url and "/login" not in current_url:
-                                        self.logger.info(f"URL 변경이 감지되었습니다: {login_url} -> {current_url}")
-                                        self.logger.info("로그인이 완료된 것으로 판단하고 다음 단계로 진행합니다.")
-                                        break
-                                        
-                                    # 짧은 간격으로 체크
-                                    time.sleep(1)
-                                
-                                # 시간 초과 확인
-                                if time.time() - start_time >= max_wait_time:
-                                    self.logger.warning("로그인 대기 시간이 초과되었습니다.")
-                                    if progress_callback:
-                                        progress_callback(1, 1, "로그인 대기 시간 초과")
-                                    return False
-                                
-                                self.logger.info("로그인 확인됨. 데이터 수집을 계속합니다.")
-                                
-                                # 로그인 상태 저장
-                                data_dir = os.path.join(self.base_path, "data")
-                                db_dir = os.path.join(data_dir, "DB")
-                                os.makedirs(db_dir, exist_ok=True)
-                                login_status_file = os.path.join(db_dir, "login_status.cfg")
-                                
-                                with open(login_status_file, 'w', encoding='utf-8') as f:
-                                    f.write(f"로그인_시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                                    f.write(f"로그인_상태: 완료\n")
-                                    f.write(f"최대_수집_항목: {self.max_items}\n")
-                                    f.write(f"스크롤_횟수: {self.scroll_count}\n")
-                                    f.write(f"대기_시간: {self.wait_time}\n")
-                                    f.write(f"헤드리스_모드: {'활성화' if self.headless else '비활성화'}\n")
-                                
-                                self.logger.info(f"로그인 상태 파일 저장됨: {login_status_file}")
-                                
-                                # 원래 URL로 다시 이동
-                                driver.get(url)
-                                time.sleep(self.wait_time)
-                            else:
-                                # 헤드리스 모드에서는 로그인 상태 파일이 없으면 로그인 불가
-                                self.logger.error("헤드리스 모드에서는 자동 로그인이 불가능합니다.")
+                                # 짧은 간격으로 체크
+                                time.sleep(1)
+                            
+                            # 시간 초과 확인
+                            if time.time() - start_time >= max_wait_time:
+                                self.logger.warning("로그인 대기 시간이 초과되었습니다.")
                                 if progress_callback:
-                                    progress_callback(1, 1, "헤드리스 모드에서 로그인 실패")
-                                return False
-                        except Exception as e:
-                            # NoSuchElementException이 발생하지 않거나 로그인 상태 파일이 있으면 이미 로그인된 상태로 간주
-                            if login_from_file:
-                                self.logger.info("로그인 상태 파일이 있고 로그인 버튼이 없어 이미 로그인된 상태로 판단합니다.")
-                            else:
-                                self.logger.info("로그인 버튼을 찾을 수 없어 이미 로그인된 상태로 간주합니다.")
-                    else:
-                        self.logger.info("로그인 상태 파일이 존재하므로 이미 로그인된 상태로 간주합니다.")
-
-                    # 카테고리 추출
-                    category = "기본 카테고리"
-                    try:
-                        hash_part = url.split('#')[-1] if '#' in url else ""
-                        if hash_part:
-                            category = f"카테고리 #{hash_part}"
+                                    progress_callback(1, 1, "로그인 대기 시간 초과")
+                                return None
+                            
+                            self.logger.info("로그인 확인됨. 데이터 수집을 계속합니다.")
+                            
+                            # 로그인 상태 저장
+                            data_dir = os.path.join(self.base_path, "data")
+                            db_dir = os.path.join(data_dir, "DB")
+                            os.makedirs(db_dir, exist_ok=True)
+                            login_status_file = os.path.join(db_dir, "login_status.cfg")
+                            
+                            with open(login_status_file, 'w', encoding='utf-8') as f:
+                                f.write(f"로그인_시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                                f.write(f"로그인_상태: 완료\n")
+                                f.write(f"최대_수집_항목: {self.max_items}\n")
+                                f.write(f"스크롤_횟수: {self.scroll_count}\n")
+                                f.write(f"대기_시간: {self.wait_time}\n")
+                                f.write(f"헤드리스_모드: {'활성화' if self.headless else '비활성화'}\n")
+                            
+                            self.logger.info(f"로그인 상태 파일 저장됨: {login_status_file}")
+                            
+                            # 원래 URL로 다시 이동
+                            self._open_page(driver, url)
+                        else:
+                            # 헤드리스 모드에서는 로그인 상태 파일이 없으면 로그인 불가
+                            self.logger.error("헤드리스 모드에서는 자동 로그인이 불가능합니다.")
+                            if progress_callback:
+                                progress_callback(1, 1, "헤드리스 모드에서 로그인 실패")
+                            return None
                     except Exception as e:
-                        self.logger.error(f"카테고리 추출 중 오류: {e}")
+                        # NoSuchElementException이 발생하지 않거나 로그인 상태 파일이 있으면 이미 로그인된 상태로 간주
+                        if login_from_file:
+                            self.logger.info("로그인 상태 파일이 있고 로그인 버튼이 없어 이미 로그인된 상태로 판단합니다.")
+                        else:
+                            self.logger.info("로그인 버튼을 찾을 수 없어 이미 로그인된 상태로 간주합니다.")
+                else:
+                    self.logger.info("로그인 상태 파일이 존재하므로 이미 로그인된 상태로 간주합니다.")
 
-                    # 지정된 횟수만큼 스크롤 수행
-                    for i in range(self.scroll_count):
-                        if self.should_stop:
-                            break
-                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        if progress_callback:
-                            progress_callback(url_idx, total_urls, f"URL 스크롤 중: {i+1}/{self.scroll_count}")
-                        time.sleep(3)  # 스크롤 후 대기
+                # 카테고리 추출
+                category = "기본 카테고리"
+                try:
+                    hash_part = url.split('#')[-1] if '#' in url else ""
+                    if hash_part:
+                        category = f"카테고리 #{hash_part}"
+                except Exception as e:
+                    self.logger.error(f"카테고리 추출 중 오류: {e}")
 
-                    # 항목 처리
-                    try:
-                        # 취소 요청 확인 (추가)
-                        if self.should_stop:
-                            self.logger.info("스크롤 후 사용자가 취소했습니다.")
-                            break
-                            
-                        new_items_count = self.process_items(driver, url, category, progress_callback, url_idx, total_urls)
-                        new_items_total += new_items_count
-                        self.logger.info(f"URL '{url}'에서 {new_items_count}개의 새 항목이 수집되었습니다.")
-                        # 성공적인 처리 - 브라우저 재시작 루프 종료
+                # 새 항목이 충분히 모이거나 피드가 더 늘지 않을 때까지 스크롤 (최대 scroll_count회)
+                page_items = self.scroll_for_new_items(driver, progress_callback, url_idx, total_urls)
+
+                # 항목 처리
+                try:
+                    # 취소 요청 확인 (추가)
+                    if self.should_stop:
+                        self.logger.info("스크롤 후 사용자가 취소했습니다.")
                         break
-                    except Exception as processing_error:
-                        self.logger.error(f"항목 처리 중 오류: {processing_error}")
-                        # 오류 발생 시 브라우저 재시작
-                        restart_count += 1
-                        self.logger.warning(f"브라우저 재시작 시도 ({restart_count}/{max_restart_attempts})")
                         
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                        
-                        self.kill_browser_processes()
-                        time.sleep(5)  # 재시작 전 대기
-                        
-                        if restart_count > max_restart_attempts:
-                            self.logger.error("최대 재시작 횟수 초과, URL 처리를 건너뜁니다.")
-                            break
-                            
-                        # 루프 계속해서 브라우저 재시작
-                        continue
-
-                except Exception as e:
-                    self.logger.error(f"URL '{url}' 처리 중 오류: {e}")
+                    new_items_count = self.process_items(driver, url, category, progress_callback, url_idx, total_urls, page_items)
+                    self.logger.info(f"URL '{url}'에서 {new_items_count}개의 새 항목이 수집되었습니다.")
+                    # 성공적인 처리 - 브라우저 재시작 루프 종료
+                    break
+                except Exception as processing_error:
+                    self.logger.error(f"항목 처리 중 오류: {processing_error}")
                     restart_count += 1
                     
-                    if driver:
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                    
-                    # 최대 재시작 시도 횟수 초과 확인
                     if restart_count > max_restart_attempts:
-                        self.logger.error(f"최대 재시작 횟수 초과, URL '{url}' 처리를 건너뜁니다.")
+                        self.logger.error("최대 재시도 횟수 초과, URL 처리를 건너뜁니다.")
                         break
                     
-                    self.kill_browser_processes()
-                    time.sleep(5)  # 재시작 전 대기
-                finally:
-                    if driver:
-                        try:
-                            driver.quit()
-                            self.logger.info("WebDriver를 정상적으로 종료했습니다.")
-                        except Exception as e:
-                            self.logger.error(f"드라이버 종료 중 오류: {e}")
-                        
-                    # 브라우저 프로세스 강제 종료
-                    self.kill_browser_processes()
+                    # 브라우저가 죽은 경우에만 재시작 (정상이면 같은 세션으로 URL 다시 처리)
+                    if not self.is_browser_alive(worker_id):
+                        self.logger.warning(f"브라우저 재시작 시도 ({restart_count}/{max_restart_attempts})")
+                        self.close_browser_session(worker_id)
+                    else:
+                        self.logger.warning(f"같은 브라우저로 URL 재시도 ({restart_count}/{max_restart_attempts})")
+                    continue
 
-        # 수집 완료 후 캐시 저장
-        self.save_titles_to_cache()
-        self.logger.info(f"데이터 수집 완료. 총 {new_items_total}개의 새 항목 추가됨.")
+            except Exception as e:
+                self.logger.error(f"URL '{url}' 처리 중 오류: {e}")
+                restart_count += 1
+                
+                # 최대 재시작 시도 횟수 초과 확인
+                if restart_count > max_restart_attempts:
+                    self.logger.error(f"최대 재시작 횟수 초과, URL '{url}' 처리를 건너뜁니다.")
+                    break
+                
+                if not self.is_browser_alive(worker_id):
+                    self.logger.warning(f"브라우저 재시작 시도 ({restart_count}/{max_restart_attempts})")
+                    self.close_browser_session(worker_id)
         
-        if progress_callback:
-            progress_callback(total_urls, total_urls, f"수집 완료: {new_items_total}개 항목 추가")
+        return new_items_count
+
+    def _use_parallel_workers(self, urls):
+        """
+        병렬 수집 사용 여부 판단
+        
+        로그인 대기는 한 브라우저에서만 가능하므로 로그인 상태 파일이 있을 때만 병렬로 수집합니다.
+        
+        Returns:
+            bool: 병렬 수집 여부
+        """
+        if min(self.parallel_workers, self.MAX_PARALLEL_WORKERS, len(urls)) <= 1:
+            return False
+        
+        login_status_file = os.path.join(self.base_path, "data", "DB", "login_status.cfg")
         try:
-            # 쓰레드 게시 작업이 활성 상태인지 확인
-            threads_lock_file = os.path.join(self.base_path, "data", "DB", "threads_running.lock")
-            if os.path.exists(threads_lock_file):
-                self.logger.info("Threads 게시 작업이 진행 중입니다. 브라우저 종료를 건너뜁니다.")
-                # 브라우저 프로세스는 종료하지 않고 드라이버만 종료
-                if driver:
-                    try:
-                        driver.quit()
-                        self.logger.info("WebDriver 객체만 종료했습니다.")
-                    except:
-                        pass
-            else:
-                # 다른 작업이 없으면 정상적으로 종료 진행
-                if driver:
-                    try:
-                        driver.quit()
-                        self.logger.info("WebDriver를 정상적으로 종료했습니다.")
-                    except Exception as e:
-                        self.logger.error(f"드라이버 종료 중 오류: {e}")
-                    
-                # 브라우저 프로세스 강제 종료
-                self.kill_browser_processes()
-        except Exception as e:
-            self.logger.error(f"완료 처리 중 오류: {e}")
+            with open(login_status_file, 'r', encoding='utf-8') as f:
+                if "로그인_상태: 완료" in f.read():
+                    return True
+        except OSError:
+            pass
+        
+        self.logger.warning("로그인 상태 파일이 없어 순차 수집으로 진행합니다. 로그인 후 다음 실행부터 병렬로 수집합니다.")
+        return False
 
-        # 요약 생성 통계 로깅
-        if hasattr(self, 'auto_summary') and self.auto_summary:
-            self.logger.info(f"요약 생성 통계: 성공 {self.generated_summaries}개, 건너뜀 {self.skipped_summaries}개")
-        return True
+    def _collect_parallel(self, urls, progress_callback=None):
+        """
+        여러 브라우저로 URL 병렬 수집 - 작업자마다 별도 Chromium이 공유 큐에서 URL을 가져가 처리
+        
+        제목 중복 확인은 작업자 간에 공유되고(_claim_title), DB 저장은 지연 쓰기 큐의
+        단일 쓰기 스레드가 처리합니다.
+        
+        Args:
+            urls (list): 수집할 URL 목록
+            progress_callback (callable, optional): 진행 상황 콜백
+            
+        Returns:
+            int: 새로 수집한 항목 수 (작업자가 모두 중단되어 남은 URL이 있으면 None)
+        """
+        total_urls = len(urls)
+        worker_count = min(self.parallel_workers, self.MAX_PARALLEL_WORKERS, total_urls)
+        
+        # 기본 프로필을 복사할 수 있도록 순차 수집용 브라우저를 닫고, 줄어든 작업자 세션 정리
+        # (kill_browser_processes는 작업자의 ChromeDriver까지 종료하므로 세션만 직접 닫음)
+        with NewspickCollector._session_lock:
+            session = self._get_session(None)
+            self._set_session(None, None)
+        if session:
+            session.close()
+        self.close_worker_sessions(keep=worker_count)
+        
+        url_queue = queue.Queue()
+        for url_idx, url in enumerate(urls):
+            url_queue.put((url_idx, url))
+        
+        state = {"done": 0, "new_items": 0}
+        state_lock = threading.Lock()
+        
+        def make_progress_callback(worker_id):
+            # 작업자별 진행 상황을 완료한 URL 수 기준으로 바꿔 순서대로 전달
+            def callback(current, total, status_text, processed_items=None):
+                if progress_callback:
+                    with state_lock:
+                        progress_callback(state["done"], total_urls, f"[브라우저 {worker_id + 1}] {status_text}", state["new_items"])
+            return callback
+        
+        def run_worker(worker_id):
+            callback = make_progress_callback(worker_id)
+            
+            while not self.should_stop:
+                try:
+                    url_idx, url = url_queue.get_nowait()
+                except queue.Empty:
+                    break
+                
+                new_items_count = self._collect_url(url, url_idx, total_urls, callback, worker_id)
+                
+                if new_items_count is None:
+                    if not self.should_stop:
+                        # 브라우저를 쓸 수 없는 작업자는 URL을 되돌려 놓고 종료
+                        url_queue.put((url_idx, url))
+                        self.logger.error(f"작업자 {worker_id + 1} 중단 - 남은 URL은 다른 작업자가 처리합니다.")
+                    break
+                
+                with state_lock:
+                    state["done"] += 1
+                    state["new_items"] += new_items_count
+                self._complete_job_url(url, new_items_count)
+        
+        self.logger.info(f"병렬 수집 시작: 브라우저 {worker_count}개, URL {total_urls}개")
+        
+        threads = [
+            threading.Thread(target=run_worker, args=(worker_id,), name=f"NewspickWorker-{worker_id + 1}", daemon=True)
+            for worker_id in range(worker_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        if not self.should_stop and not url_queue.empty():
+            self.logger.error(f"모든 작업자가 중단되어 {url_queue.qsize()}개 URL을 수집하지 못했습니다.")
+            return None
+        
+        self.logger.info(f"병렬 수집 완료: URL {state['done']}/{total_urls}개, 새 항목 {state['new_items']}개")
+        return state["new_items"]
 
-    def process_items(self, driver, url, category, progress_callback, url_idx, total_urls):
+    def _complete_job_url(self, url, new_items_count):
+        """URL 완료 체크포인트 기록 (취소로 중간에 끝난 URL은 기록하지 않음)"""
+        if self.job_id is None or self.should_stop:
+            return
+        self.db_manager.complete_collection_job_url(self.job_id, url, new_items_count)
+
+    def _record_job_item(self, url, item, collected):
+        """
+        항목 처리 결과 체크포인트 기록 (지연 쓰기 - 수집 결과와 같은 순서로 커밋)
+        
+        Args:
+            url (str): 항목이 있는 URL
+            item (dict): 처리한 항목 (nid, title)
+            collected (bool): 새 항목으로 수집했는지 여부
+        """
+        if self.job_id is None:
+            return
+        
+        status = "done" if collected else "failed"
+        with self.titles_lock:
+            _, attempts = self.job_items.get(item["nid"], (None, 0))
+            self.job_items[item["nid"]] = (status, attempts + 1)
+        self.db_manager.queue_collection_job_item(self.job_id, url, item["nid"], item["title"], status)
+
+    def _claim_title(self, normalized_title):
+        """
+        제목 처리 시작 표시 - 이미 수집했거나 다른 작업자가 처리 중인 제목이면 False
+        
+        Args:
+            normalized_title (str): 정규화된 제목
+            
+        Returns:
+            bool: 처리를 시작해도 되면 True
+        """
+        with self.titles_lock:
+            if normalized_title in self.collected_titles or normalized_title in self.titles_in_progress:
+                return False
+            if self.db_manager.is_title_processed(normalized_title):
+                return False
+            self.titles_in_progress.add(normalized_title)
+            return True
+
+    def _release_title(self, normalized_title, collected=False):
+        """제목 처리 종료 표시 (collected가 True면 수집 완료 목록에 추가, 아니면 다시 수집 가능)"""
+        with self.titles_lock:
+            self.titles_in_progress.discard(normalized_title)
+            if collected:
+                self.collected_titles.add(normalized_title)
+
+    def flush_pending_writes(self):
+        """
+        지연 쓰기 큐에 남은 수집 결과를 커밋하고 저장 실패 항목을 기록
+        
+        Returns:
+            int: 저장에 실패한 항목 수
+        """
+        self.db_manager.flush()
+        
+        failed_count = 0
+        for handle, title in self.pending_news_writes:
+            if handle.error or not handle.result:
+                failed_count += 1
+                self.logger.error(f"새 항목 DB 저장 실패: {title} ({handle.error})")
+        self.pending_news_writes = []
+        
+        return failed_count
+
+    def process_items(self, driver, url, category, progress_callback, url_idx, total_urls, page_items=None):
         """
         페이지 내 항목들을 처리
+        
+        Args:
+            page_items (list, optional): 스크롤 중 이미 읽은 복사 버튼 정보 (없으면 새로 읽음)
         """
-        # CSS 선택자로 버튼 찾기 (Selenium 3.x 스타일)
-        copy_buttons = driver.find_elements_by_css_selector("button[data-type='copyurl']")
+        # 복사 버튼 속성을 스크립트 한 번으로 모두 읽기
+        if page_items is None:
+            page_items = self.extract_copy_items(driver)
         
         # 디버깅 로그 추가
         self.logger.info(f"URL당 최대 항목 수: {self.max_items}")
-        self.logger.info(f"복사 버튼 개수: {len(copy_buttons)}")
+        self.logger.info(f"복사 버튼 개수: {len(page_items)}")
         
-        if not copy_buttons:
+        if not page_items:
             self.logger.warning(f"URL '{url}'에서 항목을 찾을 수 없습니다.")
             return 0
-                    
-        items_to_process = min(self.max_items, len(copy_buttons))
-        self.logger.info(f"처리할 항목 수: {items_to_process}")
+        
+        # 이미 수집한 제목과 링크 정보가 없는 항목은 클릭 전에 제외 (브라우저 호출 없음)
+        items = self.filter_new_items(page_items)[:self.max_items]
+        items_to_process = len(items)
+        self.logger.info(f"처리할 항목 수: {items_to_process} (전체 {len(page_items)}개 중 새 항목)")
         
         new_items_count = 0
         
+        if not items:
+            return 0
+        
+        # 단축 링크를 복사 버튼 클릭 없이 HTTP로 한 번에 요청
+        if self.use_direct_links:
+            self.prefetch_short_links(driver, items)
+        
+        # 원본 기사 이미지 URL을 HTTP로 한 번에 찾기 (브라우저는 목록 페이지에 머묾)
+        if self.use_http_images:
+            self.prefetch_image_urls(items)
+            
+            # 찾은 이미지는 링크를 복사하는 동안 동시에 내려받고 (비동기 다운로드 단계) 프로세스 풀에서 크기 조정
+            if self.use_image_pool:
+                self.submit_image_jobs(items)
+        
         # 초기 원본 URL 저장 (복구용)
         original_url = driver.current_url
         
@@ -822,7 +1359,7 @@ class NewspickCollector:
         except Exception as e:
             self.logger.error(f"카테고리 추출 중 오류: {e}")
         
-        for item_idx in range(items_to_process):
+        for item_idx, item in enumerate(items):
             if self.should_stop:
                 break
                         
@@ -847,38 +1384,29 @@ class NewspickCollector:
                             pass
                         
                         # 페이지로 이동 시도
-                        driver.get(original_url)
-                        time.sleep(self.wait_time)
-                        
-                        # 버튼 다시 가져오기
-                        copy_buttons = driver.find_elements_by_css_selector("button[data-type='copyurl']")
+                        self._open_page(driver, original_url)
                 except Exception as e:
                     self.logger.error(f"페이지 복원 중 오류: {e}")
                     # 오류 발생 시 드라이버 재설정 시도
                     try:
                         # 드라이버 종료하지 않고 페이지 새로고침 시도
                         driver.refresh()
-                        time.sleep(self.wait_time * 2)
-                        driver.get(original_url)
-                        time.sleep(self.wait_time)
-                        copy_buttons = driver.find_elements_by_css_selector("button[data-type='copyurl']")
+                        self.waits.document_ready(driver, label="collector.refresh")
+                        self._open_page(driver, original_url)
                     except Exception as refresh_error:
                         self.logger.error(f"페이지 새로고침 중 오류: {refresh_error}")
                         # 심각한 오류 - 다음 URL로 넘어가기
+                        self.discard_image_jobs(items)
                         return new_items_count
                 
-                # 항목이 범위를 벗어나는지 확인
-                if item_idx >= len(copy_buttons):
-                    self.logger.warning(f"항목 인덱스 {item_idx}가 버튼 목록 길이 {len(copy_buttons)}를 초과합니다.")
-                    continue
-                
                 # 통합된 _process_single_item 함수 호출
-                result = self._process_single_item(driver, item_idx, copy_buttons, category, original_url)
+                result = self._process_single_item(driver, item_idx, item, category, original_url)
                 
                 # 결과 처리
                 if result:
                     if result.get('is_new_item', False):
                         new_items_count += 1
+                self._record_job_item(url, item, bool(result and result.get('is_new_item', False)))
                     
                 # 타임아웃 확인
                 if time.time() - item_start_time > item_timeout:
@@ -887,15 +1415,12 @@ class NewspickCollector:
             
             except Exception as e:
                 self.logger.error(f"항목 {item_idx+1} 처리 중 예외 발생: {e}")
+                self._record_job_item(url, item, False)
                 # 브라우저 상태 복구 시도
                 self._reset_browser_state(driver, original_url)
-            
-            # 처리 완료 후 복사 버튼 목록 갱신
-            try:
-                copy_buttons = driver.find_elements_by_css_selector("button[data-type='copyurl']")
-            except:
-                # 무시하고 계속 진행
-                pass
+        
+        # 수집하지 않은 항목의 미리 처리한 이미지 정리
+        self.discard_image_jobs(items)
         
         # 데이터 수집 완료 로그
         self.logger.info(f"URL '{url}'에서 {new_items_count}개의 새 항목이 수집되었습니다.")
@@ -903,63 +1428,236 @@ class NewspickCollector:
         return new_items_count
 
 
-    def _process_single_item(self, driver, item_idx, copy_buttons, category, original_url):
+    def extract_copy_items(self, driver):
         """
-        단일 항목 처리 - SQLite 데이터베이스에 저장
+        페이지의 모든 복사 버튼 속성을 스크립트 한 번으로 추출
+        
+        Returns:
+            list: [{"index", "title", "nid", "pn"}, ...] (실패 시 빈 목록)
         """
         try:
-            # 현재 페이지에서 버튼 목록 가져오기
-            try:
-                copy_buttons = driver.find_elements_by_css_selector("button[data-type='copyurl']")
-            except:
-                # 버튼을 찾을 수 없으면 원본 URL로 복귀 시도
-                driver.get(original_url)
-                time.sleep(self.wait_time)
-                copy_buttons = driver.find_elements_by_css_selector("button[data-type='copyurl']")
+            items = driver.execute_script(self.EXTRACT_ITEMS_SCRIPT, self.COPY_BUTTON_SELECTOR)
+            return items or []
+        except Exception as e:
+            self.logger.error(f"복사 버튼 정보 추출 중 오류: {e}")
+            return []
+
+    def filter_new_items(self, items, log_skipped=True):
+        """
+        이미 수집한 제목과 원본 링크 정보가 없는 항목, 현재 작업에서 이미 끝낸 항목 제외
+        (클릭 전 단계에서 브라우저 호출 없이 처리)
+        
+        Args:
+            items (list): extract_copy_items 결과
+            log_skipped (bool): 제외한 중복 제목 로그 기록 여부
             
-            if item_idx >= len(copy_buttons):
-                logger.warning(f"항목 인덱스 {item_idx}가 버튼 목록 길이 {len(copy_buttons)}를 초과합니다.")
-                return None
-                    
-            btn = copy_buttons[item_idx]
+        Returns:
+            list: 처리할 항목 목록 (normalized_title 키 추가)
+        """
+        candidates = []
+        for item in items:
+            if not item.get("title") or not item.get("nid") or not item.get("pn"):
+                continue
             
-            # 게시물 제목 가져오기
-            try:
-                article_title = btn.get_attribute("data-title")
-                normalized_title = self.normalize_title(article_title)
-            except:
-                logger.error("제목 가져오기 실패")
-                return None
+            # 같은 작업에서 수집을 마쳤거나 반복해서 실패한 항목 (재시작/이어하기 시 건너뜀)
+            status, attempts = self.job_items.get(item["nid"], (None, 0))
+            if status == "done" or attempts >= self.JOB_ITEM_MAX_ATTEMPTS:
+                if log_skipped:
+                    self.logger.info(f"이 작업에서 이미 처리한 항목 건너뜀: {item['title']} ({status}, {attempts}회)")
+                continue
             
-            # 중복 제목 건너뛰기
-            if normalized_title in self.collected_titles or self.db_manager.is_title_processed(normalized_title):
-                logger.info(f"중복 제목 건너뜀: {article_title}")
-                return {'is_new_item': False}
+            item["normalized_title"] = self.normalize_title(item["title"])
+            candidates.append(item)
+        
+        # 수집 캐시와 작업자 처리 중 목록, DB를 한 번에 확인
+        processed = self.db_manager.find_processed_titles([item["normalized_title"] for item in candidates])
+        with self.titles_lock:
+            seen = processed | self.collected_titles | self.titles_in_progress
+        
+        new_items = []
+        for item in candidates:
+            if item["normalized_title"] in seen:
+                if log_skipped:
+                    self.logger.info(f"중복 제목 건너뜀: {item['title']}")
+                continue
+            seen.add(item["normalized_title"])
+            new_items.append(item)
+        return new_items
+
+    def scroll_for_new_items(self, driver, progress_callback=None, url_idx=0, total_urls=1):
+        """
+        새 항목이 max_items개 모이거나 피드가 더 늘어나지 않을 때까지 스크롤
+        
+        스크롤마다 고정 시간 대기하지 않고 복사 버튼 수가 늘어나는 즉시 다음 단계로 넘어가며,
+        scroll_count는 최대 스크롤 횟수로 사용합니다.
+        
+        Returns:
+            list: 마지막으로 읽은 복사 버튼 정보 (extract_copy_items 결과)
+        """
+        page_items = self.extract_copy_items(driver)
+        
+        for i in range(self.scroll_count):
+            if self.should_stop:
+                break
             
-            # 제목이 이미 데이터베이스에 있는지 확인
-            if self.db_manager.is_title_processed(normalized_title):
-                logger.info(f"이미 DB에 저장된 제목 건너뜀: {article_title}")
-                return {'is_new_item': False}
+            new_count = len(self.filter_new_items(page_items, log_skipped=False))
+            if new_count >= self.max_items:
+                self.logger.info(f"새 항목 {new_count}개 확보 - 스크롤 {i}회에서 중단")
+                break
             
-            # 원본 링크 추출 (참조용으로만 사용)
+            if progress_callback:
+                progress_callback(url_idx, total_urls, f"URL 스크롤 중: {i+1}/{self.scroll_count} (새 항목 {new_count}개)")
+            
+            previous_count = len(page_items)
             try:
-                nid = btn.get_attribute("data-nid") 
-                pn = btn.get_attribute("data-pn")
-                if nid and pn:
-                    original_link = f"http://m.newspic.kr/view.html?nid={nid}&pn={pn}"
-                else:
-                    original_link = "링크 추출 실패"
-                    return {'is_new_item': False}
+                current_count = driver.execute_script(
+                    self.SCROLL_AND_WAIT_SCRIPT, self.COPY_BUTTON_SELECTOR, previous_count, self.SCROLL_GROWTH_TIMEOUT_MS
+                )
             except Exception as e:
-                logger.error(f"원본 링크 추출 실패: {e}")
-                original_link = "링크 추출 실패"
+                self.logger.warning(f"스크롤 중 오류: {e}")
+                break
+            
+            if not current_count or current_count <= previous_count:
+                self.logger.info(f"피드가 더 늘어나지 않음 - 스크롤 {i+1}회에서 중단 (항목 {previous_count}개)")
+                break
+            
+            page_items = self.extract_copy_items(driver)
+        
+        return page_items
+
+    def prefetch_short_links(self, driver, items):
+        """
+        항목들의 단축 링크를 HTTP로 동시에 요청해 item["short_link"]에 저장
+        
+        요청 형식을 아직 모르면 첫 항목의 복사 버튼을 한 번 클릭해 알아냅니다.
+        링크를 받지 못한 항목은 _process_single_item에서 기존 클릭 방식으로 처리됩니다.
+        
+        Returns:
+            int: 단축 링크를 받은 항목 수
+        """
+        resolver = self.link_resolver
+        if not resolver.sync_cookies(driver):
+            return 0
+        
+        if not resolver.has_endpoint():
+            first = items[0]
+            btn = self.find_copy_button(driver, first)
+            if btn is not None:
+                short_url = resolver.discover(driver, btn, first)
+                if short_url:
+                    first["short_link"] = short_url
+        
+        pending = [item for item in items if not item.get("short_link")]
+        for nid, link in resolver.resolve_many(pending).items():
+            for item in pending:
+                if item["nid"] == nid:
+                    item["short_link"] = link
+        
+        return sum(1 for item in items if item.get("short_link"))
+
+    def prefetch_image_urls(self, items):
+        """
+        항목들의 원본 기사 이미지 URL을 HTTP로 동시에 찾아 item["image_url"]에 저장
+        
+        Returns:
+            int: 이미지 URL을 찾은 항목 수
+        """
+        article_urls = [self.build_original_link(item) for item in items]
+        found = self.image_url_finder.find_many(article_urls)
+        
+        for item, article_url in zip(items, article_urls):
+            if article_url in found:
+                item["image_url"] = found[article_url]
+        return len(found)
+
+    def submit_image_jobs(self, items):
+        """
+        image_url이 있는 항목들의 이미지 처리를 프로세스 풀에 제출하고 item["image_future"]에 저장
+        
+        Returns:
+            int: 제출한 작업 수
+        """
+        targets = [(item_idx, item) for item_idx, item in enumerate(items) if item.get("image_url")]
+        if not targets:
+            return 0
+        
+        # 저장 폴더 구분용 행 인덱스는 항목 처리 순서와 동일
+        futures = self.image_processor.submit_batch([(item["image_url"], item_idx) for item_idx, item in targets])
+        for (_, item), future in zip(targets, futures):
+            item["image_future"] = future
+        self.logger.info(f"이미지 처리 작업 {len(futures)}개 제출")
+        return len(futures)
+
+    def discard_image_jobs(self, items):
+        """처리 결과를 사용하지 않은 이미지 작업 취소 (중복 제목 등으로 수집하지 않은 항목)"""
+        for item in items:
+            future = item.pop("image_future", None)
+            if future is not None:
+                self.image_processor.discard(future)
+
+    @staticmethod
+    def build_original_link(item):
+        """복사 버튼 정보로 원본 기사 링크 생성"""
+        return f"http://m.newspic.kr/view.html?nid={item['nid']}&pn={item['pn']}"
+
+    def find_copy_button(self, driver, item):
+        """
+        항목의 복사 버튼 요소 찾기 - 페이지가 다시 로드되어도 같은 기사를 가리키도록 data-nid로 찾음
+        
+        Returns:
+            WebElement: 복사 버튼 (없으면 None)
+        """
+        nid = item.get("nid", "")
+        if nid and "'" not in nid:
+            buttons = driver.find_elements_by_css_selector(f"{self.COPY_BUTTON_SELECTOR}[data-nid='{nid}']")
+            if buttons:
+                return buttons[0]
+        
+        buttons = driver.find_elements_by_css_selector(self.COPY_BUTTON_SELECTOR)
+        if item["index"] < len(buttons):
+            return buttons[item["index"]]
+        return None
+
+    def _process_single_item(self, driver, item_idx, item, category, original_url):
+        """
+        단일 항목 처리 - SQLite 데이터베이스에 저장
+        
+        Args:
+            item (dict): extract_copy_items로 읽은 복사 버튼 정보 (filter_new_items 통과 항목)
+        """
+        normalized_title = None
+        try:
+            article_title = item["title"]
+            
+            # 중복 제목 건너뛰기 (다른 작업자가 그 사이 처리를 시작한 제목 포함)
+            if not self._claim_title(item["normalized_title"]):
+                logger.info(f"중복 제목 건너뜀: {article_title}")
                 return {'is_new_item': False}
+            normalized_title = item["normalized_title"]
+            
+            # 원본 링크 (참조용으로만 사용)
+            original_link = self.build_original_link(item)
+            
+            # 클릭할 버튼 요소 찾기
+            btn = self.find_copy_button(driver, item)
+            if btn is None:
+                self._open_page(driver, original_url)
+                btn = self.find_copy_button(driver, item)
+            if btn is None:
+                logger.warning(f"복사 버튼을 찾을 수 없습니다: {article_title}")
+                self._release_title(normalized_title)
+                return None
                     
             # 복사 링크 획득 시도
             copied_link = None
             
+            # HTTP로 미리 받은 단축 링크가 있으면 클릭 생략
+            if item.get("short_link"):
+                copied_link = item["short_link"]
+                logger.info(f"HTTP로 받은 단축 링크 사용: {copied_link[:50]}")
+            
             # 헤드리스 모드 처리
-            if self.headless:
+            elif self.headless:
                 logger.info("헤드리스 모드에서 복사 링크 획득 시도")
                 
                 # 네트워크 요청 감시를 통해 클릭으로만 URL 획득
@@ -1090,12 +1788,18 @@ class NewspickCollector:
                 });
                 """
                 
+                # DevTools 네트워크 수신이 가능하면 스크립트 덮어쓰기 대신 사용
+                capture = self.get_network_capture(driver)
+                
                 # 스크립트 실행 (최대 3회 시도)
                 max_tries = 3
                 for attempt in range(max_tries):
                     try:
                         logger.info(f"헤드리스 모드 URL 획득 시도 {attempt+1}/{max_tries}")
-                        result = driver.execute_script(js_script, btn)
+                        if capture:
+                            result = self._click_and_capture_link(driver, btn, capture)
+                        else:
+                            result = driver.execute_script(js_script, btn)
                         
                         # 알림창 처리 시도
                         try:
@@ -1113,26 +1817,20 @@ class NewspickCollector:
                             logger.warning(f"헤드리스 모드 시도 {attempt+1} 실패")
                             # 페이지 새로고침 후 재시도
                             if attempt < max_tries - 1:
-                                driver.get(original_url)
-                                time.sleep(self.wait_time)
-                                copy_buttons = driver.find_elements_by_css_selector("button[data-type='copyurl']")
-                                if item_idx < len(copy_buttons):
-                                    btn = copy_buttons[item_idx]
+                                self._open_page(driver, original_url)
+                                btn = self.find_copy_button(driver, item) or btn
                     except Exception as e:
                         logger.error(f"헤드리스 모드 시도 {attempt+1} 중 오류: {e}")
                 
                 # 모든 시도가 실패한 경우
                 if not copied_link:
                     logger.error("헤드리스 모드에서 URL 획득 실패")
+                    self._release_title(normalized_title)
                     return {'is_new_item': False}
             else:
                 # 일반 모드에서는 클립보드 사용
                 logger.info("일반 모드에서 복사 링크 획득 시도")
                 
-                # 클립보드 초기화
-                pyperclip.copy('')
-                time.sleep(0.5)
-                
                 # 알림창 처리 설정
                 try:
                     driver.execute_script("window.alert = function() { return true; };")
@@ -1150,12 +1848,8 @@ class NewspickCollector:
                         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
                         time.sleep(0.5)
                         
-                        # 버튼 클릭
-                        ActionChains(driver).move_to_element(btn).click().perform()
-                        time.sleep(2)
-                        
-                        # 클립보드에서 복사된 링크 가져오기
-                        copied_link = pyperclip.paste().strip()
+                        # 버튼 클릭 후 클립보드에서 복사된 링크 가져오기
+                        copied_link = self._copy_link_via_clipboard(driver, btn)
                         
                         # 클립보드 내용 검증
                         if copied_link and copied_link.startswith(("http://", "https://")):
@@ -1173,32 +1867,47 @@ class NewspickCollector:
                             
                             # 페이지 새로고침 시도
                             if attempt < max_attempts - 1:
-                                driver.get(original_url)
-                                time.sleep(self.wait_time)
-                                copy_buttons = driver.find_elements_by_css_selector("button[data-type='copyurl']")
-                                if item_idx < len(copy_buttons):
-                                    btn = copy_buttons[item_idx]
+                                self._open_page(driver, original_url)
+                                btn = self.find_copy_button(driver, item) or btn
                     except Exception as e:
                         logger.error(f"URL 복사 시도 {attempt+1} 중 오류: {e}")
                 
                 # 복사 실패 시
                 if not copied_link or not copied_link.startswith(("http://", "https://")):
                     logger.warning("클립보드에서 URL 획득 실패")
+                    self._release_title(normalized_title)
                     return {'is_new_item': False}
             
             # 이미지 처리
             image_path = ""
             current_page = None
             
-            # 원본 링크가 유효한 경우 이미지 추출 시도
-            if original_link and original_link != "링크 추출 실패":
+            # HTTP로 미리 찾은 이미지 URL이 있으면 원본 페이지로 이동하지 않음
+            if item.get("image_url"):
+                image_future = item.pop("image_future", None)
+                if image_future is not None:
+                    # 프로세스 풀에 미리 제출한 작업 결과 사용
+                    image_path = self.image_processor.get_result(image_future, timeout=20)
+                    if not image_future.done():
+                        self.image_processor.discard(image_future)
+                else:
+                    image_path = self.timeout_handler(
+                        self.image_processor.process_image,
+                        args=(item["image_url"], item_idx),
+                        timeout_duration=20
+                    )
+                
+                if not image_path:
+                    logger.warning(f"이미지 처리 시간 초과 또는 실패: {item['image_url']}")
+            
+            # 원본 링크가 유효한 경우 브라우저로 이미지 추출 시도
+            elif original_link and original_link != "링크 추출 실패":
                 # 현재 페이지 저장
                 current_page = driver.current_url
                 
                 try:
                     # 원본 페이지로 이동
-                    driver.get(original_link)
-                    time.sleep(self.wait_time)
+                    self._open_page(driver, original_link, allow=("images",), css=None, label="collector.article")
                     
                     # 이미지 URL 추출
                     image_url = self.extract_image_url(driver)
@@ -1218,26 +1927,23 @@ class NewspickCollector:
                     
                     # 원래 페이지로 안전하게 돌아가기
                     try:
-                        driver.get(original_url)
-                        time.sleep(self.wait_time)
+                        self._open_page(driver, original_url)
                     except Exception as e:
                         logger.error(f"원래 페이지로 돌아가기 실패: {e}")
                         time.sleep(3)
-                        driver.get(original_url)
-                        time.sleep(self.wait_time)
+                        self._open_page(driver, original_url)
                     
                 except Exception as e:
                     logger.error(f"이미지 처리 중 오류: {e}")
                     try:
                         if current_page:
-                            driver.get(original_url)
-                            time.sleep(self.wait_time)
+                            self._open_page(driver, original_url)
                     except:
                         pass
             
-            # 수집된 제목을 캐시와 데이터베이스에 추가
-            self.collected_titles.add(normalized_title)
-            self.db_manager.add_processed_title(normalized_title)
+            # 수집된 제목을 캐시와 데이터베이스에 추가 (지연 쓰기 - 묶음 단위 커밋)
+            self._release_title(normalized_title, collected=True)
+            self.db_manager.queue_processed_title(normalized_title)
             
             # 변경전: 메시지 옵션을 제외하고 제목만 저장
             # gpt_msg = f"{article_title}"
@@ -1245,8 +1951,8 @@ class NewspickCollector:
             # 변경후: GPT 문구는 빈 문자열로 저장(나중에 기능 추가를 위해 필드 유지)
             summary_500 = ""
 
-            # 데이터베이스에 뉴스 항목 추가
-            news_id = self.db_manager.add_news_item(
+            # 데이터베이스에 뉴스 항목 추가 (지연 쓰기 - 커밋은 묶음 단위로 처리)
+            news_handle = self.db_manager.queue_news_item(
                 category=category,
                 title=article_title,
                 copy_link=copied_link,
@@ -1254,26 +1960,195 @@ class NewspickCollector:
                 image_path=image_path,
                 summary_500=summary_500  # 필드명 변경
             )
+            self.pending_news_writes.append((news_handle, article_title))
             
-            # 요약 생성 (옵션)
-            if news_id and self.auto_summary:
+            # 요약 생성 (옵션) - 뉴스 ID가 필요하므로 이 경우에만 커밋 대기
+            if self.auto_summary:
+                news_id = news_handle.wait()
+                if not news_id:
+                    logger.error(f"새 항목 DB 저장 실패: {article_title}")
+                    return {'is_new_item': False}
                 self.check_and_create_summary(news_id, article_title, category)
 
-            if news_id:
-                logger.info(f"새 항목 처리 완료: {article_title}")
-                return {'is_new_item': True}
-            else:
-                logger.error(f"새 항목 DB 저장 실패: {article_title}")
-                return {'is_new_item': False}
+            logger.info(f"새 항목 처리 완료: {article_title}")
+            return {'is_new_item': True}
             
         except Exception as e:
             logger.error(f"항목 처리 중 오류: {e}")
+            if normalized_title:
+                self._release_title(normalized_title)
             try:
-                driver.get(original_url)
-                time.sleep(self.wait_time)
+                self._open_page(driver, original_url)
             except:
                 pass
             return None
+
+    def _copy_link_via_clipboard(self, driver, btn):
+        """
+        복사 버튼 클릭 후 클립보드에서 링크 읽기
+        
+        클립보드는 OS 전체에서 하나이므로 병렬 수집 시 작업자끼리 순서대로 사용합니다.
+        
+        Returns:
+            str: 클립보드 내용
+        """
+        with NewspickCollector._clipboard_lock:
+            pyperclip.copy('')
+            ActionChains(driver).move_to_element(btn).click().perform()
+            self.waits.wait_until("clipboard", lambda: pyperclip.paste().strip(), label="collector.clipboard")
+            return pyperclip.paste().strip()
+
+    def get_network_capture(self, driver):
+        """
+        드라이버가 속한 브라우저 세션의 DevTools 네트워크 수신기 반환
+        
+        Returns:
+            CdpNetworkCapture: 수신기 (사용할 수 없으면 None)
+        """
+        if not self.use_cdp_capture:
+            return None
+        return self._session_network_capture(driver)
+
+    def _session_network_capture(self, driver, create=True):
+        """
+        브라우저 세션의 DevTools 연결 반환 (리소스 차단과 헤드리스 수신이 같은 연결 사용)
+        
+        Args:
+            create (bool): 연결이 없을 때 새로 연결할지 여부
+        """
+        with NewspickCollector._session_lock:
+            sessions = [NewspickCollector._shared_session] + list(NewspickCollector._worker_sessions.values())
+        session = next((s for s in sessions if s and s.driver is driver), None)
+        if session is None or session.network_capture is False:
+            return None
+        
+        if session.network_capture is None or not session.network_capture.is_alive():
+            if not create:
+                return None
+            try:
+                target_url = driver.current_url
+            except Exception:
+                target_url = None
+            capture = CdpNetworkCapture(session.port, target_url=target_url)
+            session.network_capture = capture if capture.start() else False
+        
+        return session.network_capture or None
+
+    def _open_page(self, driver, url, allow=(), css=COPY_BUTTON_SELECTOR, label="collector.listing"):
+        """
+        리소스 차단 프로필을 적용한 뒤 페이지를 열고 준비될 때까지 대기
+        (DevTools 연결을 쓸 수 없으면 차단 없이 열기)
+        
+        Args:
+            allow (tuple): 이 페이지에서 차단하지 않을 리소스 분류 (예: 원본 기사의 images)
+            css (str, optional): 나타날 때까지 기다릴 요소 선택자 (기본값: 복사 버튼, None이면 문서 로드까지만)
+            label (str): 대기 시간 기록 이름
+            
+        Returns:
+            bool: 제한 시간 안에 준비되었으면 True
+        """
+        capture = self._session_network_capture(driver, create=self.resource_blocker.is_enabled())
+        if capture:
+            capture.set_blocked_urls(self.resource_blocker.patterns_for(url, allow))
+        driver.get(url)
+        return self.waits.page_ready(driver, css, label=label)
+
+    def measure_page_load(self, driver, url):
+        """
+        측정 모드 - 캐시 없이 차단 없이/차단하고 한 번씩 열어 로드 시간과 전송량 비교
+        
+        두 번째(차단) 로드 후 wait_time만큼 기다리므로 호출 후 페이지는 평소처럼 수집할 수 있는 상태입니다.
+        
+        Returns:
+            dict: {"url", "unblocked", "blocked"} (DevTools를 쓸 수 없으면 None)
+        """
+        capture = self._session_network_capture(driver)
+        if not capture:
+            self.logger.warning("DevTools 연결이 없어 리소스 차단 효과를 측정할 수 없습니다.")
+            self._open_page(driver, url)
+            return None
+        
+        report = {"url": url}
+        capture.set_cache_disabled(True)
+        try:
+            for label, patterns in (("unblocked", []), ("blocked", self.resource_blocker.patterns_for(url))):
+                capture.set_blocked_urls(patterns)
+                capture.reset_traffic()
+                start_time = time.time()
+                driver.get(url)
+                try:
+                    load_ms = driver.execute_script(
+                        "const nav = performance.getEntriesByType('navigation')[0]; return nav ? nav.loadEventEnd : 0;"
+                    )
+                except Exception:
+                    load_ms = 0
+                if not load_ms:
+                    load_ms = (time.time() - start_time) * 1000
+                # 지연 로드되는 광고/이미지까지 집계
+                self.waits.network_idle(driver, label="collector.measure")
+                report[label] = dict(capture.get_traffic(), load_ms=float(load_ms))
+        finally:
+            capture.set_cache_disabled(False)
+        
+        before, after = report["unblocked"], report["blocked"]
+        self.logger.info(
+            f"리소스 차단 측정 ({self.resource_blocker.profile}): {url} - "
+            f"로드 {before['load_ms']:.0f}ms → {after['load_ms']:.0f}ms, "
+            f"전송량 {before['bytes'] / 1024:.0f}KB → {after['bytes'] / 1024:.0f}KB, "
+            f"요청 {before['requests']}개 → {after['requests']}개 (차단 {after['blocked']}개)"
+        )
+        self.blocking_reports.append(report)
+        return report
+
+    def log_blocking_report(self):
+        """
+        측정 모드 결과 요약 로깅
+        
+        Returns:
+            dict: URL 수, 평균 로드 시간(차단 전/후), 절약한 전송량
+        """
+        reports = self.blocking_reports
+        count = len(reports)
+        if not count:
+            return None
+        
+        summary = {
+            "urls": count,
+            "load_ms_unblocked": sum(r["unblocked"]["load_ms"] for r in reports) / count,
+            "load_ms_blocked": sum(r["blocked"]["load_ms"] for r in reports) / count,
+            "bytes_unblocked": sum(r["unblocked"]["bytes"] for r in reports),
+            "bytes_blocked": sum(r["blocked"]["bytes"] for r in reports),
+        }
+        summary["bytes_saved"] = summary["bytes_unblocked"] - summary["bytes_blocked"]
+        saved_ratio = summary["bytes_saved"] / summary["bytes_unblocked"] * 100 if summary["bytes_unblocked"] else 0
+        
+        self.logger.info(
+            f"리소스 차단 측정 요약 ({self.resource_blocker.profile}, URL {count}개): "
+            f"평균 로드 {summary['load_ms_unblocked']:.0f}ms → {summary['load_ms_blocked']:.0f}ms, "
+            f"전송량 {summary['bytes_saved'] / 1024:.0f}KB 절약 ({saved_ratio:.0f}%)"
+        )
+        return summary
+
+    def _click_and_capture_link(self, driver, btn, capture):
+        """
+        복사 버튼 클릭 후 DevTools로 단축 링크 응답 수신 (페이지 스크립트 덮어쓰기 없음)
+        
+        Returns:
+            str: 단축 링크 (시간 내 응답이 없으면 None)
+        """
+        capture.clear_short_links()
+        driver.execute_script("window.alert = function() { return true; }; arguments[0].click();", btn)
+        return capture.wait_for_short_link(timeout=self.SHORT_LINK_WAIT)
+
+    def _save_temp_image(self, img_binary):
+        """이미지 데이터를 임시 파일로 저장하고 경로 반환"""
+        tmp_dir = os.path.join(self.base_path, "data", "images", "temp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        tmp_path = os.path.join(tmp_dir, f"temp_img_{datetime.now().strftime('%Y%m%d%H%M%S%f')}.jpg")
+        
+        with open(tmp_path, 'wb') as f:
+            f.write(img_binary)
+        return tmp_path
             
     def url_encode(self, text):
         """URL 인코딩 헬퍼 함수"""
@@ -1292,14 +2167,12 @@ class NewspickCollector:
             # 빈 페이지 로드
             try:
                 driver.get("about:blank")
-                time.sleep(3)
             except:
                 pass
             
             # 원래 페이지 다시 로드
             try:
-                driver.get(original_url)
-                time.sleep(self.wait_time * 2)
+                self._open_page(driver, original_url)
             except:
                 pass
             
@@ -1321,14 +2194,12 @@ class NewspickCollector:
             # 빈 페이지 로드
             try:
                 driver.get("about:blank")
-                time.sleep(3)
             except:
                 pass
             
             # 원래 페이지 다시 로드
             try:
-                driver.get(original_url)
-                time.sleep(self.wait_time * 2)
+                self._open_page(driver, original_url)
             except:
                 pass
             
@@ -1388,6 +2259,14 @@ class NewspickCollector:
                                 except Exception as e:
                                     logger.error(f"원본 URL 추출 실패: {e}")
                             
+                            # 페이지가 이미 받은 이미지 본문을 DevTools에서 읽기 (WebDriver로 base64 전송 없음)
+                            capture = self.get_network_capture(driver)
+                            img_binary = capture.get_image(img_url) if capture else None
+                            if img_binary:
+                                tmp_path = self._save_temp_image(img_binary)
+                                logger.info(f"DevTools에서 이미지 본문 획득: {tmp_path}")
+                                return tmp_path
+                            
                             # 브라우저에서 직접 이미지 다운로드 시도
                             try:
                                 logger.info("브라우저 세션으로 이미지 다운로드 시도")
@@ -1415,14 +2294,8 @@ class NewspickCollector:
                                     img_data = img_data.split(',')[1]
                                     img_binary = base64.b64decode(img_data)
                                     
-                                    # 임시 파일 경로 생성
-                                    tmp_dir = os.path.join(self.base_path, "data", "images", "temp")
-                                    os.makedirs(tmp_dir, exist_ok=True)
-                                    tmp_path = os.path.join(tmp_dir, f"temp_img_{datetime.now().strftime('%Y%m%d%H%M%S')}.jpg")
-                                    
-                                    # 이미지 저장
-                                    with open(tmp_path, 'wb') as f:
-                                        f.write(img_binary)
+                                    # 이미지 임시 파일로 저장
+                                    tmp_path = self._save_temp_image(img_binary)
                                     
                                     logger.info(f"브라우저에서 직접 이미지 다운로드 성공: {tmp_path}")
                                     return tmp_path
@@ -0,0 +1,163 @@
+# resource_blocker.py
+import os
+import json
+import logging
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceBlocker:
+    """
+    수집에 필요 없는 리소스(광고, 분석 스크립트, 글꼴, 동영상, 이미지) 차단 목록 관리
+
+    차단할 리소스 분류를 프로필로 묶고, 사이트별 허용 목록을 뺀 URL 패턴을 만들어
+    DevTools Network.setBlockedURLs로 적용합니다. 설정은 data/DB/resource_blocking.json에
+    저장되며 파일이 없으면 기본값으로 만듭니다. 프로필과 측정 모드는 수집 UI 설정으로 덮어쓸 수 있습니다.
+    """
+
+    # 분류별 차단 URL 패턴 (Network.setBlockedURLs 와일드카드 형식)
+    RESOURCE_PATTERNS = {
+        "ads": [
+            "*doubleclick.net*",
+            "*googlesyndication.com*",
+            "*googleadservices.com*",
+            "*adservice.google.*",
+            "*amazon-adsystem.com*",
+            "*adnxs.com*",
+            "*criteo.*",
+            "*taboola.com*",
+            "*outbrain.com*",
+            "*dable.io*",
+            "*mobon.net*",
+            "*adfit.kakao.com*",
+        ],
+        "analytics": [
+            "*google-analytics.com*",
+            "*googletagmanager.com*",
+            "*connect.facebook.net*",
+            "*wcs.naver.net*",
+            "*scorecardresearch.com*",
+            "*hotjar.com*",
+            "*clarity.ms*",
+        ],
+        "fonts": [
+            "*fonts.googleapis.com*",
+            "*fonts.gstatic.com*",
+            "*.woff*",
+            "*.ttf*",
+            "*.otf*",
+            "*.eot*",
+        ],
+        "media": [
+            "*.mp4*",
+            "*.webm*",
+            "*.m3u8*",
+            "*.mp3*",
+        ],
+        "images": [
+            "*.jpg*",
+            "*.jpeg*",
+            "*.png*",
+            "*.gif*",
+            "*.webp*",
+            "*.svg*",
+        ],
+    }
+
+    DEFAULT_CONFIG = {
+        # 사용할 프로필 이름
+        "profile": "standard",
+        # 프로필별 차단 분류
+        "profiles": {
+            "off": [],
+            "standard": ["ads", "analytics", "fonts", "media"],
+            "aggressive": ["ads", "analytics", "fonts", "media", "images"],
+        },
+        # 사이트(호스트 끝부분)별 허용 목록 - 분류 이름이면 분류 전체, 그 외에는 해당 문자열이 들어간 패턴 제외
+        "site_allowlist": {},
+        # 측정 모드 - URL마다 차단 없이/차단하고 한 번씩 열어 로드 시간과 전송량 비교
+        "measure": False,
+    }
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.config_file = os.path.join(base_path, "data", "DB", "resource_blocking.json")
+        self.config = self._load_config()
+
+    def _load_config(self):
+        """설정 로드 (없는 키는 기본값으로 채우고, 파일이 없으면 기본 설정 저장)"""
+        config = json.loads(json.dumps(self.DEFAULT_CONFIG))
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config.update(json.load(f))
+            else:
+                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.warning(f"리소스 차단 설정 로드 중 오류 (기본값 사용): {e}")
+        return config
+
+    @property
+    def profile(self):
+        return self.config.get("profile", "off")
+
+    @property
+    def measure(self):
+        return bool(self.config.get("measure"))
+
+    def profile_names(self):
+        """사용 가능한 프로필 이름 목록"""
+        return list(self.config.get("profiles", {}).keys())
+
+    def set_profile(self, profile, measure=None):
+        """
+        이번 실행에 사용할 프로필(과 측정 모드) 변경 (설정 파일은 바꾸지 않음)
+
+        Returns:
+            bool: 알 수 없는 프로필이면 False
+        """
+        if profile not in self.config.get("profiles", {}):
+            logger.warning(f"알 수 없는 리소스 차단 프로필: {profile}")
+            return False
+        self.config["profile"] = profile
+        if measure is not None:
+            self.config["measure"] = bool(measure)
+        return True
+
+    def is_enabled(self):
+        """차단할 분류가 있는지 여부"""
+        return bool(self.config.get("profiles", {}).get(self.profile))
+
+    def patterns_for(self, url, allow=()):
+        """
+        페이지 URL에 적용할 차단 패턴 목록
+
+        Args:
+            url (str): 열려는 페이지 URL (사이트별 허용 목록 확인용)
+            allow (tuple): 이 페이지에서 추가로 허용할 분류 (예: 원본 기사의 images)
+
+        Returns:
+            list: 차단 URL 패턴
+        """
+        categories = self.config.get("profiles", {}).get(self.profile) or []
+        host = (urlparse(url).hostname or "").lower()
+
+        allowed = set(allow)
+        for site, entries in (self.config.get("site_allowlist") or {}).items():
+            site = site.lower().lstrip(".")
+            if host == site or host.endswith("." + site):
+                allowed.update(entries)
+
+        patterns = []
+        for category in categories:
+            if category in allowed:
+                continue
+            for pattern in self.RESOURCE_PATTERNS.get(category, []):
+                if any(entry in pattern for entry in allowed if entry not in self.RESOURCE_PATTERNS):
+                    continue
+                if pattern not in patterns:
+                    patterns.append(pattern)
+        return patterns
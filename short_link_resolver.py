@@ -0,0 +1,329 @@
+# short_link_resolver.py
+import os
+import re
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# 요청 템플릿에서 항목별 값이 들어갈 자리
+NID_MARK = "__NID__"
+PN_MARK = "__PN__"
+
+# 복사 버튼을 한 번 클릭하면서 단축 링크 요청(주소, 방식, 헤더, 본문)과 응답을 기록하는 스크립트
+CAPTURE_SCRIPT = """
+const btn = arguments[0];
+const captured = {request: null, shortUrl: ''};
+const isShortUrl = function(url) {
+    url = String(url || '');
+    return url.includes('short') || url.includes('copy');
+};
+const absolute = function(url) {
+    try { return new URL(url, location.href).href; } catch (e) { return String(url); }
+};
+
+const originalOpen = XMLHttpRequest.prototype.open;
+const originalSetHeader = XMLHttpRequest.prototype.setRequestHeader;
+const originalSend = XMLHttpRequest.prototype.send;
+const originalFetch = window.fetch;
+
+XMLHttpRequest.prototype.open = function(method, url) {
+    if (isShortUrl(url)) {
+        this._capture = {method: String(method || 'GET').toUpperCase(), url: absolute(url), headers: {}, body: null};
+    }
+    return originalOpen.apply(this, arguments);
+};
+XMLHttpRequest.prototype.setRequestHeader = function(name, value) {
+    if (this._capture) {
+        this._capture.headers[name] = value;
+    }
+    return originalSetHeader.apply(this, arguments);
+};
+XMLHttpRequest.prototype.send = function(body) {
+    if (this._capture) {
+        const request = this._capture;
+        request.body = (typeof body === 'string') ? body : null;
+        this.addEventListener('load', function() {
+            try {
+                const data = JSON.parse(this.responseText);
+                if (data && data.result && data.result.shortUrl) {
+                    captured.request = request;
+                    captured.shortUrl = data.result.shortUrl;
+                }
+            } catch (e) {}
+        });
+    }
+    return originalSend.apply(this, arguments);
+};
+window.fetch = function(url, options) {
+    const promise = originalFetch.apply(this, arguments);
+    const target = (typeof url === 'string') ? url : (url && url.url);
+    if (isShortUrl(target)) {
+        options = options || {};
+        const request = {
+            method: String(options.method || 'GET').toUpperCase(),
+            url: absolute(target),
+            headers: (options.headers && !(options.headers instanceof Headers)) ? options.headers : {},
+            body: (typeof options.body === 'string') ? options.body : null
+        };
+        promise.then(function(response) {
+            response.clone().json().then(function(data) {
+                if (data && data.result && data.result.shortUrl) {
+                    captured.request = request;
+                    captured.shortUrl = data.result.shortUrl;
+                }
+            }).catch(function() {});
+        }).catch(function() {});
+    }
+    return promise;
+};
+
+// 클릭으로 열리는 알림창/클립보드 쓰기는 무시
+const originalAlert = window.alert;
+window.alert = function() { return true; };
+const clipboard = navigator.clipboard;
+const originalWriteText = clipboard ? clipboard.writeText : null;
+if (clipboard) {
+    clipboard.writeText = function() { return Promise.resolve(); };
+}
+
+btn.click();
+
+return new Promise(function(resolve) {
+    const started = Date.now();
+    const timer = setInterval(function() {
+        if (captured.request || Date.now() - started > arguments_timeout) {
+            clearInterval(timer);
+            XMLHttpRequest.prototype.open = originalOpen;
+            XMLHttpRequest.prototype.setRequestHeader = originalSetHeader;
+            XMLHttpRequest.prototype.send = originalSend;
+            window.fetch = originalFetch;
+            window.alert = originalAlert;
+            if (clipboard) {
+                clipboard.writeText = originalWriteText;
+            }
+            resolve(captured);
+        }
+    }, 50);
+});
+"""
+
+
+class ShortLinkResolver:
+    """
+    복사 버튼이 호출하는 단축 링크 API를 브라우저 없이 직접 호출
+
+    복사 버튼을 한 번 클릭해 요청 형식을 알아낸 뒤(discover), 항목별 nid/pn만 바꿔
+    로그인된 브라우저의 쿠키로 HTTP 요청을 보냅니다. 알아낸 요청 형식은 파일로 저장해
+    다음 실행에서 다시 클릭하지 않습니다. 요청이 계속 실패하면 형식을 폐기하고 호출 측이
+    기존 클릭 방식으로 돌아가도록 빈 결과를 반환합니다.
+    """
+
+    # 동시 요청 수와 연결 풀 크기
+    MAX_CONCURRENCY = 8
+    REQUEST_TIMEOUT = 5
+    # 요청 캡처 시 응답 대기 시간(밀리초)
+    CAPTURE_TIMEOUT_MS = 3000
+    # 요청 형식에 보관할 헤더 (인증 토큰 등은 파일에 남기지 않고 쿠키는 브라우저에서 매번 복사)
+    ALLOWED_HEADERS = ("content-type", "x-requested-with", "accept")
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.endpoint_file = os.path.join(base_path, "data", "DB", "short_link_endpoint.json")
+        self.lock = threading.Lock()
+        self.template = self._load_template()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.MAX_CONCURRENCY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _load_template(self):
+        """저장된 요청 형식 로드"""
+        try:
+            if os.path.exists(self.endpoint_file):
+                with open(self.endpoint_file, 'r', encoding='utf-8') as f:
+                    template = json.load(f)
+                headers = template.get("headers") or {}
+                template["headers"] = self._safe_headers(headers)
+                if template["headers"] != headers:
+                    # 이전 버전이 저장한 인증 헤더는 파일에서도 제거
+                    self._write_template(template)
+                logger.info(f"단축 링크 요청 형식을 불러왔습니다: {template.get('method')} {template.get('url')}")
+                return template
+        except Exception as e:
+            logger.warning(f"단축 링크 요청 형식 로드 중 오류: {e}")
+        return None
+
+    def _save_template(self):
+        """요청 형식 저장 (None이면 파일 삭제)"""
+        try:
+            if self.template is None:
+                if os.path.exists(self.endpoint_file):
+                    os.remove(self.endpoint_file)
+                return
+
+            self._write_template(self.template)
+        except Exception as e:
+            logger.warning(f"단축 링크 요청 형식 저장 중 오류: {e}")
+
+    def _write_template(self, template):
+        """요청 형식을 파일에 기록"""
+        os.makedirs(os.path.dirname(self.endpoint_file), exist_ok=True)
+        with open(self.endpoint_file, 'w', encoding='utf-8') as f:
+            json.dump(template, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def _safe_headers(cls, headers):
+        """ALLOWED_HEADERS에 있는 헤더만 남기기 (대소문자 구분 없음)"""
+        return {
+            name: value for name, value in (headers or {}).items()
+            if str(name).lower() in cls.ALLOWED_HEADERS
+        }
+
+    def has_endpoint(self):
+        """요청 형식을 알고 있는지 여부"""
+        return self.template is not None
+
+    def invalidate(self, reason):
+        """요청 형식 폐기 - 다음 실행에서 다시 알아냄"""
+        with self.lock:
+            if self.template is None:
+                return
+            logger.warning(f"단축 링크 요청 형식을 폐기합니다: {reason}")
+            self.template = None
+            self._save_template()
+
+    @staticmethod
+    def _mark_values(text, nid, pn):
+        """요청 문자열에서 nid/pn 값을 자리 표시로 치환 (다른 숫자와 섞이지 않도록 토큰 단위로)"""
+        if not text:
+            return text
+        text = re.sub(rf"(?<![0-9A-Za-z]){re.escape(nid)}(?![0-9A-Za-z])", NID_MARK, text)
+        text = re.sub(rf"(?<![0-9A-Za-z]){re.escape(pn)}(?![0-9A-Za-z])", PN_MARK, text)
+        return text
+
+    def discover(self, driver, btn, item):
+        """
+        복사 버튼을 클릭해 단축 링크 요청 형식을 알아내기
+
+        Args:
+            driver: 웹드라이버 (로그인된 상태)
+            btn: 클릭할 복사 버튼 요소
+            item (dict): 버튼 정보 (nid, pn)
+
+        Returns:
+            str: 이번 클릭으로 받은 단축 링크 (실패 시 None)
+        """
+        with self.lock:
+            # 다른 작업자가 먼저 알아낸 경우
+            if self.template is not None:
+                return None
+
+            try:
+                script = CAPTURE_SCRIPT.replace("arguments_timeout", str(self.CAPTURE_TIMEOUT_MS))
+                captured = driver.execute_script(script, btn) or {}
+            except Exception as e:
+                logger.error(f"단축 링크 요청 캡처 중 오류: {e}")
+                return None
+
+            request = captured.get("request")
+            short_url = captured.get("shortUrl") or None
+            if not request:
+                logger.warning("복사 버튼 클릭에서 단축 링크 요청을 찾지 못했습니다.")
+                return short_url
+
+            nid, pn = str(item["nid"]), str(item["pn"])
+            template = {
+                "method": request.get("method", "GET"),
+                "url": self._mark_values(request.get("url", ""), nid, pn),
+                "headers": self._safe_headers(request.get("headers")),
+                "body": self._mark_values(request.get("body"), nid, pn),
+            }
+
+            # 항목마다 바뀌는 값이 요청에 없으면 직접 호출할 수 없음
+            if NID_MARK not in template["url"] and NID_MARK not in (template["body"] or ""):
+                logger.warning(f"단축 링크 요청에서 항목 번호를 찾지 못했습니다: {request.get('url')}")
+                return short_url
+
+            self.template = template
+            self._save_template()
+            logger.info(f"단축 링크 요청 형식을 찾았습니다: {template['method']} {template['url']}")
+            return short_url
+
+    def sync_cookies(self, driver):
+        """로그인된 브라우저의 쿠키와 User-Agent, Referer를 세션에 복사"""
+        try:
+            for cookie in driver.get_cookies():
+                self.session.cookies.set(
+                    cookie["name"], cookie["value"],
+                    domain=cookie.get("domain"), path=cookie.get("path", "/")
+                )
+            user_agent, referer = driver.execute_script("return [navigator.userAgent, location.href];")
+            self.session.headers.update({"User-Agent": user_agent, "Referer": referer})
+            return True
+        except Exception as e:
+            logger.error(f"브라우저 쿠키 복사 중 오류: {e}")
+            return False
+
+    def resolve(self, item):
+        """
+        항목 하나의 단축 링크 요청
+
+        Returns:
+            str: 단축 링크 (실패 시 None)
+        """
+        template = self.template
+        if template is None:
+            return None
+
+        nid, pn = str(item["nid"]), str(item["pn"])
+        url = template["url"].replace(NID_MARK, nid).replace(PN_MARK, pn)
+        body = template["body"]
+        if body:
+            body = body.replace(NID_MARK, nid).replace(PN_MARK, pn).encode("utf-8")
+
+        try:
+            response = self.session.request(
+                template["method"], url, data=body,
+                headers=template["headers"], timeout=self.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            short_url = (response.json().get("result") or {}).get("shortUrl")
+            if short_url and short_url.startswith(("http://", "https://")):
+                return short_url
+            logger.warning(f"단축 링크 응답에 링크가 없습니다 (nid: {nid})")
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"단축 링크 요청 실패 (nid: {nid}): {e}")
+        return None
+
+    def resolve_many(self, items):
+        """
+        여러 항목의 단축 링크를 동시에 요청
+
+        Args:
+            items (list): 버튼 정보 목록 (nid, pn)
+
+        Returns:
+            dict: {nid: 단축 링크} (실패한 항목은 제외)
+        """
+        if not items or self.template is None:
+            return {}
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENCY, len(items))) as executor:
+            results = list(executor.map(self.resolve, items))
+
+        links = {item["nid"]: link for item, link in zip(items, results) if link}
+        logger.info(f"단축 링크 {len(links)}/{len(items)}개 획득 ({(time.time() - start_time) * 1000:.0f}ms)")
+
+        # 모두 실패하면 요청 형식이 바뀐 것으로 보고 폐기
+        if not links:
+            self.invalidate("모든 요청이 실패했습니다")
+        return links
@@ -18,11 +18,18 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementNotInteractableException
 from selenium.webdriver.common.by import By
 
+from wait_engine import WaitEngine
+
 logger = logging.getLogger(__name__)
 
 class ThreadsManager:
     """Threads SNS 자동화 관리 클래스"""
     
+    # 글쓰기 텍스트 영역 선택자 (글쓰기 창 열림/닫힘 대기용)
+    TEXTBOX_SELECTOR = "div[role='textbox']"
+    # 첨부한 이미지의 미리보기 (업로드한 파일은 blob: URL로 표시됨)
+    MEDIA_PREVIEW_SELECTOR = "img[src^='blob:'], video[src^='blob:']"
+    
     def __init__(self, base_path, headless=False, base_debug_port=9333, db_manager=None):
         """
         초기화 함수
@@ -39,6 +46,7 @@ class ThreadsManager:
         self.login_status = False
         self.base_debug_port = base_debug_port
         self.db_manager = db_manager  # db_manager 저장
+        self.waits = WaitEngine()  # 고정 sleep 대신 준비 조건 대기 (대기 시간 기록 포함)
         
         # 로깅 설정 - 명시적으로 로거 가져오기
         self.logger = logging.getLogger(__name__)
@@ -270,26 +278,9 @@ class ThreadsManager:
             
             self.logger.info(f"{module_name} Chromium 시작 (프로세스 ID: {pid}, 포트: {debug_port}")
             
-            # 브라우저 시작 대기 - 더 안정적인 방식으로 수정
+            # 브라우저 시작 대기 - DevTools가 응답하면 (포트만 열린 상태가 아니라 초기화 완료) 바로 진행
             max_wait = 30  # 최대 30초 대기
-            wait_interval = 0.5  # 0.5초마다 확인
-            waited = 0
-            browser_ready = False
-            
-            while waited < max_wait:
-                try:
-                    # 포트 열렸는지 확인
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        if s.connect_ex(('localhost', debug_port)) == 0:
-                            # 잠시 더 대기 (포트가 열렸지만 브라우저가 완전히 초기화되지 않았을 수 있음)
-                            time.sleep(2)
-                            browser_ready = True
-                            break
-                except:
-                    pass
-                
-                time.sleep(wait_interval)
-                waited += wait_interval
+            browser_ready = self.waits.port_open(debug_port, timeout=max_wait, label="threads.browser_start", process=proc)
             
             if not browser_ready:
                 self.logger.warning(f"브라우저 시작 대기 시간 초과 (최대 {max_wait}초)")
@@ -397,7 +388,7 @@ class ThreadsManager:
                 if self.driver:
                     try:
                         self.driver.get("https://www.threads.net/")
-                        time.sleep(5)
+                        self._wait_for_page("threads.home")
 
                         # 다이얼로그 닫기 시도
                         self.dismiss_dialogs()
@@ -444,7 +435,7 @@ class ThreadsManager:
             for attempt in range(max_tries):
                 try:
                     self.driver.get("https://www.threads.net/login")
-                    time.sleep(5)
+                    self._wait_for_page("threads.login")
                     login_page_loaded = True
                     break
                 except Exception as e:
@@ -513,7 +504,7 @@ class ThreadsManager:
                         # 메인 페이지로 명시적으로 이동
                         try:
                             self.driver.get("https://www.threads.net/")
-                            time.sleep(5)
+                            self._wait_for_page("threads.home")
                             logger.info("메인 페이지로 이동 완료")
                         except Exception as e:
                             logger.warning(f"메인 페이지 이동 실패: {e}")
@@ -561,7 +552,7 @@ class ThreadsManager:
                                     
                                 if self.driver:
                                     self.driver.get("https://www.threads.net/login")
-                                    time.sleep(5)
+                                    self._wait_for_page("threads.login")
                                     # 새 로그인 URL 저장
                                     login_url = self.driver.current_url
                                 else:
@@ -888,7 +879,7 @@ class ThreadsManager:
                 
                 try:
                     self.driver.get("https://www.threads.net/")
-                    time.sleep(5)  # 충분한 로딩 시간 부여
+                    self._wait_for_page("threads.home")
                     logger.info("메인 홈페이지로 이동 완료")
 
                     # 이모티콘 폰트 주입 (새로 추가)
@@ -943,7 +934,8 @@ class ThreadsManager:
                                 return false;
                             """)
                             
-                            time.sleep(3)  # 클릭 후 충분한 대기 시간
+                            # 클릭 후 글쓰기 창이 열릴 때까지 대기
+                            self.waits.selector(self.driver, self.TEXTBOX_SELECTOR, label="threads.compose_open")
                             
                             # 텍스트 영역 확인
                             text_areas = self.driver.find_elements_by_xpath("//div[@role='textbox']")
@@ -979,7 +971,8 @@ class ThreadsManager:
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
                                 time.sleep(1)
                                 button.click()
-                                time.sleep(3)
+                                # 글쓰기 창 버튼이 아니면 기존과 같이 3초 후 다음 버튼 시도
+                                self.waits.selector(self.driver, self.TEXTBOX_SELECTOR, timeout=3, label="threads.compose_open")
                                 
                                 # 클릭 후 텍스트 영역이 나타났는지 확인
                                 text_areas = self.driver.find_elements_by_xpath("//div[@role='textbox']")
@@ -1255,9 +1248,15 @@ class ThreadsManager:
                                 file_input = file_inputs[0]
                                 
                                 # 파일 직접 업로드
+                                preview_count = self.driver.execute_script(self.waits.COUNT_SCRIPT, self.MEDIA_PREVIEW_SELECTOR) or 0
                                 file_input.send_keys(image_path)
                                 logger.info("파일 입력 요소에 직접 경로 전달")
-                                time.sleep(5)  # 업로드 대기
+                                # 첨부 미리보기가 나타날 때까지 대기 (완료된 요청 수로는 진행 중인 업로드를 알 수 없음)
+                                if self.waits.selector(self.driver, self.MEDIA_PREVIEW_SELECTOR, min_count=preview_count + 1,
+                                                       timeout=30, label="threads.image_upload"):
+                                    self.waits.network_idle(self.driver, quiet=1.0, label="threads.image_upload:network")
+                                else:
+                                    logger.warning("이미지 미리보기가 나타나지 않음 (업로드가 끝나지 않았을 수 있음)")
                                 
                                 # 이미지 업로드 확인을 위한 스크린샷 저장
                                 screenshot_path = os.path.join(self.base_path, "data", "logs", f"threads_post_image_{datetime.now().strftime('%Y%m%d%H%M%S')}.png")
@@ -1349,7 +1348,7 @@ class ThreadsManager:
                                                     # 버튼 클릭
                                                     self.driver.execute_script("arguments[0].click();", parent)
                                                     logger.info("스레드에 추가 버튼 클릭 성공")
-                                                    time.sleep(2)
+                                                    self.waits.selector(self.driver, self.TEXTBOX_SELECTOR, min_count=2, timeout=5, label="threads.reply_box")
                                                     
                                                     # 텍스트 입력 필드 찾기
                                                     reply_text_areas = self.driver.find_elements_by_xpath("//div[@role='textbox']")
@@ -1399,7 +1398,7 @@ class ThreadsManager:
                                 result = self.driver.execute_script(script)
                                 if result:
                                     logger.info("JavaScript로 스레드에 추가 버튼 클릭 성공")
-                                    time.sleep(2)
+                                    self.waits.selector(self.driver, self.TEXTBOX_SELECTOR, min_count=2, timeout=5, label="threads.reply_box")
                                     
                                     # 텍스트 입력 필드 찾기
                                     reply_text_areas = self.driver.find_elements_by_xpath("//div[@role='textbox']")
@@ -1468,7 +1467,8 @@ class ThreadsManager:
                         enter_action = ActionChains(self.driver)
                         enter_action.key_down(Keys.CONTROL).send_keys(Keys.RETURN).key_up(Keys.CONTROL).perform()
                         logger.info("Ctrl+Enter로 게시 시도")
-                        time.sleep(5)  # 충분한 대기 시간
+                        # 게시되면 글쓰기 창이 닫힘
+                        self.waits.selector_gone(self.driver, self.TEXTBOX_SELECTOR, label="threads.post_submit")
                         
                         # 성공 여부 확인: URL 변경 또는 텍스트 영역 사라짐
                         current_url = self.driver.current_url
@@ -1505,7 +1505,7 @@ class ThreadsManager:
                                                 # JavaScript로 클릭
                                                 self.driver.execute_script("arguments[0].click();", parent)
                                                 logger.info("게시 버튼 클릭 성공")
-                                                time.sleep(5)
+                                                self.waits.selector_gone(self.driver, self.TEXTBOX_SELECTOR, label="threads.post_submit")
                                                 post_success = True
                                                 break
                                             except:
@@ -1531,7 +1531,7 @@ class ThreadsManager:
                                     try:
                                         self.driver.execute_script("arguments[0].click();", btn)
                                         logger.info("역할 기반 게시 버튼 클릭 성공")
-                                        time.sleep(5)
+                                        self.waits.selector_gone(self.driver, self.TEXTBOX_SELECTOR, label="threads.post_submit")
                                         post_success = True
                                         break
                                     except:
@@ -1546,8 +1546,12 @@ class ThreadsManager:
                     except:
                         pass
                     
-                    # 메인 페이지로 돌아가면 성공으로 간주
-                    time.sleep(3)
+                    # 메인 페이지로 돌아가면 성공으로 간주 (작성 화면을 벗어날 때까지 대기)
+                    self.waits.wait_until(
+                        "url_changed",
+                        lambda: "/create" not in self.driver.current_url,
+                        label="threads.post_settle"
+                    )
                     try:
                         current_url = self.driver.current_url
                         
@@ -1622,7 +1626,7 @@ class ThreadsManager:
         try:
             # 메인 페이지로 먼저 이동 (네비게이션 메뉴를 보장하기 위해)
             self.driver.get("https://www.threads.net/")
-            time.sleep(5)
+            self._wait_for_page("threads.home")
             logger.info("메인 페이지로 이동 완료")
 
             # 다이얼로그 닫기 시도
@@ -1648,8 +1652,7 @@ class ThreadsManager:
                     href = nav_items[3].get_attribute("href")
                     if href and "/@" in href and "/create" not in href:
                         logger.info(f"인덱스 3이 프로필 링크로 확인됨: {href}")
-                        nav_items[3].click()
-                        time.sleep(3)
+                        self._click_and_wait(nav_items[3], "threads.profile")
                         logger.info("프로필 페이지로 이동 성공 (인덱스 3)")
                         return True
             except Exception as e:
@@ -1679,8 +1682,7 @@ class ThreadsManager:
                                 logger.info(f"프로필 아이콘 {i}의 부모 a 태그 href: {href}")
                                 
                                 if href and "/@" in href and "/create" not in href:
-                                    parent.click()
-                                    time.sleep(3)
+                                    self._click_and_wait(parent, "threads.profile")
                                     logger.info("프로필 페이지로 이동 성공 (aria-label)")
                                     return True
                                 break
@@ -1718,8 +1720,7 @@ class ThreadsManager:
                                 logger.info(f"네비게이션 {i}의 링크 {j}: {href}")
                                 
                                 if href and "/@" in href and "/create" not in href:
-                                    link.click()
-                                    time.sleep(3)
+                                    self._click_and_wait(link, "threads.profile")
                                     logger.info("프로필 페이지로 이동 성공 (네비게이션 요소)")
                                     return True
                     except Exception as e:
@@ -1741,8 +1742,7 @@ class ThreadsManager:
                     
                     # 첫 번째 적합한 링크 클릭
                     if "/explore" not in href and "/search" not in href:
-                        link.click()
-                        time.sleep(3)
+                        self._click_and_wait(link, "threads.profile")
                         logger.info("프로필 페이지로 이동 성공 (프로필 패턴)")
                         return True
             except Exception as e:
@@ -1773,8 +1773,7 @@ class ThreadsManager:
                     # 최소한의 차별화를 위해 첫 번째 링크 시도
                     if i == 0:
                         try:
-                            link.click()
-                            time.sleep(3)
+                            self._click_and_wait(link, "threads.profile")
                             logger.info("프로필 페이지로 이동 성공 (전체 검색)")
                             return True
                         except Exception as click_e:
@@ -1830,6 +1829,7 @@ class ThreadsManager:
             total_items = len(items_to_process)
             
             logger.info(f"총 {total_items}개 항목 게시 예정")
+            self.waits.reset()
             if progress_callback:
                 progress_callback(0.3, f"총 {total_items}개 항목 게시 예정")
             
@@ -1858,6 +1858,9 @@ class ThreadsManager:
                         logger.warning(f"이미지 파일이 존재하지 않습니다: {image_path}")
                         image_path = None
                     
+                    # 게시 시작 기록 (시도 횟수 증가)
+                    db_manager.mark_posting_started(item_id, 'threads', 'Threads')
+                    
                     # 게시물 작성
                     post_success = self.post_thread(
                         text=post_text,
@@ -1889,6 +1892,7 @@ class ThreadsManager:
                             if hasattr(self, 'data_refreshed_callback') and self.data_refreshed_callback:
                                 self.data_refreshed_callback()
                     else:
+                        db_manager.mark_posting_failed(item_id, 'threads', 'Threads')
                         stats["fail"] += 1
                         logger.error(f"항목 {idx+1} 게시 실패: {title}")
                     
@@ -1898,9 +1902,12 @@ class ThreadsManager:
                 except Exception as e:
                     stats["fail"] += 1
                     logger.error(f"항목 {idx+1} 처리 중 오류: {e}")
+                    # 게시 중 상태로 남지 않도록 실패 기록
+                    db_manager.mark_posting_failed(item_id, 'threads', 'Threads', f"포스팅 오류: {e}")
             
             # 최종 결과
             stats["status"] = "완료"
+            self.waits.log_report("Threads 게시 대기 시간 통계")
             logger.info(f"자동 게시 완료: 성공 {stats['success']}, 실패 {stats['fail']}, 건너뜀 {stats['skipped']}")
             
             if progress_callback:
@@ -2193,6 +2200,18 @@ class ThreadsManager:
         cursor.execute(query, params)
         conn.commit()
 
+    def _wait_for_page(self, label):
+        """페이지 이동 후 대기 - 문서 로드 완료 후 네트워크가 잠잠해질 때까지 (SPA 초기 렌더링 포함)"""
+        self.waits.document_ready(self.driver, label=f"{label}:document")
+        return self.waits.network_idle(self.driver, label=f"{label}:network")
+
+    def _click_and_wait(self, element, label):
+        """요소 클릭 후 URL이 바뀌고 새 페이지가 준비될 때까지 대기"""
+        previous_url = self.driver.current_url
+        element.click()
+        self.waits.url_changed(self.driver, previous_url, label=f"{label}:url")
+        return self._wait_for_page(label)
+
     # threads_manager.py 파일에 추가할 함수
     def dismiss_dialogs(self, attempts=3):
         """모든 다이얼로그를 닫기 위해 ESC 키를 여러 번 시도"""
@@ -2251,7 +2270,7 @@ class ThreadsManager:
                             btn.click();
                         });
                     """)
-                    time.sleep(1)
+                    self.waits.selector_gone(self.driver, "div[role='dialog']", timeout=1, label="threads.dialog_close")
                     
                     # 다이얼로그가 사라졌는지 확인
                     remaining_dialogs = self.driver.find_elements_by_xpath("//div[@role='dialog']")
@@ -5,6 +5,7 @@ import threading
 import logging
 from datetime import datetime, timedelta
 import time
+from itertools import chain
 
 from threads_manager import ThreadsManager
 from ui_components import validate_numeric_input
@@ -33,6 +34,9 @@ class ThreadsUI:
         self.main_frame = parent.threads_tab  # Threads 탭으로 변경
         self.collect_log_text = parent.collect_log_text  # 공유된 로그 텍스트 위젯
         
+        # 트리뷰 항목 ID -> 뉴스 ID (행 번호로 전체 목록을 다시 조회하지 않도록 보관)
+        self.tree_news_ids = {}
+        
         # Threads 매니저
         self.threads_manager = None
         
@@ -728,15 +732,12 @@ class ThreadsUI:
             except Exception as e:
                 self.logger.warning(f"트리뷰 초기화 중 오류: {e}")
                 
-            # DB에서 뉴스 항목 가져오기
-            news_items = self.db_manager.get_news_items()
+            self.tree_news_ids = {}
             
-            if not news_items:
-                self.logger.info("표시할 데이터가 없습니다.")
-                return
-                
-            # 각 행을 트리뷰에 추가
-            for idx, item in enumerate(news_items):
+            # DB에서 뉴스 항목을 페이지 단위로 가져와 트리뷰에 추가
+            loaded_count = 0
+            for idx, item in enumerate(chain.from_iterable(self.db_manager.iter_news_pages())):
+                loaded_count += 1
                 # 이미지 경로 존재 여부 확인
                 image_path = item.get("이미지 경로", "")
                 image_status = "O" if image_path and os.path.exists(image_path) else "X"
@@ -744,32 +745,26 @@ class ThreadsUI:
                 # 포스팅 상태 및 시간 확인 - threads 플랫폼 상태 확인
                 posting_status = "미게시"
                 posting_time = ""
-                item_id = item.get("id")
                 
-                # DB에서 포스팅 상태 확인
+                # 목록 조회 시 함께 가져온 플랫폼별 상태 사용 (행마다 추가 쿼리 없음)
                 try:
-                    conn = self.db_manager.get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        """
-                        SELECT status, post_date FROM posting_status 
-                        WHERE news_id = ? AND platform_id = 'threads'
-                        """,
-                        (item_id,)
-                    )
-                    result = cursor.fetchone()
-                    if result:
-                        if '포스팅 완료' in result[0]:
+                    threads_status = item.get("플랫폼_상태", {}).get("threads")
+                    if threads_status:
+                        if threads_status["state"] == self.db_manager.POST_STATE_POSTED:
                             posting_status = "완료"
+                        elif threads_status["state"] == self.db_manager.POST_STATE_IN_PROGRESS:
+                            posting_status = "게시 중"
+                        elif threads_status["state"] == self.db_manager.POST_STATE_FAILED:
+                            posting_status = "실패"
                         # 포스팅 시간 처리 - 전체 날짜 시간 표시로 변경
-                        if result[1]:  # post_date가 있는 경우
-                            posting_time = result[1]  # 원본 날짜시간 그대로 사용
+                        if threads_status["post_date"]:  # post_date가 있는 경우
+                            posting_time = threads_status["post_date"]  # 원본 날짜시간 그대로 사용
                 except Exception as e:
                     self.logger.error(f"포스팅 상태 확인 중 오류: {e}")
                 
                 # 트리뷰에 데이터 추가
                 try:
-                    self.threads_data_tree.insert("", tk.END, text=str(idx+1), 
+                    tree_item = self.threads_data_tree.insert("", tk.END, text=str(idx+1), 
                                     values=("", # 선택 열 추가 
                                             item.get("카테고리", ""), 
                                             item.get("게시물 제목", ""), 
@@ -785,17 +780,19 @@ class ThreadsUI:
                                             item.get("thread4", ""),
                                             item.get("thread5", ""),
                                             item.get("created_status", "")))
+                    self.tree_news_ids[tree_item] = item.get("id")
                 except Exception as insert_e:
                     self.logger.warning(f"항목 추가 중 오류 (행 {idx+1}): {insert_e}")
+            
+            if not loaded_count:
+                self.logger.info("표시할 데이터가 없습니다.")
+                return
                     
-            self.logger.info(f"Threads 탭에 {len(news_items)}개 항목을 로드했습니다.")
+            self.logger.info(f"Threads 탭에 {loaded_count}개 항목을 로드했습니다.")
             
         except Exception as e:
             self.logger.error(f"Threads 탭 데이터 로드 오류: {e}")
 
-        # 마지막 행 이후에 추가
-        self.logger.info(f"Threads 탭에 {len(news_items)}개 항목을 로드했습니다.")
-
         # 저장된 열 너비 복원
         self.restore_thread_column_widths()
 
@@ -810,16 +807,15 @@ class ThreadsUI:
             for item in self.threads_data_tree.get_children():
                 values = self.threads_data_tree.item(item, "values")
                 if values and values[0] == '✓':  # 체크박스 선택된 항목
-                    index = int(self.threads_data_tree.item(item, "text")) - 1
-                    checked_items.append((index, item))
+                    checked_items.append((self.tree_news_ids.get(item), item))
             
             # 체크박스 선택된 항목 찾기 (데이터 수집 탭)
             data_tree = self.parent.data_collector.data_tree
+            data_tree_news_ids = self.parent.data_collector.tree_news_ids
             for item in data_tree.get_children():
                 values = data_tree.item(item, "values")
                 if values and values[0] == '✓':  # 체크박스 선택된 항목
-                    index = int(data_tree.item(item, "text")) - 1
-                    checked_items.append((index, item))
+                    checked_items.append((data_tree_news_ids.get(item), item))
                         
             # 체크박스 선택 항목이 없으면 트리뷰 선택 항목 확인
             if not checked_items:
@@ -830,12 +826,10 @@ class ThreadsUI:
                 # 어느 탭에서 선택했는지 확인
                 if selected_items_threads:
                     for item in selected_items_threads:
-                        index = int(self.threads_data_tree.item(item, "text")) - 1
-                        checked_items.append((index, item))
+                        checked_items.append((self.tree_news_ids.get(item), item))
                 elif selected_items_data:
                     for item in selected_items_data:
-                        index = int(data_tree.item(item, "text")) - 1
-                        checked_items.append((index, item))
+                        checked_items.append((data_tree_news_ids.get(item), item))
             
             # 선택된 항목 없음
             if not checked_items:
@@ -853,15 +847,12 @@ class ThreadsUI:
             # 로그 출력 (디버그)
             self.logger.info(f"선택된 항목 수: {len(checked_items)}")
             
-            # 전체 뉴스 아이템 가져오기
-            news_items = self.db_manager.get_news_items()
-            
-            # 선택된 항목들의 데이터 가져오기
-            items_to_post = []
-            for index, _ in checked_items:
-                if 0 <= index < len(news_items):
-                    items_to_post.append(news_items[index])
-                    self.logger.info(f"게시 대상 항목 ID: {news_items[index].get('id')}")
+            # 선택된 항목들의 데이터만 ID로 가져오기
+            items_to_post = self.db_manager.get_news_items_by_ids(
+                [news_id for news_id, _ in checked_items if news_id is not None]
+            )
+            for news_item in items_to_post:
+                self.logger.info(f"게시 대상 항목 ID: {news_item.get('id')}")
             
             if not items_to_post:
                 messagebox.showinfo("알림", "게시할 유효한 항목이 없습니다.")
@@ -1049,6 +1040,9 @@ class ThreadsUI:
                                 self.logger.warning(f"이미지 파일이 존재하지 않습니다: {image_path}")
                                 image_path = None
                             
+                            # 게시 시작 기록 (시도 횟수 증가)
+                            self.db_manager.mark_posting_started(item_id, 'threads', 'Threads')
+                            
                             # 여러 항목이 있을 때 브라우저 종료 방지
                             post_success = self.threads_manager.post_thread(
                                 text=post_text,
@@ -1080,6 +1074,7 @@ class ThreadsUI:
                                     self.parent.data_collector.load_data()
                                     self.load_thread_data()
                             else:
+                                self.db_manager.mark_posting_failed(item_id, 'threads', 'Threads')
                                 fail_count += 1
                                 self.logger.error(f"항목 {idx+1}/{total_items} 게시 실패: {title}")
                             
@@ -1091,6 +1086,8 @@ class ThreadsUI:
                         except Exception as e:
                             fail_count += 1
                             self.logger.error(f"항목 {idx+1}/{total_items} 처리 중 오류: {e}")
+                            # 게시 중 상태로 남지 않도록 실패 기록
+                            self.db_manager.mark_posting_failed(item_id, 'threads', 'Threads', f"포스팅 오류: {e}")
                     
                     # 모든 항목 처리 후 결과 표시
                     if progress_window and progress_window.winfo_exists():
@@ -1583,6 +1580,9 @@ class ThreadsUI:
                         db_manager=self.db_manager
                     )
                     
+                    # 게시 시작 기록 (시도 횟수 증가)
+                    self.db_manager.mark_posting_started(item_id, 'threads', 'Threads')
+                    
                     # 게시물 작성
                     post_success = self.threads_manager.post_thread(
                         text=post_text,
@@ -1608,6 +1608,7 @@ class ThreadsUI:
                         self.parent.data_collector.load_data()
                         self.load_thread_data()
                     else:
+                        self.db_manager.mark_posting_failed(item_id, 'threads', 'Threads')
                         fail_count += 1
                         self.logger.error(f"항목 {idx+1}/{len(items_to_process)} 게시 실패: {title}")
                     
@@ -1618,6 +1619,8 @@ class ThreadsUI:
                 except Exception as e:
                     fail_count += 1
                     self.logger.error(f"항목 {idx+1} 처리 중 오류: {e}")
+                    # 게시 중 상태로 남지 않도록 실패 기록
+                    self.db_manager.mark_posting_failed(item_id, 'threads', 'Threads', f"포스팅 오류: {e}")
                     
                     # 오류 발생 시 브라우저 정리
                     try:
@@ -0,0 +1,236 @@
+# wait_engine.py
+import json
+import time
+import socket
+import logging
+import threading
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+
+class WaitEngine:
+    """
+    고정 sleep 대신 이름 있는 준비 조건이 충족될 때까지 대기
+
+    조건이 충족되면 바로 반환하고, 조건별 제한 시간 안에 충족되지 않으면 False를 반환합니다
+    (호출 측은 기존 sleep과 같이 계속 진행). 대기마다 실제 걸린 시간을 기록 이름별로 모아
+    report()/log_report()로 어디서 시간이 쓰이는지 확인할 수 있습니다.
+    수집기와 Threads 매니저가 함께 사용합니다.
+    """
+
+    # 조건별 기본 제한 시간(초)
+    TIMEOUTS = {
+        "port_open": 15,
+        "document_ready": 15,
+        "selector": 10,
+        "selector_gone": 10,
+        "count_stable": 8,
+        "network_idle": 10,
+        "url_changed": 10,
+    }
+    # 조건 확인 간격(초)
+    POLL_INTERVAL = 0.1
+    # count_stable/network_idle에서 변화가 없어야 하는 시간(초)
+    QUIET_PERIOD = 0.5
+
+    COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+    # 지난 확인 이후 완료된 리소스 수와 문서 로드 상태 (네트워크 유휴 판단용)
+    # 읽을 때마다 리소스 타이밍 버퍼를 비워 버퍼 한도(기본 250개)가 차도 새 항목이 계속 기록되도록 함
+    RESOURCE_SCRIPT = """
+        const count = performance.getEntriesByType('resource').length;
+        performance.clearResourceTimings();
+        return [count, document.readyState];
+    """
+
+    def __init__(self, timeouts=None):
+        """
+        Args:
+            timeouts (dict, optional): 조건별 제한 시간 덮어쓰기 {조건 이름: 초}
+        """
+        self.timeouts = dict(self.TIMEOUTS, **(timeouts or {}))
+        self.stats = {}  # 기록 이름 -> {"count", "total", "max", "timeouts"}
+        self.lock = threading.Lock()
+
+    def wait_until(self, condition, check, timeout=None, label=None, abort=None):
+        """
+        check()가 참을 반환할 때까지 대기
+
+        Args:
+            condition (str): 조건 이름 (기본 제한 시간 조회용)
+            check (callable): 인자 없는 확인 함수 (예외는 미충족으로 처리)
+            timeout (float, optional): 제한 시간 (기본값: 조건별 제한 시간)
+            label (str, optional): 기록 이름 (기본값: 조건 이름)
+            abort (callable, optional): 참을 반환하면 더 기다리지 않고 False 반환 (예: 프로세스 종료)
+
+        Returns:
+            bool: 제한 시간 안에 충족되었으면 True
+        """
+        timeout = self.timeouts.get(condition, 10) if timeout is None else timeout
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        ready = False
+
+        while True:
+            try:
+                ready = bool(check())
+            except Exception as e:
+                logger.debug(f"대기 조건 확인 중 오류 ({condition}): {e}")
+                ready = False
+            if ready or time.monotonic() >= deadline or (abort and abort()):
+                break
+            time.sleep(min(self.POLL_INTERVAL, max(0, deadline - time.monotonic())))
+
+        elapsed = time.monotonic() - start_time
+        self._record(label or condition, elapsed, ready)
+        if not ready:
+            logger.debug(f"대기 시간 초과: {label or condition} ({timeout:.1f}초)")
+        return ready
+
+    def _record(self, label, elapsed, ready):
+        """대기 시간 기록"""
+        with self.lock:
+            entry = self.stats.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            entry["count"] += 1
+            entry["total"] += elapsed
+            entry["max"] = max(entry["max"], elapsed)
+            if not ready:
+                entry["timeouts"] += 1
+
+    # ---- 준비 조건 ----
+
+    def port_open(self, port, host="127.0.0.1", timeout=None, label=None, process=None):
+        """
+        DevTools 포트가 열리고 /json/version이 응답할 때까지 대기
+
+        Args:
+            process (subprocess.Popen, optional): 브라우저 프로세스 (먼저 종료되면 바로 False 반환)
+        """
+        def check():
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.settimeout(0.5)
+                if s.connect_ex((host, port)) != 0:
+                    return False
+            with urllib.request.urlopen(f"http://{host}:{port}/json/version", timeout=1) as response:
+                return bool(json.loads(response.read().decode("utf-8")))
+        abort = (lambda: process.poll() is not None) if process is not None else None
+        return self.wait_until("port_open", check, timeout, label, abort)
+
+    def document_ready(self, driver, timeout=None, label=None):
+        """document.readyState가 complete가 될 때까지 대기"""
+        return self.wait_until(
+            "document_ready",
+            lambda: driver.execute_script("return document.readyState;") == "complete",
+            timeout, label
+        )
+
+    def selector(self, driver, css, min_count=1, timeout=None, label=None):
+        """CSS 선택자와 일치하는 요소가 min_count개 이상 나타날 때까지 대기"""
+        return self.wait_until(
+            "selector",
+            lambda: (driver.execute_script(self.COUNT_SCRIPT, css) or 0) >= min_count,
+            timeout, label
+        )
+
+    def selector_gone(self, driver, css, timeout=None, label=None):
+        """CSS 선택자와 일치하는 요소가 모두 사라질 때까지 대기"""
+        return self.wait_until(
+            "selector_gone",
+            lambda: (driver.execute_script(self.COUNT_SCRIPT, css) or 0) == 0,
+            timeout, label
+        )
+
+    def count_stable(self, driver, css, quiet=None, timeout=None, label=None):
+        """일치하는 요소 수가 1개 이상이고 quiet초 동안 바뀌지 않을 때까지 대기 (무한 스크롤 로딩 완료 등)"""
+        return self.wait_until(
+            "count_stable",
+            self._stable_check(lambda: driver.execute_script(self.COUNT_SCRIPT, css) or 0, quiet),
+            timeout, label
+        )
+
+    def network_idle(self, driver, quiet=None, timeout=None, label=None):
+        """
+        문서 로드가 끝나고 quiet초 동안 새로 완료된 리소스가 없을 때까지 대기
+
+        완료된 리소스만 집계하므로 아직 진행 중인 요청(업로드 등)은 알 수 없습니다.
+        특정 요청의 완료를 기다려야 하면 그 결과로 나타나는 요소를 selector로 기다립니다.
+        """
+        total = {"count": 0}
+
+        def read_state():
+            count, ready_state = driver.execute_script(self.RESOURCE_SCRIPT)
+            total["count"] += count or 0
+            return total["count"] if ready_state == "complete" else None
+        return self.wait_until("network_idle", self._stable_check(read_state, quiet, allow_empty=True), timeout, label)
+
+    def url_changed(self, driver, previous_url, timeout=None, label=None):
+        """현재 URL이 previous_url과 달라질 때까지 대기"""
+        return self.wait_until(
+            "url_changed",
+            lambda: driver.current_url != previous_url,
+            timeout, label
+        )
+
+    def page_ready(self, driver, css=None, timeout=None, label=None):
+        """
+        페이지 이동 후 대기 - 문서 로드 완료, css가 있으면 해당 요소가 나타날 때까지
+
+        Returns:
+            bool: 모든 조건이 제한 시간 안에 충족되었으면 True
+        """
+        ready = self.document_ready(driver, timeout=timeout, label=f"{label}:document" if label else None)
+        if css:
+            ready = self.selector(driver, css, timeout=timeout, label=f"{label}:selector" if label else None) and ready
+        return ready
+
+    def _stable_check(self, read_value, quiet=None, allow_empty=False):
+        """값이 None이 아니고 (allow_empty가 아니면 0보다 크며) quiet초 동안 그대로일 때 참을 반환하는 확인 함수"""
+        quiet = self.QUIET_PERIOD if quiet is None else quiet
+        state = {"value": None, "since": time.monotonic()}
+
+        def check():
+            value = read_value()
+            now = time.monotonic()
+            if value != state["value"]:
+                state["value"] = value
+                state["since"] = now
+                return False
+            if value is None or (not value and not allow_empty):
+                return False
+            return now - state["since"] >= quiet
+        return check
+
+    # ---- 기록 ----
+
+    def report(self):
+        """
+        기록 이름별 대기 시간 통계 (총 대기 시간이 긴 순)
+
+        Returns:
+            list: [{"label", "count", "total", "avg", "max", "timeouts"}]
+        """
+        with self.lock:
+            entries = [dict(entry, label=label) for label, entry in self.stats.items()]
+        for entry in entries:
+            entry["avg"] = entry["total"] / entry["count"] if entry["count"] else 0.0
+        return sorted(entries, key=lambda entry: entry["total"], reverse=True)
+
+    def log_report(self, title="대기 시간 통계"):
+        """대기 시간 통계 로깅"""
+        entries = self.report()
+        if not entries:
+            return entries
+
+        total = sum(entry["total"] for entry in entries)
+        logger.info(f"{title}: 총 {total:.1f}초")
+        for entry in entries:
+            logger.info(
+                f"  {entry['label']}: {entry['count']}회, 합계 {entry['total']:.1f}초, "
+                f"평균 {entry['avg']:.2f}초, 최대 {entry['max']:.2f}초, 시간 초과 {entry['timeouts']}회"
+            )
+        return entries
+
+    def reset(self):
+        """기록 초기화"""
+        with self.lock:
+            self.stats.clear()